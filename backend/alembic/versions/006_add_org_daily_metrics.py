@@ -0,0 +1,41 @@
+"""Add org_daily_metrics rollup table
+
+Revision ID: 006_add_org_daily_metrics
+Revises: 005_add_task_relationship_columns
+Create Date: 2026-01-12
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_add_org_daily_metrics'
+down_revision = '005_add_task_relationship_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the daily metrics rollup table.
+
+    Run ``python rebuild_rollups.py`` afterwards to backfill it from history.
+    """
+    op.create_table(
+        'org_daily_metrics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('org_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('metric', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['org_id'], ['organizations.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('org_id', 'day', 'metric', name='uq_org_daily_metrics_org_day_metric'),
+    )
+    op.create_index(op.f('ix_org_daily_metrics_id'), 'org_daily_metrics', ['id'], unique=False)
+
+
+def downgrade():
+    """Drop the daily metrics rollup table."""
+    op.drop_index(op.f('ix_org_daily_metrics_id'), table_name='org_daily_metrics')
+    op.drop_table('org_daily_metrics')
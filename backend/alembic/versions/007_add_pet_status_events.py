@@ -0,0 +1,62 @@
+"""Add pet_status_events transition log
+
+Revision ID: 007_add_pet_status_events
+Revises: 006_add_org_daily_metrics
+Create Date: 2026-01-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '007_add_pet_status_events'
+down_revision = '006_add_org_daily_metrics'
+branch_labels = None
+depends_on = None
+
+# Reuse the petstatus type created in 001 instead of creating it again
+pet_status = postgresql.ENUM(
+    'intake', 'needs_foster', 'in_foster', 'available', 'pending', 'adopted', 'medical_hold',
+    name='petstatus',
+    create_type=False,
+)
+
+
+def upgrade():
+    """Create the pet status transition log."""
+    op.create_table(
+        'pet_status_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('org_id', sa.Integer(), nullable=False),
+        sa.Column('pet_id', sa.Integer(), nullable=False),
+        sa.Column('from_status', pet_status, nullable=True),
+        sa.Column('to_status', pet_status, nullable=False),
+        sa.Column('changed_by_user_id', sa.Integer(), nullable=True),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['org_id'], ['organizations.id'], ),
+        sa.ForeignKeyConstraint(['pet_id'], ['pets.id'], ),
+        sa.ForeignKeyConstraint(['changed_by_user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_pet_status_events_id'), 'pet_status_events', ['id'], unique=False)
+    op.create_index(
+        'ix_pet_status_events_org_to_status_changed',
+        'pet_status_events',
+        ['org_id', 'to_status', 'changed_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_pet_status_events_pet_changed',
+        'pet_status_events',
+        ['pet_id', 'changed_at'],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop the pet status transition log."""
+    op.drop_index('ix_pet_status_events_pet_changed', table_name='pet_status_events')
+    op.drop_index('ix_pet_status_events_org_to_status_changed', table_name='pet_status_events')
+    op.drop_index(op.f('ix_pet_status_events_id'), table_name='pet_status_events')
+    op.drop_table('pet_status_events')
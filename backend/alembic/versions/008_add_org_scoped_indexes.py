@@ -0,0 +1,58 @@
+"""Add composite org-scoped indexes for hot list and stats queries
+
+Revision ID: 008_add_org_scoped_indexes
+Revises: 007_add_pet_status_events
+Create Date: 2026-01-26
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008_add_org_scoped_indexes'
+down_revision = '007_add_pet_status_events'
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns); keep in sync with __table_args__ in app/models.py
+INDEXES = [
+    ('ix_users_org_id', 'users', ['org_id']),
+    ('ix_user_roles_user_id', 'user_roles', ['user_id']),
+    ('ix_pets_org_id_status', 'pets', ['org_id', 'status']),
+    ('ix_pets_org_id_foster_user_id', 'pets', ['org_id', 'foster_user_id']),
+    ('ix_pets_org_id_created_at', 'pets', ['org_id', 'created_at']),
+    ('ix_applications_org_id_status_created_at', 'applications', ['org_id', 'status', 'created_at']),
+    ('ix_applications_org_id_applicant_user_id', 'applications', ['org_id', 'applicant_user_id']),
+    ('ix_foster_profiles_org_id_is_available', 'foster_profiles', ['org_id', 'is_available']),
+    ('ix_foster_placements_org_id_outcome', 'foster_placements', ['org_id', 'outcome']),
+    ('ix_foster_placements_pet_id', 'foster_placements', ['pet_id']),
+    ('ix_foster_placements_foster_profile_id_outcome', 'foster_placements', ['foster_profile_id', 'outcome']),
+    ('ix_medical_records_pet_id_date', 'medical_records', ['pet_id', 'date']),
+    ('ix_appointments_org_id_date_time', 'appointments', ['org_id', 'date_time']),
+    ('ix_events_org_id_start_datetime', 'events', ['org_id', 'start_datetime']),
+    ('ix_event_signups_event_id', 'event_signups', ['event_id']),
+    ('ix_event_signups_user_id', 'event_signups', ['user_id']),
+    ('ix_tasks_org_id_status', 'tasks', ['org_id', 'status']),
+    ('ix_tasks_org_id_assigned_to_user_id', 'tasks', ['org_id', 'assigned_to_user_id']),
+    ('ix_expenses_org_id_date_incurred', 'expenses', ['org_id', 'date_incurred']),
+    ('ix_message_threads_org_id_created_at', 'message_threads', ['org_id', 'created_at']),
+    ('ix_messages_thread_id_sent_at', 'messages', ['thread_id', 'sent_at']),
+    ('ix_payments_org_id_status_created_at', 'payments', ['org_id', 'status', 'created_at']),
+    ('ix_documents_org_id_created_at', 'documents', ['org_id', 'created_at']),
+    ('ix_documents_person_id', 'documents', ['person_id']),
+    ('ix_people_org_id', 'people', ['org_id']),
+    ('ix_person_notes_person_id', 'person_notes', ['person_id']),
+    ('ix_audit_logs_org_id_created_at', 'audit_logs', ['org_id', 'created_at']),
+    ('ix_audit_logs_org_id_entity_type_entity_id', 'audit_logs', ['org_id', 'entity_type', 'entity_id']),
+]
+
+
+def upgrade():
+    """Create the composite indexes."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    """Drop the composite indexes."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,41 @@
+"""Add user_activity_daily rollup table
+
+Revision ID: 009_add_user_activity_daily
+Revises: 008_add_org_scoped_indexes
+Create Date: 2026-02-02
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009_add_user_activity_daily'
+down_revision = '008_add_org_scoped_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the per-user daily activity rollup.
+
+    Run ``python rebuild_rollups.py`` afterwards to backfill it from audit_logs.
+    """
+    op.create_table(
+        'user_activity_daily',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('org_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('action_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['org_id'], ['organizations.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('org_id', 'day', 'user_id', name='uq_user_activity_daily_org_day_user'),
+    )
+    op.create_index(op.f('ix_user_activity_daily_id'), 'user_activity_daily', ['id'], unique=False)
+
+
+def downgrade():
+    """Drop the per-user daily activity rollup."""
+    op.drop_index(op.f('ix_user_activity_daily_id'), table_name='user_activity_daily')
+    op.drop_table('user_activity_daily')
@@ -0,0 +1,57 @@
+"""Add export_jobs table for background report exports
+
+Revision ID: 010_add_export_jobs
+Revises: 009_add_user_activity_daily
+Create Date: 2026-02-09
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010_add_export_jobs'
+down_revision = '009_add_user_activity_daily'
+branch_labels = None
+depends_on = None
+
+export_job_status = sa.Enum('pending', 'running', 'completed', 'failed', name='exportjobstatus')
+
+
+def upgrade():
+    """Create the export job table."""
+    op.create_table(
+        'export_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('org_id', sa.Integer(), nullable=False),
+        sa.Column('requested_by_user_id', sa.Integer(), nullable=False),
+        sa.Column('report', sa.String(), nullable=False),
+        sa.Column('params_json', sa.Text(), nullable=False),
+        sa.Column('dedupe_key', sa.String(length=64), nullable=False),
+        sa.Column('status', export_job_status, nullable=False),
+        sa.Column('total_rows', sa.Integer(), nullable=True),
+        sa.Column('rows_written', sa.Integer(), nullable=False),
+        sa.Column('file_path', sa.String(), nullable=True),
+        sa.Column('size_bytes', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['org_id'], ['organizations.id'], ),
+        sa.ForeignKeyConstraint(['requested_by_user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_export_jobs_id'), 'export_jobs', ['id'], unique=False)
+    op.create_index(
+        'ix_export_jobs_org_id_dedupe_key_created_at',
+        'export_jobs',
+        ['org_id', 'dedupe_key', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop the export job table."""
+    op.drop_index('ix_export_jobs_org_id_dedupe_key_created_at', table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_id'), table_name='export_jobs')
+    op.drop_table('export_jobs')
+    export_job_status.drop(op.get_bind(), checkfirst=True)
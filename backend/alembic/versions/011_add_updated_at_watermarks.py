@@ -0,0 +1,51 @@
+"""Add updated_at to exported tables and (org_id, updated_at) indexes
+
+ix_people_org_id is replaced by ix_people_org_id_updated_at, which has it as
+a prefix.
+
+Revision ID: 011_add_updated_at_watermarks
+Revises: 010_add_export_jobs
+Create Date: 2026-02-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011_add_updated_at_watermarks'
+down_revision = '010_add_export_jobs'
+branch_labels = None
+depends_on = None
+
+# Tables that gain the column; existing rows start from created_at
+NEW_COLUMNS = ['pets', 'applications', 'payments', 'expenses']
+
+# (index name, table); keep in sync with __table_args__ in app/models.py
+INDEXES = [
+    ('ix_pets_org_id_updated_at', 'pets'),
+    ('ix_applications_org_id_updated_at', 'applications'),
+    ('ix_payments_org_id_updated_at', 'payments'),
+    ('ix_expenses_org_id_updated_at', 'expenses'),
+    ('ix_people_org_id_updated_at', 'people'),
+    ('ix_foster_profiles_org_id_updated_at', 'foster_profiles'),
+    ('ix_foster_placements_org_id_updated_at', 'foster_placements'),
+]
+
+
+def upgrade():
+    """Add and backfill updated_at, then index it per organization."""
+    for table in NEW_COLUMNS:
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(f'UPDATE {table} SET updated_at = created_at')
+    for name, table in INDEXES:
+        op.create_index(name, table, ['org_id', 'updated_at'], unique=False)
+    op.drop_index('ix_people_org_id', table_name='people')
+
+
+def downgrade():
+    """Drop the indexes and the added columns."""
+    op.create_index('ix_people_org_id', 'people', ['org_id'], unique=False)
+    for name, table in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    for table in reversed(NEW_COLUMNS):
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,45 @@
+"""Add stored care-needs flags to pets
+
+Existing rows start with both flags false; run ``backfill_care_needs.py``
+after upgrading to derive them from description_internal.
+
+Revision ID: 012_add_pet_care_needs
+Revises: 011_add_updated_at_watermarks
+Create Date: 2026-02-23
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012_add_pet_care_needs'
+down_revision = '011_add_updated_at_watermarks'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add the care-needs columns and their index."""
+    op.add_column(
+        'pets',
+        sa.Column('needs_medical', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.add_column(
+        'pets',
+        sa.Column('needs_behavioral', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.add_column('pets', sa.Column('care_keywords', sa.String(), nullable=True))
+    op.create_index(
+        'ix_pets_org_id_needs_medical_needs_behavioral',
+        'pets',
+        ['org_id', 'needs_medical', 'needs_behavioral'],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop the care-needs index and columns."""
+    op.drop_index('ix_pets_org_id_needs_medical_needs_behavioral', table_name='pets')
+    op.drop_column('pets', 'care_keywords')
+    op.drop_column('pets', 'needs_behavioral')
+    op.drop_column('pets', 'needs_medical')
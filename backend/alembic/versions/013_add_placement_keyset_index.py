@@ -0,0 +1,29 @@
+"""Add the (org_id, created_at, id) index behind placement list pages
+
+Revision ID: 013_add_placement_keyset_index
+Revises: 012_add_pet_care_needs
+Create Date: 2026-03-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013_add_placement_keyset_index'
+down_revision = '012_add_pet_care_needs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the placement keyset index."""
+    op.create_index(
+        'ix_foster_placements_org_id_created_at_id',
+        'foster_placements',
+        ['org_id', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop the placement keyset index."""
+    op.drop_index('ix_foster_placements_org_id_created_at_id', table_name='foster_placements')
@@ -0,0 +1,77 @@
+"""Add full-text pet search and the date_of_birth index
+
+SQLite gets an external-content FTS5 table kept in sync by triggers and
+rebuilt from the existing rows; Postgres gets a generated tsvector column
+with a GIN index. Keep the DDL in sync with the PET_SEARCH_*
+statements in app/models.py.
+
+Revision ID: 014_add_pet_search
+Revises: 013_add_placement_keyset_index
+Create Date: 2026-03-09
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '014_add_pet_search'
+down_revision = '013_add_placement_keyset_index'
+branch_labels = None
+depends_on = None
+
+COLUMNS = 'name, species, breed, color, description_public'
+NEW = 'new.name, new.species, new.breed, new.color, new.description_public'
+OLD = 'old.name, old.species, old.breed, old.color, old.description_public'
+
+SQLITE_UPGRADE = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS pets_fts USING fts5("
+    f"{COLUMNS}, content='pets', content_rowid='id', "
+    f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS pets_fts_insert AFTER INSERT ON pets BEGIN "
+    f"INSERT INTO pets_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW}); END",
+    f"CREATE TRIGGER IF NOT EXISTS pets_fts_delete AFTER DELETE ON pets BEGIN "
+    f"INSERT INTO pets_fts(pets_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD}); END",
+    f"CREATE TRIGGER IF NOT EXISTS pets_fts_update AFTER UPDATE OF {COLUMNS} ON pets BEGIN "
+    f"INSERT INTO pets_fts(pets_fts, rowid, {COLUMNS}) VALUES ('delete', old.id, {OLD}); "
+    f"INSERT INTO pets_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW}); END",
+    "INSERT INTO pets_fts(pets_fts) VALUES ('rebuild')",
+]
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS pets_fts_update",
+    "DROP TRIGGER IF EXISTS pets_fts_delete",
+    "DROP TRIGGER IF EXISTS pets_fts_insert",
+    "DROP TABLE IF EXISTS pets_fts",
+]
+
+POSTGRES_UPGRADE = [
+    "ALTER TABLE pets ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(species, '') || ' ' || "
+    "coalesce(breed, '') || ' ' || coalesce(color, '') || ' ' || "
+    "coalesce(description_public, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_pets_search_vector ON pets USING GIN (search_vector)",
+]
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_pets_search_vector",
+    "ALTER TABLE pets DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(statements_by_dialect):
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade():
+    """Create the search index for the dialect and the date_of_birth index."""
+    _run({'sqlite': SQLITE_UPGRADE, 'postgresql': POSTGRES_UPGRADE})
+    op.create_index(
+        'ix_pets_org_id_date_of_birth',
+        'pets',
+        ['org_id', 'date_of_birth'],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Drop the date_of_birth index and the search index."""
+    op.drop_index('ix_pets_org_id_date_of_birth', table_name='pets')
+    _run({'sqlite': SQLITE_DOWNGRADE, 'postgresql': POSTGRES_DOWNGRADE})
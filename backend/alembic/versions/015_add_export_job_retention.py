@@ -0,0 +1,50 @@
+"""Add the expired export job status and one unfinished job per export
+
+Unfinished jobs left over from before the upgrade have no worker, so they
+are marked failed before the partial unique index is created.
+
+Revision ID: 015_add_export_job_retention
+Revises: 014_add_pet_search
+Create Date: 2026-03-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '015_add_export_job_retention'
+down_revision = '014_add_pet_search'
+branch_labels = None
+depends_on = None
+
+UNFINISHED = sa.text("status IN ('pending', 'running')")
+
+
+def upgrade():
+    """Add the expired status and the unfinished-job unique index."""
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE exportjobstatus ADD VALUE IF NOT EXISTS 'expired'")
+    op.execute(
+        "UPDATE export_jobs SET status = 'failed', "
+        "error = 'Export worker stopped before the job finished', "
+        "completed_at = CURRENT_TIMESTAMP "
+        "WHERE status IN ('pending', 'running')"
+    )
+    op.create_index(
+        'uq_export_jobs_org_id_dedupe_key_unfinished',
+        'export_jobs',
+        ['org_id', 'dedupe_key'],
+        unique=True,
+        sqlite_where=UNFINISHED,
+        postgresql_where=UNFINISHED,
+    )
+
+
+def downgrade():
+    """Drop the unique index; expired jobs become failed."""
+    op.drop_index('uq_export_jobs_org_id_dedupe_key_unfinished', table_name='export_jobs')
+    op.execute(
+        "UPDATE export_jobs SET status = 'failed', error = 'Export file has expired' "
+        "WHERE status = 'expired'"
+    )
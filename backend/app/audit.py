@@ -2,7 +2,7 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from . import models
+from . import models, rollups
 
 
 def log_action(
@@ -23,6 +23,8 @@ def log_action(
         details=details,
     )
     db.add(log)
+    if user_id is not None:
+        rollups.record_user_activity(db, org_id, user_id)
     db.commit()
     db.refresh(log)
     return log
@@ -0,0 +1,143 @@
+"""
+Pet care-needs flags.
+
+``Pet.needs_medical``, ``Pet.needs_behavioral`` and ``Pet.care_keywords`` are
+derived from ``description_internal`` when a pet is created or updated, so
+the matchers read stored booleans instead of scanning free text on every
+request. The pet write paths call ``apply`` in the same transaction as the
+change; ``backfill`` (run by ``backfill_care_needs.py``) recomputes existing
+rows.
+
+All keywords are found in one pass over the lower-cased text with an
+Aho-Corasick automaton, built once at import.
+"""
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from . import models
+
+MEDICAL = "medical"
+BEHAVIORAL = "behavioral"
+
+KEYWORDS: Dict[str, str] = {
+    "special": MEDICAL,
+    "medication": MEDICAL,
+    "chronic": MEDICAL,
+    "treatment": MEDICAL,
+    "aggressive": BEHAVIORAL,
+    "anxious": BEHAVIORAL,
+    "fearful": BEHAVIORAL,
+    "training needed": BEHAVIORAL,
+}
+
+
+class CareNeeds(NamedTuple):
+    needs_medical: bool
+    needs_behavioral: bool
+    keywords: List[str]  # in order of first appearance
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton reporting every keyword that occurs in a text."""
+
+    def __init__(self, keywords):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state] += (keyword,)
+
+        # Breadth-first, so every failure target is complete before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, target in self._goto[state].items():
+                queue.append(target)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[target] = self._goto[fallback].get(char, 0)
+                self._output[target] += self._output[self._fail[target]]
+
+    def find(self, text: str) -> List[str]:
+        """Keywords present in ``text``, each once, in order of first match."""
+        found: Dict[str, None] = {}
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for keyword in self._output[state]:
+                found.setdefault(keyword)
+        return list(found)
+
+
+_matcher = KeywordMatcher(KEYWORDS)
+
+
+def scan(text: Optional[str]) -> CareNeeds:
+    """Care needs mentioned in a free-text description."""
+    keywords = _matcher.find(text.lower()) if text else []
+    categories = {KEYWORDS[keyword] for keyword in keywords}
+    return CareNeeds(MEDICAL in categories, BEHAVIORAL in categories, keywords)
+
+
+def apply(pet: models.Pet) -> None:
+    """Recompute a pet's stored flags from its description. The caller commits."""
+    needs = scan(pet.description_internal)
+    pet.needs_medical = needs.needs_medical
+    pet.needs_behavioral = needs.needs_behavioral
+    pet.care_keywords = ",".join(needs.keywords) or None
+
+
+def backfill(db: Session, org_id: Optional[int] = None, batch_size: int = 1000) -> int:
+    """
+    Recompute the flags for every pet (optionally one org's) and return how
+    many rows changed. Commits once per batch.
+    """
+    query = db.query(
+        models.Pet.id,
+        models.Pet.description_internal,
+        models.Pet.needs_medical,
+        models.Pet.needs_behavioral,
+        models.Pet.care_keywords,
+    ).order_by(models.Pet.id)
+    if org_id is not None:
+        query = query.filter(models.Pet.org_id == org_id)
+
+    changed, last_id = 0, 0
+    while True:
+        rows = query.filter(models.Pet.id > last_id).limit(batch_size).all()
+        if not rows:
+            return changed
+        updates = []
+        for row in rows:
+            needs = scan(row.description_internal)
+            keywords = ",".join(needs.keywords) or None
+            stored = (bool(row.needs_medical), bool(row.needs_behavioral), row.care_keywords)
+            if stored != (needs.needs_medical, needs.needs_behavioral, keywords):
+                updates.append(
+                    {
+                        "id": row.id,
+                        "needs_medical": needs.needs_medical,
+                        "needs_behavioral": needs.needs_behavioral,
+                        "care_keywords": keywords,
+                    }
+                )
+        if updates:
+            db.execute(update(models.Pet), updates)
+        db.commit()
+        changed += len(updates)
+        last_id = rows[-1].id
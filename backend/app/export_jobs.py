@@ -0,0 +1,292 @@
+"""
+Background report exports.
+
+``POST /reports/exports`` records an ``ExportJob`` and hands it to a small
+thread pool. The worker streams the report's query into
+``EXPORT_ROOT/<org_id>/<job_id>.csv`` on its own session and marks the job
+completed, after which the file is served with Range support.
+
+Identical requests (same org, report and filters) made within
+``EXPORT_JOB_REUSE_SECONDS`` share one job and artifact. Live progress is
+kept in memory by the process running the job, because the worker's
+streaming read holds its transaction open until the file is written;
+``rows_written`` is persisted when the job finishes. For the same reason a
+pending or running job that is not queued in this process has lost its
+worker (e.g. to a restart); it is marked failed instead of being reused.
+A partial unique index allows one unfinished job per export, so identical
+concurrent requests cannot each start a worker.
+
+Artifacts are kept for ``EXPORT_RETENTION_SECONDS`` after the job
+completes. ``expire_finished`` deletes older files and marks their jobs
+expired; job creation runs it at most every ``EXPORT_SWEEP_SECONDS``.
+"""
+import csv
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import models
+
+logger = logging.getLogger(__name__)
+
+EXPORT_ROOT = os.environ.get("RESCUEWORKS_EXPORT_ROOT", "./exports")
+EXPORT_MAX_WORKERS = int(os.getenv("EXPORT_MAX_WORKERS", "2"))
+EXPORT_JOB_REUSE_SECONDS = int(os.getenv("EXPORT_JOB_REUSE_SECONDS", "600"))
+# Never shorter than the reuse window, so a reused job still has its file
+EXPORT_RETENTION_SECONDS = max(
+    int(os.getenv("EXPORT_RETENTION_SECONDS", "86400")), EXPORT_JOB_REUSE_SECONDS
+)
+EXPORT_SWEEP_SECONDS = int(os.getenv("EXPORT_SWEEP_SECONDS", "300"))
+
+# How often (in rows) the worker publishes progress
+PROGRESS_EVERY = 500
+
+_executor = ThreadPoolExecutor(
+    max_workers=EXPORT_MAX_WORKERS, thread_name_prefix="report-export"
+)
+
+_progress: Dict[int, int] = {}
+# Jobs queued or running on this process's pool; guarded by _progress_lock
+_live: Set[int] = set()
+_progress_lock = threading.Lock()
+
+STALE_JOB_ERROR = "Export worker stopped before the job finished"
+
+_UNFINISHED = (models.ExportJobStatus.pending, models.ExportJobStatus.running)
+
+_last_sweep = 0.0
+_sweep_lock = threading.Lock()
+
+
+def dedupe_key(org_id: int, report: str, params: dict) -> str:
+    """Hash of everything that determines an export's contents."""
+    payload = json.dumps([org_id, report, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def artifact_path(job: models.ExportJob) -> str:
+    return os.path.join(EXPORT_ROOT, job.file_path)
+
+
+def get_or_create(
+    db: Session, org_id: int, user_id: int, report: str, params: dict
+) -> Tuple[models.ExportJob, bool]:
+    """
+    Return ``(job, created)``.
+
+    An unfinished job for the same export is reused unless it has no live
+    worker here, in which case it is marked failed. Otherwise a job
+    completed within ``EXPORT_JOB_REUSE_SECONDS`` is reused if its file is
+    still there. The caller submits newly created jobs.
+    """
+    key = dedupe_key(org_id, report, params)
+    unfinished = _unfinished(db, org_id, key)
+    if unfinished is not None and _is_stale(unfinished):
+        unfinished.status = models.ExportJobStatus.failed
+        unfinished.error = STALE_JOB_ERROR
+        unfinished.completed_at = datetime.utcnow()
+        db.commit()
+    elif unfinished is not None:
+        return unfinished, False
+
+    recent = (
+        db.query(models.ExportJob)
+        .filter(
+            models.ExportJob.org_id == org_id,
+            models.ExportJob.dedupe_key == key,
+            models.ExportJob.status == models.ExportJobStatus.completed,
+            models.ExportJob.created_at
+            >= datetime.utcnow() - timedelta(seconds=EXPORT_JOB_REUSE_SECONDS),
+        )
+        .order_by(models.ExportJob.created_at.desc())
+        .first()
+    )
+    if recent is not None and os.path.exists(artifact_path(recent)):
+        return recent, False
+
+    job = models.ExportJob(
+        org_id=org_id,
+        requested_by_user_id=user_id,
+        report=report,
+        params_json=json.dumps(params, sort_keys=True),
+        dedupe_key=key,
+        status=models.ExportJobStatus.pending,
+    )
+    db.add(job)
+    try:
+        db.flush()
+    except IntegrityError:
+        # An identical request created an unfinished job after our lookup
+        db.rollback()
+        return get_or_create(db, org_id, user_id, report, params)
+    # Live before it is visible, so a concurrent request does not take it
+    # for stale before the caller submits it
+    with _progress_lock:
+        _live.add(job.id)
+    try:
+        db.commit()
+    except Exception:
+        with _progress_lock:
+            _live.discard(job.id)
+        raise
+    db.refresh(job)
+    return job, True
+
+
+def _unfinished(db: Session, org_id: int, key: str) -> Optional[models.ExportJob]:
+    return (
+        db.query(models.ExportJob)
+        .filter(
+            models.ExportJob.org_id == org_id,
+            models.ExportJob.dedupe_key == key,
+            models.ExportJob.status.in_(_UNFINISHED),
+        )
+        .first()
+    )
+
+
+def _is_stale(job: models.ExportJob) -> bool:
+    if job.status not in _UNFINISHED:
+        return False
+    with _progress_lock:
+        return job.id not in _live
+
+
+def expire_finished(db: Session, now: Optional[datetime] = None) -> int:
+    """
+    Delete the artifacts of jobs completed more than
+    ``EXPORT_RETENTION_SECONDS`` ago and mark the jobs expired. Returns how
+    many jobs were expired.
+    """
+    now = now or datetime.utcnow()
+    jobs = (
+        db.query(models.ExportJob)
+        .filter(
+            models.ExportJob.status == models.ExportJobStatus.completed,
+            models.ExportJob.completed_at < now - timedelta(seconds=EXPORT_RETENTION_SECONDS),
+        )
+        .all()
+    )
+    for job in jobs:
+        if job.file_path:
+            try:
+                os.remove(artifact_path(job))
+            except FileNotFoundError:
+                pass
+        job.status = models.ExportJobStatus.expired
+    if jobs:
+        db.commit()
+    return len(jobs)
+
+
+def sweep(db: Session) -> None:
+    """Run ``expire_finished`` if this process has not for ``EXPORT_SWEEP_SECONDS``."""
+    global _last_sweep
+    with _sweep_lock:
+        if time.monotonic() - _last_sweep < EXPORT_SWEEP_SECONDS:
+            return
+        _last_sweep = time.monotonic()
+    try:
+        expire_finished(db)
+    except Exception:
+        logger.exception("Export retention sweep failed")
+        db.rollback()
+
+
+def submit(job_id: int, bind, build: Callable):
+    """Queue a job on the export worker pool."""
+    with _progress_lock:
+        _live.add(job_id)
+    return _executor.submit(run_job, job_id, bind, build)
+
+
+def run_job(job_id: int, bind, build: Callable) -> None:
+    """
+    Write one export to disk on a fresh session.
+
+    ``build(session, org_id, **params)`` returns a ``reports.Export``. The file
+    is written under a temporary name and renamed once complete, so a
+    download never sees a partial artifact.
+    """
+    session = Session(bind=bind, autoflush=False)
+    partial = None
+    try:
+        job = session.get(models.ExportJob, job_id)
+        job.status = models.ExportJobStatus.running
+        job.started_at = datetime.utcnow()
+        session.commit()
+
+        export = build(session, job.org_id, **json.loads(job.params_json))
+        job.total_rows = export.count()
+        job.file_path = os.path.join(str(job.org_id), f"{job.id}.csv")
+        session.commit()
+
+        path = artifact_path(job)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.part"
+
+        written = 0
+        with open(partial, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(export.headers)
+            for row in export.rows():
+                writer.writerow(row)
+                written += 1
+                if written % PROGRESS_EVERY == 0:
+                    with _progress_lock:
+                        _progress[job_id] = written
+        os.replace(partial, path)
+
+        job.rows_written = written
+        job.size_bytes = os.path.getsize(path)
+        job.status = models.ExportJobStatus.completed
+        job.completed_at = datetime.utcnow()
+        session.commit()
+    except Exception as exc:
+        logger.exception("Export job %s failed", job_id)
+        if partial and os.path.exists(partial):
+            os.remove(partial)
+        session.rollback()
+        job = session.get(models.ExportJob, job_id)
+        if job is not None:
+            job.status = models.ExportJobStatus.failed
+            job.error = str(exc)
+            job.completed_at = datetime.utcnow()
+            session.commit()
+    finally:
+        with _progress_lock:
+            _progress.pop(job_id, None)
+            _live.discard(job_id)
+        session.close()
+
+
+def with_progress(job: models.ExportJob) -> dict:
+    """Serialize a job, overlaying live progress from this process if running."""
+    rows_written = job.rows_written or 0
+    if job.status == models.ExportJobStatus.running:
+        with _progress_lock:
+            rows_written = _progress.get(job.id, rows_written)
+
+    completed = job.status == models.ExportJobStatus.completed
+    return {
+        "id": job.id,
+        "report": job.report,
+        "status": job.status.value,
+        "total_rows": job.total_rows,
+        "rows_written": rows_written,
+        "size_bytes": job.size_bytes,
+        "error": job.error,
+        "download_url": f"/reports/exports/{job.id}/download" if completed else None,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
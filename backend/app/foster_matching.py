@@ -0,0 +1,370 @@
+"""
+Vectorized foster match scoring.
+
+A pet-foster score is the sum of a per-profile part (capacity, experience,
+track record, rating, load, qualifications) and a few pet-dependent terms
+(species preference, medical and behavioral needs). Features are extracted
+once per pet and once per profile, the score matrix is built with NumPy
+broadcasting, and each pet's top matches are picked with ``argpartition``.
+Reasons are only rendered for the pairs that are returned.
+
+Scores and reasons are identical to the original per-pair loop, including
+its tie order (equal scores keep profile order).
+
+``assign`` instead places each pet with at most one foster, respecting every
+profile's spare capacity, so that the total score is as high as possible.
+The pet-dependent terms only see a pet's "class" (species, medical and
+behavioral needs) and a profile's "type" (preferred species, what it can
+handle), and both are few. The plan is solved as a min-cost flow over
+source -> class -> type -> sink, where each type reaches the sink through
+one arc per distinct base score, and is then expanded back to pets and
+profiles.
+"""
+from collections import defaultdict, deque
+from typing import Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from . import models
+
+SPECIES_SCORE = 30
+CAN_HANDLE_SCORE = 25
+CANNOT_HANDLE_SCORE = -20
+
+# Pets scored per block, bounding the matrix to BLOCK_PETS x len(profiles)
+BLOCK_PETS = 1024
+
+
+class PetFeatures(NamedTuple):
+    species: List[str]
+    species_key: List[str]  # lower-cased, as compared with preferences
+    needs_medical: np.ndarray
+    needs_behavioral: np.ndarray
+
+
+class ProfileFeatures(NamedTuple):
+    base_score: np.ndarray
+    spare_capacity: np.ndarray
+    can_handle_medical: np.ndarray
+    can_handle_behavioral: np.ndarray
+    preferred_species: List[frozenset]
+    leading_reasons: List[List[str]]
+    trailing_reasons: List[List[str]]
+
+
+def pet_features(pets: Sequence) -> PetFeatures:
+    """
+    Extract scoring features from rows with ``species`` and the stored
+    ``needs_medical`` / ``needs_behavioral`` flags (see ``care_needs``).
+    """
+    return PetFeatures(
+        species=[pet.species or "" for pet in pets],
+        species_key=[(pet.species or "").lower() for pet in pets],
+        needs_medical=np.array([bool(pet.needs_medical) for pet in pets], dtype=bool),
+        needs_behavioral=np.array([bool(pet.needs_behavioral) for pet in pets], dtype=bool),
+    )
+
+
+def _profile_part(profile) -> Tuple[int, List[str], List[str]]:
+    """Score and reasons that do not depend on the pet."""
+    score = 0
+    leading, trailing = [], []
+
+    current = profile.current_capacity or 0
+    maximum = profile.max_capacity or 0
+
+    if current < maximum:
+        score += 20
+        leading.append("Has available capacity")
+
+    if profile.experience_level == models.FosterExperienceLevel.advanced:
+        score += 15
+        trailing.append("Experienced foster")
+    elif profile.experience_level == models.FosterExperienceLevel.intermediate:
+        score += 10
+        trailing.append("Intermediate experience")
+
+    if profile.total_fosters and profile.total_fosters > 0:
+        success_rate = (profile.successful_adoptions or 0) / profile.total_fosters
+        if success_rate > 0.8:
+            score += 20
+            trailing.append(f"High success rate ({success_rate:.0%})")
+        elif success_rate > 0.5:
+            score += 10
+            trailing.append(f"Good success rate ({success_rate:.0%})")
+
+    if profile.rating and profile.rating >= 4.5:
+        score += 15
+        trailing.append(f"Highly rated ({profile.rating:.1f}★)")
+    elif profile.rating and profile.rating >= 4.0:
+        score += 10
+        trailing.append(f"Well rated ({profile.rating:.1f}★)")
+
+    capacity_ratio = current / maximum if maximum > 0 else 1
+    if capacity_ratio == 0:
+        score += 15
+        trailing.append("No current fosters")
+    elif capacity_ratio < 0.5:
+        score += 10
+        trailing.append("Low current load")
+
+    if profile.background_check_status == "approved":
+        score += 10
+        trailing.append("Background check approved")
+
+    if profile.references_checked:
+        score += 5
+        trailing.append("References verified")
+
+    return score, leading, trailing
+
+
+def profile_features(profiles: Sequence) -> ProfileFeatures:
+    """Extract scoring features from foster profiles."""
+    parts = [_profile_part(profile) for profile in profiles]
+    return ProfileFeatures(
+        base_score=np.array([score for score, _, _ in parts], dtype=np.int32),
+        spare_capacity=np.array(
+            [max((p.max_capacity or 0) - (p.current_capacity or 0), 0) for p in profiles],
+            dtype=np.int64,
+        ),
+        can_handle_medical=np.array(
+            [bool(profile.can_handle_medical) for profile in profiles], dtype=bool
+        ),
+        can_handle_behavioral=np.array(
+            [bool(profile.can_handle_behavioral) for profile in profiles], dtype=bool
+        ),
+        preferred_species=[
+            frozenset(s.strip().lower() for s in profile.preferred_species.split(","))
+            if profile.preferred_species
+            else frozenset()
+            for profile in profiles
+        ],
+        leading_reasons=[leading for _, leading, _ in parts],
+        trailing_reasons=[trailing for _, _, trailing in parts],
+    )
+
+
+def _species_matrix(pet_species: List[str], preferred: List[frozenset]) -> np.ndarray:
+    """Boolean (pets x profiles) matrix of species preference matches."""
+    vocabulary = {name: i for i, name in enumerate(sorted(set(pet_species)))}
+    prefers = np.zeros((len(vocabulary), len(preferred)), dtype=bool)
+    for j, names in enumerate(preferred):
+        for name in names:
+            if name in vocabulary:
+                prefers[vocabulary[name], j] = True
+    return prefers[[vocabulary[name] for name in pet_species]]
+
+
+def _needs_term(needs: np.ndarray, can_handle: np.ndarray) -> np.ndarray:
+    term = np.where(can_handle, CAN_HANDLE_SCORE, CANNOT_HANDLE_SCORE).astype(np.int32)
+    return needs[:, None] * term[None, :]
+
+
+def score_matrix(pets: PetFeatures, profiles: ProfileFeatures) -> np.ndarray:
+    """Integer (pets x profiles) score matrix."""
+    species = _species_matrix(pets.species_key, profiles.preferred_species)
+    return (
+        profiles.base_score[None, :]
+        + SPECIES_SCORE * species.astype(np.int32)
+        + _needs_term(pets.needs_medical, profiles.can_handle_medical)
+        + _needs_term(pets.needs_behavioral, profiles.can_handle_behavioral)
+    )
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Column indices of each row's ``k`` best scores, best first.
+
+    Ties go to the lower column index, matching a stable descending sort.
+    """
+    rows, columns = scores.shape
+    k = min(k, columns)
+    if k == 0:
+        return np.empty((rows, 0), dtype=np.intp)
+    # Fold the column index into the key so every entry is distinct
+    keys = scores.astype(np.int64) * columns + (columns - 1 - np.arange(columns))
+    if k < columns:
+        best = np.argpartition(-keys, k - 1, axis=1)[:, :k]
+    else:
+        best = np.broadcast_to(np.arange(columns), (rows, columns))
+    order = np.argsort(-np.take_along_axis(keys, best, axis=1), axis=1)
+    return np.take_along_axis(best, order, axis=1)
+
+
+def reasons(pets: PetFeatures, profiles: ProfileFeatures, i: int, j: int) -> List[str]:
+    """Reasons for pet ``i`` and profile ``j``, in the order they were scored."""
+    result = list(profiles.leading_reasons[j])
+    if pets.species_key[i] in profiles.preferred_species[j]:
+        result.append(f"Prefers {pets.species[i]}")
+    if pets.needs_medical[i]:
+        result.append(
+            "Can handle medical needs" if profiles.can_handle_medical[j] else "Pet needs medical care"
+        )
+    if pets.needs_behavioral[i]:
+        result.append(
+            "Can handle behavioral issues"
+            if profiles.can_handle_behavioral[j]
+            else "Pet needs behavioral support"
+        )
+    result.extend(profiles.trailing_reasons[j])
+    return result
+
+
+def best_matches(
+    pets: PetFeatures, profiles: ProfileFeatures, k: int = 3
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield ``(pet_index, profile_index, score)`` for each pet's top ``k``
+    positive-scoring profiles, pets in order and best match first.
+    """
+    count = len(pets.species)
+    for start in range(0, count, BLOCK_PETS):
+        block = PetFeatures(*(field[start:start + BLOCK_PETS] for field in pets))
+        scores = score_matrix(block, profiles)
+        best = top_k(scores, k)
+        for row in range(best.shape[0]):
+            for j in best[row]:
+                score = int(scores[row, j])
+                if score > 0:
+                    yield start + row, int(j), score
+
+
+class _FlowNetwork:
+    """Successive-shortest-path min-cost flow for small graphs."""
+
+    def __init__(self, nodes: int):
+        self.edges: List[list] = []  # [to, capacity, cost, reverse index]
+        self.adjacent: List[List[int]] = [[] for _ in range(nodes)]
+
+    def add_edge(self, u: int, v: int, capacity: int, cost: int) -> int:
+        self.adjacent[u].append(len(self.edges))
+        self.edges.append([v, capacity, cost, len(self.edges) + 1])
+        self.adjacent[v].append(len(self.edges))
+        self.edges.append([u, 0, -cost, len(self.edges) - 1])
+        return len(self.edges) - 2
+
+    def flow(self, edge: int) -> int:
+        return self.edges[self.edges[edge][3]][1]
+
+    def _shortest_path(self, source: int, sink: int):
+        """Bellman-Ford (queue based); residual costs can be negative."""
+        distance = [None] * len(self.adjacent)
+        via = [None] * len(self.adjacent)
+        distance[source] = 0
+        queue, queued = deque([source]), {source}
+        while queue:
+            u = queue.popleft()
+            queued.discard(u)
+            for index in self.adjacent[u]:
+                v, capacity, cost, _ = self.edges[index]
+                if capacity > 0 and (distance[v] is None or distance[u] + cost < distance[v]):
+                    distance[v] = distance[u] + cost
+                    via[v] = index
+                    if v not in queued:
+                        queue.append(v)
+                        queued.add(v)
+        return distance[sink], via
+
+    def min_cost_flow(self, source: int, sink: int) -> None:
+        """Augment along cheapest paths while they still lower the total cost."""
+        while True:
+            cost, via = self._shortest_path(source, sink)
+            if cost is None or cost >= 0:
+                return
+            path, node = [], sink
+            while node != source:
+                path.append(via[node])
+                node = self.edges[self.edges[via[node]][3]][0]
+            amount = min(self.edges[index][1] for index in path)
+            for index in path:
+                self.edges[index][1] -= amount
+                self.edges[self.edges[index][3]][1] += amount
+
+
+def assign(pets: PetFeatures, profiles: ProfileFeatures) -> List[Tuple[int, int, int]]:
+    """
+    Return ``(pet_index, profile_index, score)`` for a capacity-respecting
+    placement plan with the highest total score, ordered by pet.
+
+    Each pet appears at most once and only with a positive score; no profile
+    receives more pets than its spare capacity.
+    """
+    vocabulary = set(pets.species_key)
+
+    classes: Dict[tuple, List[int]] = defaultdict(list)
+    for i, key in enumerate(zip(pets.species_key, pets.needs_medical, pets.needs_behavioral)):
+        classes[(key[0], bool(key[1]), bool(key[2]))].append(i)
+
+    # type -> base score -> profile indexes, best base first
+    types: Dict[tuple, Dict[int, List[int]]] = defaultdict(lambda: defaultdict(list))
+    for j, preferred in enumerate(profiles.preferred_species):
+        if profiles.spare_capacity[j] <= 0:
+            continue
+        key = (
+            frozenset(preferred & vocabulary),
+            bool(profiles.can_handle_medical[j]),
+            bool(profiles.can_handle_behavioral[j]),
+        )
+        types[key][int(profiles.base_score[j])].append(j)
+
+    class_keys, type_keys = list(classes), list(types)
+    source, sink = 0, 1
+    network = _FlowNetwork(2 + len(class_keys) + len(type_keys))
+    class_node = {key: 2 + n for n, key in enumerate(class_keys)}
+    type_node = {key: 2 + len(class_keys) + n for n, key in enumerate(type_keys)}
+
+    for key in class_keys:
+        network.add_edge(source, class_node[key], len(classes[key]), 0)
+
+    best_base = {key: max(types[key]) for key in type_keys}
+    pair_edges = {}
+    for pet_key in class_keys:
+        species, medical, behavioral = pet_key
+        for type_key in type_keys:
+            preferred, can_medical, can_behavioral = type_key
+            delta = SPECIES_SCORE if species in preferred else 0
+            if medical:
+                delta += CAN_HANDLE_SCORE if can_medical else CANNOT_HANDLE_SCORE
+            if behavioral:
+                delta += CAN_HANDLE_SCORE if can_behavioral else CANNOT_HANDLE_SCORE
+            if best_base[type_key] + delta > 0:
+                edge = network.add_edge(
+                    class_node[pet_key], type_node[type_key], len(classes[pet_key]), -delta
+                )
+                pair_edges[pet_key, type_key] = edge, delta
+
+    base_edges = {}
+    for type_key in type_keys:
+        for base, members in types[type_key].items():
+            capacity = int(sum(profiles.spare_capacity[j] for j in members))
+            base_edges[type_key, base] = network.add_edge(type_node[type_key], sink, capacity, -base)
+
+    network.min_cost_flow(source, sink)
+
+    # Expand flows: fill each type's slots best base first, in profile order
+    waiting = {key: deque(members) for key, members in classes.items()}
+    plan = []
+    for type_key in type_keys:
+        slots = []
+        for base in sorted(types[type_key], reverse=True):
+            needed = network.flow(base_edges[type_key, base])
+            for j in types[type_key][base]:
+                if needed <= 0:
+                    break
+                taken = min(needed, int(profiles.spare_capacity[j]))
+                slots.extend([(j, base)] * taken)
+                needed -= taken
+        slots = iter(slots)
+        for pet_key in class_keys:
+            if (pet_key, type_key) not in pair_edges:
+                continue
+            edge, delta = pair_edges[pet_key, type_key]
+            for _ in range(network.flow(edge)):
+                i = waiting[pet_key].popleft()
+                j, base = next(slots)
+                # Re-routed flow can leave a zero-score pair; it adds nothing
+                if base + delta > 0:
+                    plan.append((i, j, base + delta))
+
+    return sorted(plan)
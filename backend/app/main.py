@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .database import Base, engine
+from .query_stats import QueryStatsMiddleware
 from .routers import (
     applications,
     auth,
@@ -41,6 +42,8 @@ cors_origins_str = os.getenv(
 )
 origins = [origin.strip() for origin in cors_origins_str.split(",")]
 
+app.add_middleware(QueryStatsMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -0,0 +1,553 @@
+"""
+Per-org cache of the foster match score matrix.
+
+/foster-coordinator/matches/suggest scores every pet needing a foster
+against every available foster profile. The inputs change rarely, so each
+org's pets, profiles, features, score matrix and per-pet top matches are
+kept in memory and patched instead of rebuilt:
+
+- ``Session.after_flush`` records which pets, foster profiles and users a
+  transaction touched; ``after_commit`` queues them for the org.
+- The next lookup reloads only those rows. A changed pet recomputes its
+  matrix row, a changed profile its column (and the top matches of the
+  pets it can displace); pets or profiles entering or leaving the match
+  set insert or delete a row or column.
+- Patches are applied in place, so callers read a match set only inside
+  ``MatchCache.use``, which holds the org's lock.
+- A lookup with nothing queued serves the stored suggestions as is.
+
+Bulk ``UPDATE``/``DELETE`` statements on those tables bypass the flush, so
+they drop the whole cache, unless they name the rows they change with
+``execution_options(org_id=..., changed_ids=[...])``. Entries are also rebuilt after
+``MATCH_CACHE_TTL`` seconds, which bounds how stale another worker
+process's entry can get; expired entries are dropped whenever changes are
+recorded or an entry is stored. Entries are evicted least recently used
+first once their arrays exceed ``MATCH_CACHE_MAX_BYTES``.
+``MATCH_CACHE_ENABLED=false`` rebuilds on every request.
+"""
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import and_, event, or_
+from sqlalchemy.orm import Session
+
+from . import foster_matching, models
+
+logger = logging.getLogger(__name__)
+
+MATCH_CACHE_ENABLED = os.getenv("MATCH_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+MATCH_CACHE_TTL = int(os.getenv("MATCH_CACHE_TTL", "600"))
+MATCH_CACHE_MAX_BYTES = int(os.getenv("MATCH_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Matches kept per pet
+TOP_K = 3
+
+_PENDING_KEY = "match_cache_changes"
+_TRACKED = {
+    models.Pet.__tablename__: "pets",
+    models.FosterProfile.__tablename__: "profiles",
+    models.User.__tablename__: "users",
+}
+
+
+def load_pets(db: Session, org_id: int, ids=None) -> list:
+    """Pets needing a foster, as rows ordered by id."""
+    query = db.query(
+        models.Pet.id,
+        models.Pet.name,
+        models.Pet.species,
+        models.Pet.status,
+        models.Pet.needs_medical,
+        models.Pet.needs_behavioral,
+    ).filter(
+        and_(
+            models.Pet.org_id == org_id,
+            or_(
+                models.Pet.status == models.PetStatus.intake,
+                models.Pet.status == models.PetStatus.needs_foster,
+            ),
+        )
+    )
+    if ids is not None:
+        query = query.filter(models.Pet.id.in_(ids))
+    return query.order_by(models.Pet.id).all()
+
+
+def load_profiles(db: Session, org_id: int, ids=None) -> list:
+    """Available foster profiles with spare capacity, as rows ordered by id."""
+    query = (
+        db.query(
+            models.FosterProfile.id,
+            models.FosterProfile.user_id,
+            models.FosterProfile.current_capacity,
+            models.FosterProfile.max_capacity,
+            models.FosterProfile.experience_level,
+            models.FosterProfile.preferred_species,
+            models.FosterProfile.can_handle_medical,
+            models.FosterProfile.can_handle_behavioral,
+            models.FosterProfile.total_fosters,
+            models.FosterProfile.successful_adoptions,
+            models.FosterProfile.rating,
+            models.FosterProfile.background_check_status,
+            models.FosterProfile.references_checked,
+            models.User.full_name,
+            models.User.email,
+        )
+        .join(models.User, models.User.id == models.FosterProfile.user_id)
+        .filter(
+            and_(
+                models.FosterProfile.org_id == org_id,
+                models.FosterProfile.is_available == True,
+                models.FosterProfile.current_capacity < models.FosterProfile.max_capacity,
+            )
+        )
+    )
+    if ids is not None:
+        query = query.filter(models.FosterProfile.id.in_(ids))
+    return query.order_by(models.FosterProfile.id).all()
+
+
+def _top(scores: np.ndarray) -> np.ndarray:
+    """``foster_matching.top_k`` in row blocks, bounding the temporaries."""
+    blocks = [
+        foster_matching.top_k(scores[start:start + foster_matching.BLOCK_PETS], TOP_K)
+        for start in range(0, scores.shape[0], foster_matching.BLOCK_PETS)
+    ]
+    if not blocks:
+        return np.empty((0, min(TOP_K, scores.shape[1])), dtype=np.intp)
+    return np.concatenate(blocks)
+
+
+def _merge(rows: list, ids: List[int], changed: Dict[int, Optional[tuple]]) -> bool:
+    """
+    Replace, insert or remove ``changed`` rows, keeping id order. Returns True
+    if any row entered or left the list.
+    """
+    moved = False
+    for row_id, row in sorted(changed.items()):
+        position = bisect.bisect_left(ids, row_id)
+        present = position < len(ids) and ids[position] == row_id
+        if present and row is not None:
+            rows[position] = row
+        elif present:
+            del rows[position], ids[position]
+            moved = True
+        elif row is not None:
+            rows.insert(position, row)
+            ids.insert(position, row_id)
+            moved = True
+    return moved
+
+
+def _overwrite(features: tuple, position: int, single: tuple) -> None:
+    """Copy a one-row features tuple into ``features`` at ``position``."""
+    for field, value in zip(features, single):
+        field[position] = value[0]
+
+
+class OrgMatches:
+    """One org's match set: rows, features, score matrix and top matches."""
+
+    def __init__(self, pets: list, profiles: list, clock: Callable[[], float] = time.time):
+        self.built_at = clock()
+        self.pets = list(pets)
+        self.profiles = list(profiles)
+        self.pet_ids = [pet.id for pet in self.pets]
+        self.profile_ids = [profile.id for profile in self.profiles]
+        self._refresh_features()
+        self.scores = foster_matching.score_matrix(self.pet_features, self.profile_features).astype(
+            np.int16
+        )
+        self.best = _top(self.scores)
+        self._suggestions = None
+        self._plan = None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the matrix and feature arrays (the rows themselves are not counted)."""
+        arrays = (self.scores, self.best, *self.pet_features, *self.profile_features)
+        return sum(array.nbytes for array in arrays if isinstance(array, np.ndarray))
+
+    def _refresh_features(self):
+        self.pet_features = foster_matching.pet_features(self.pets)
+        self.profile_features = foster_matching.profile_features(self.profiles)
+
+    def _row_scores(self, i: int) -> np.ndarray:
+        one = foster_matching.PetFeatures(*(field[i:i + 1] for field in self.pet_features))
+        return foster_matching.score_matrix(one, self.profile_features)[0].astype(np.int16)
+
+    def _column_scores(self, j: int) -> np.ndarray:
+        one = foster_matching.ProfileFeatures(
+            *(field[j:j + 1] for field in self.profile_features)
+        )
+        return foster_matching.score_matrix(self.pet_features, one)[:, 0].astype(np.int16)
+
+    def patch(self, pets: Dict[int, Optional[tuple]], profiles: Dict[int, Optional[tuple]]) -> Tuple[int, int]:
+        """
+        Apply reloaded rows (``None`` for rows no longer in the match set) and
+        return how many matrix rows and columns were recomputed.
+        """
+        self._suggestions = None
+        self._plan = None
+        old_pet_ids, old_profile_ids = list(self.pet_ids), list(self.profile_ids)
+        pets_moved = _merge(self.pets, self.pet_ids, pets)
+        profiles_moved = _merge(self.profiles, self.profile_ids, profiles)
+        if pets_moved or profiles_moved:
+            self._refresh_features()
+
+        if pets_moved or profiles_moved:
+            # Re-align the matrix: copy unchanged cells, recompute the rest
+            old_rows = {pet_id: i for i, pet_id in enumerate(old_pet_ids)}
+            old_columns = {profile_id: j for j, profile_id in enumerate(old_profile_ids)}
+            kept_rows = np.array(
+                [i for i, pet_id in enumerate(self.pet_ids) if pet_id not in pets], dtype=np.intp
+            )
+            kept_columns = np.array(
+                [j for j, profile_id in enumerate(self.profile_ids) if profile_id not in profiles],
+                dtype=np.intp,
+            )
+            source_rows = np.array([old_rows[self.pet_ids[i]] for i in kept_rows], dtype=np.intp)
+            source_columns = np.array(
+                [old_columns[self.profile_ids[j]] for j in kept_columns], dtype=np.intp
+            )
+            scores = np.empty((len(self.pet_ids), len(self.profile_ids)), dtype=np.int16)
+            scores[np.ix_(kept_rows, kept_columns)] = self.scores[
+                np.ix_(source_rows, source_columns)
+            ]
+            rows = sorted(set(range(len(self.pet_ids))) - set(kept_rows))
+            columns = sorted(set(range(len(self.profile_ids))) - set(kept_columns))
+        else:
+            scores = self.scores
+            rows = [i for i in map(self._pet_position, pets) if i is not None]
+            columns = [
+                j for j in map(self._profile_position, profiles) if j is not None
+            ]
+            # Only the changed rows' features need extracting again
+            for i in rows:
+                _overwrite(self.pet_features, i, foster_matching.pet_features([self.pets[i]]))
+            for j in columns:
+                _overwrite(
+                    self.profile_features, j, foster_matching.profile_features([self.profiles[j]])
+                )
+
+        for j in columns:
+            scores[:, j] = self._column_scores(j)
+        for i in rows:
+            scores[i, :] = self._row_scores(i)
+        self.scores = scores
+
+        if profiles_moved:
+            # Column indexes shifted, so every pet's top matches are redone
+            self.best = _top(self.scores)
+        else:
+            if pets_moved:
+                best = np.zeros((len(self.pet_ids), self.best.shape[1]), dtype=self.best.dtype)
+                best[kept_rows] = self.best[source_rows]
+                self.best = best
+            self._update_best(rows, columns)
+        return len(rows), len(columns)
+
+    def _update_best(self, rows: List[int], columns: List[int]):
+        """Redo top matches for ``rows`` and for rows a changed column enters or leaves."""
+        affected = set(rows)
+        if columns and self.best.shape[1]:
+            count = self.scores.shape[1]
+            last = self.best[:, -1]
+            last_keys = self.scores[np.arange(len(last)), last].astype(np.int64) * count + (
+                count - 1 - last
+            )
+            for j in columns:
+                keys = self.scores[:, j].astype(np.int64) * count + (count - 1 - j)
+                affected.update(np.flatnonzero((self.best == j).any(axis=1) | (keys > last_keys)))
+        if affected:
+            index = np.array(sorted(affected), dtype=np.intp)
+            self.best[index] = foster_matching.top_k(self.scores[index], TOP_K)
+
+    def _pet_position(self, pet_id: int) -> Optional[int]:
+        position = bisect.bisect_left(self.pet_ids, pet_id)
+        if position < len(self.pet_ids) and self.pet_ids[position] == pet_id:
+            return position
+        return None
+
+    def _profile_position(self, profile_id: int) -> Optional[int]:
+        position = bisect.bisect_left(self.profile_ids, profile_id)
+        if position < len(self.profile_ids) and self.profile_ids[position] == profile_id:
+            return position
+        return None
+
+    def suggestions(self, pet_id: Optional[int] = None) -> List[Tuple[int, int, int]]:
+        """``(pet_index, profile_index, score)`` for each pet's top positive matches."""
+        if pet_id is not None:
+            position = self._pet_position(pet_id)
+            return [] if position is None else self._pairs([position])
+        if self._suggestions is None:
+            self._suggestions = self._pairs(range(len(self.pet_ids)))
+        return self._suggestions
+
+    def _pairs(self, rows) -> List[Tuple[int, int, int]]:
+        pairs = []
+        for i in rows:
+            for j in self.best[i]:
+                score = int(self.scores[i, j])
+                if score > 0:
+                    pairs.append((i, int(j), score))
+        return pairs
+
+    def plan(self, pet_id: Optional[int] = None) -> List[Tuple[int, int, int]]:
+        """The capacity-constrained assignment (see ``foster_matching.assign``)."""
+        if pet_id is not None:
+            position = self._pet_position(pet_id)
+            if position is None:
+                return []
+            one = foster_matching.PetFeatures(
+                *(field[position:position + 1] for field in self.pet_features)
+            )
+            return [
+                (position, j, score)
+                for _, j, score in foster_matching.assign(one, self.profile_features)
+            ]
+        if self._plan is None:
+            self._plan = foster_matching.assign(self.pet_features, self.profile_features)
+        return self._plan
+
+
+class MatchCache:
+    """Org-keyed ``OrgMatches`` with queued changes, an LRU size bound and hit counters."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl: int = MATCH_CACHE_TTL,
+        max_bytes: int = MATCH_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._entries: "OrderedDict[int, OrgMatches]" = OrderedDict()
+        self._pending: Dict[int, Dict[str, Set[int]]] = {}
+        self._org_locks: Dict[int, threading.Lock] = {}
+        # Orgs whose entry is being built; changes committed meanwhile are kept
+        self._building: Set[int] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.patches = 0
+        self.rebuilds = 0
+        self.evictions = 0
+        self.rows_recomputed = 0
+        self.columns_recomputed = 0
+
+    @contextmanager
+    def use(self, db: Session, org_id: int) -> Iterator[OrgMatches]:
+        """
+        Yield the org's up-to-date match set, patching or rebuilding as
+        needed. Entries are patched in place, so read it only inside the
+        ``with`` block, which holds the org's lock.
+        """
+        if not self.enabled:
+            yield OrgMatches(load_pets(db, org_id), load_profiles(db, org_id), self.clock)
+            return
+
+        with self._lock:
+            org_lock = self._org_locks.setdefault(org_id, threading.Lock())
+        with org_lock:
+            yield self._current(db, org_id)
+
+    def _current(self, db: Session, org_id: int) -> OrgMatches:
+        """Bring the org's entry up to date; the caller holds the org lock."""
+        with self._lock:
+            entry = self._entries.get(org_id)
+            if entry is not None and self._expired(entry):
+                entry = None
+            changes = self._pending.pop(org_id, None)
+            if entry is not None and not changes:
+                self.hits += 1
+                self._entries.move_to_end(org_id)
+                return entry
+
+        if entry is None:
+            # Changes committed from here on are queued and patched next time
+            with self._lock:
+                self._building.add(org_id)
+            try:
+                entry = OrgMatches(load_pets(db, org_id), load_profiles(db, org_id), self.clock)
+            finally:
+                with self._lock:
+                    self._building.discard(org_id)
+            with self._lock:
+                self.rebuilds += 1
+                self._store(org_id, entry)
+            return entry
+
+        profile_ids = set(changes.get("profiles", ()))
+        user_ids = changes.get("users")
+        if user_ids:
+            profile_ids.update(
+                profile.id for profile in entry.profiles if profile.user_id in user_ids
+            )
+        pet_ids = set(changes.get("pets", ()))
+        pets = dict.fromkeys(pet_ids)
+        if pet_ids:
+            pets.update((pet.id, pet) for pet in load_pets(db, org_id, pet_ids))
+        profiles = dict.fromkeys(profile_ids)
+        if profile_ids:
+            profiles.update(
+                (profile.id, profile) for profile in load_profiles(db, org_id, profile_ids)
+            )
+        rows, columns = entry.patch(pets, profiles)
+        with self._lock:
+            self.patches += 1
+            self.rows_recomputed += rows
+            self.columns_recomputed += columns
+            # Re-stored, as the patch may have grown it
+            self._store(org_id, entry)
+        return entry
+
+    def _expired(self, entry: OrgMatches) -> bool:
+        return self.clock() - entry.built_at > self.ttl
+
+    def _store(self, org_id: int, entry: OrgMatches) -> None:
+        """
+        Make ``entry`` the org's most recently used entry, then drop expired
+        entries and evict the least recently used until under ``max_bytes``.
+        The caller holds ``_lock``.
+        """
+        self._entries[org_id] = entry
+        self._entries.move_to_end(org_id)
+        self._drop_expired()
+        total = sum(stored.nbytes for stored in self._entries.values())
+        while total > self.max_bytes:
+            oldest, evicted = self._entries.popitem(last=False)
+            self._pending.pop(oldest, None)
+            total -= evicted.nbytes
+            self.evictions += 1
+
+    def _drop_expired(self) -> None:
+        for org_id in [org_id for org_id, entry in self._entries.items() if self._expired(entry)]:
+            del self._entries[org_id]
+            self._pending.pop(org_id, None)
+
+    def record(self, changes: Dict[Optional[int], Dict[str, Set[int]]]) -> None:
+        """
+        Queue committed changes for orgs that are cached or being built;
+        ``None`` org ids apply to every such org. Other orgs build from the
+        database on their next lookup, so nothing is kept for them.
+        """
+        with self._lock:
+            self._drop_expired()
+            tracked = set(self._entries) | self._building
+            for org_id, kinds in changes.items():
+                targets = tracked if org_id is None else {org_id} & tracked
+                for target in targets:
+                    pending = self._pending.setdefault(target, {})
+                    for kind, ids in kinds.items():
+                        pending.setdefault(kind, set()).update(ids)
+
+    def invalidate(self, org_id: Optional[int] = None) -> None:
+        """Drop one org's entry, or every entry, so the next lookup rebuilds."""
+        with self._lock:
+            if org_id is None:
+                self._entries.clear()
+                self._pending.clear()
+            else:
+                self._entries.pop(org_id, None)
+                self._pending.pop(org_id, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        self.invalidate()
+        with self._lock:
+            self.hits = self.patches = self.rebuilds = self.evictions = 0
+            self.rows_recomputed = self.columns_recomputed = 0
+
+    def info(self, org_id: Optional[int] = None) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.patches + self.rebuilds
+            result = {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl,
+                "entries": len(self._entries),
+                "bytes": sum(entry.nbytes for entry in self._entries.values()),
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "hits": self.hits,
+                "patches": self.patches,
+                "rebuilds": self.rebuilds,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "rows_recomputed": self.rows_recomputed,
+                "columns_recomputed": self.columns_recomputed,
+            }
+            entry = self._entries.get(org_id)
+            if org_id is not None:
+                pending = self._pending.get(org_id, {})
+                result["org"] = {
+                    "cached": entry is not None,
+                    "age_seconds": round(self.clock() - entry.built_at, 3) if entry else None,
+                    "pets": len(entry.pet_ids) if entry else None,
+                    "fosters": len(entry.profile_ids) if entry else None,
+                    "pending_changes": sum(len(ids) for ids in pending.values()),
+                }
+            return result
+
+
+cache = MatchCache(enabled=MATCH_CACHE_ENABLED)
+
+
+# ----------------------------------------------------------------------------
+# Write-driven invalidation
+# ----------------------------------------------------------------------------
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    changes = session.info.setdefault(_PENDING_KEY, {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        kind = _TRACKED.get(getattr(obj, "__tablename__", None))
+        if kind is None or obj.id is None:
+            continue
+        changes.setdefault(getattr(obj, "org_id", None), {}).setdefault(kind, set()).add(obj.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _drop_on_bulk_write(state):
+    if not (state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is None or mapper.local_table.name not in _TRACKED:
+        return
+    changed_ids = state.execution_options.get("changed_ids")
+    if changed_ids is None:
+        # Which rows changed is unknown; rebuild everything once committed
+        state.session.info[_PENDING_KEY + ":drop"] = True
+        return
+    changes = state.session.info.setdefault(_PENDING_KEY, {})
+    kinds = changes.setdefault(state.execution_options.get("org_id"), {})
+    kinds.setdefault(_TRACKED[mapper.local_table.name], set()).update(changed_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _queue_changes(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    if session.info.pop(_PENDING_KEY + ":drop", False):
+        cache.invalidate()
+        return
+    if not changes:
+        return
+    try:
+        cache.record(changes)
+    except Exception:
+        logger.exception("Failed to queue match cache changes")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PENDING_KEY + ":drop", None)
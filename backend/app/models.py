@@ -2,6 +2,7 @@ import enum
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
     Date,
@@ -9,9 +10,13 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    event,
+    text,
 )
 from sqlalchemy.orm import relationship
 
@@ -101,6 +106,14 @@ class PaymentPurpose(str, enum.Enum):
     other = "other"
 
 
+class ExportJobStatus(str, enum.Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+    expired = "expired"  # artifact removed by the retention sweep
+
+
 class Organization(Base):
     __tablename__ = "organizations"
 
@@ -116,6 +129,9 @@ class Organization(Base):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_org_id", "org_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -145,6 +161,9 @@ class Role(Base):
 
 class UserRole(Base):
     __tablename__ = "user_roles"
+    __table_args__ = (
+        Index("ix_user_roles_user_id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -178,6 +197,14 @@ class RefreshToken(Base):
 
 class Pet(Base):
     __tablename__ = "pets"
+    __table_args__ = (
+        Index("ix_pets_org_id_status", "org_id", "status"),
+        Index("ix_pets_org_id_foster_user_id", "org_id", "foster_user_id"),
+        Index("ix_pets_org_id_created_at", "org_id", "created_at"),
+        Index("ix_pets_org_id_updated_at", "org_id", "updated_at"),
+        Index("ix_pets_org_id_needs_medical_needs_behavioral", "org_id", "needs_medical", "needs_behavioral"),
+        Index("ix_pets_org_id_date_of_birth", "org_id", "date_of_birth"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -198,10 +225,15 @@ class Pet(Base):
     status = Column(Enum(PetStatus), default=PetStatus.intake)
     description_public = Column(Text, nullable=True)
     description_internal = Column(Text, nullable=True)
+    # Derived from description_internal by care_needs.apply
+    needs_medical = Column(Boolean, nullable=False, default=False)
+    needs_behavioral = Column(Boolean, nullable=False, default=False)
+    care_keywords = Column(String, nullable=True)  # Comma-separated list
     photo_url = Column(String, nullable=True)
     foster_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     adopter_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     organization = relationship("Organization", back_populates="pets")
     medical_records = relationship("MedicalRecord", back_populates="pet")
@@ -210,9 +242,53 @@ class Pet(Base):
     adopter = relationship("User", foreign_keys=[adopter_user_id])
 
 
+# Full-text search index over pets (see pet_search), created with the pets
+# table so create_all matches migration 014_add_pet_search. Keep the two in
+# sync.
+PET_SEARCH_COLUMNS = ("name", "species", "breed", "color", "description_public")
+
+_columns = ", ".join(PET_SEARCH_COLUMNS)
+_new = ", ".join(f"new.{name}" for name in PET_SEARCH_COLUMNS)
+_old = ", ".join(f"old.{name}" for name in PET_SEARCH_COLUMNS)
+
+PET_SEARCH_SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS pets_fts USING fts5("
+    f"{_columns}, content='pets', content_rowid='id', "
+    f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS pets_fts_insert AFTER INSERT ON pets BEGIN "
+    f"INSERT INTO pets_fts(rowid, {_columns}) VALUES (new.id, {_new}); END",
+    f"CREATE TRIGGER IF NOT EXISTS pets_fts_delete AFTER DELETE ON pets BEGIN "
+    f"INSERT INTO pets_fts(pets_fts, rowid, {_columns}) VALUES ('delete', old.id, {_old}); END",
+    f"CREATE TRIGGER IF NOT EXISTS pets_fts_update AFTER UPDATE OF {_columns} ON pets BEGIN "
+    f"INSERT INTO pets_fts(pets_fts, rowid, {_columns}) VALUES ('delete', old.id, {_old}); "
+    f"INSERT INTO pets_fts(rowid, {_columns}) VALUES (new.id, {_new}); END",
+]
+PET_SEARCH_SQLITE_DROP = "DROP TABLE IF EXISTS pets_fts"
+
+PET_SEARCH_POSTGRES_DDL = [
+    "ALTER TABLE pets ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('simple', "
+    + " || ' ' || ".join(f"coalesce({name}, '')" for name in PET_SEARCH_COLUMNS)
+    + ")) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_pets_search_vector ON pets USING GIN (search_vector)",
+]
+
+for _statement in PET_SEARCH_SQLITE_DDL:
+    event.listen(Pet.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in PET_SEARCH_POSTGRES_DDL:
+    event.listen(Pet.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+# The virtual table is not part of the metadata; drop it with pets so a
+# recreated table does not inherit stale index entries
+event.listen(Pet.__table__, "before_drop", DDL(PET_SEARCH_SQLITE_DROP).execute_if(dialect="sqlite"))
+
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_org_id_status_created_at", "org_id", "status", "created_at"),
+        Index("ix_applications_org_id_applicant_user_id", "org_id", "applicant_user_id"),
+        Index("ix_applications_org_id_updated_at", "org_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -223,6 +299,7 @@ class Application(Base):
     status = Column(Enum(ApplicationStatus), default=ApplicationStatus.submitted)
     answers_json = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     organization = relationship("Organization", back_populates="applications")
     applicant = relationship("User")
@@ -232,6 +309,10 @@ class Application(Base):
 
 class FosterProfile(Base):
     __tablename__ = "foster_profiles"
+    __table_args__ = (
+        Index("ix_foster_profiles_org_id_is_available", "org_id", "is_available"),
+        Index("ix_foster_profiles_org_id_updated_at", "org_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, unique=True)
@@ -285,6 +366,13 @@ class FosterProfile(Base):
 
 class FosterPlacement(Base):
     __tablename__ = "foster_placements"
+    __table_args__ = (
+        Index("ix_foster_placements_org_id_outcome", "org_id", "outcome"),
+        Index("ix_foster_placements_pet_id", "pet_id"),
+        Index("ix_foster_placements_foster_profile_id_outcome", "foster_profile_id", "outcome"),
+        Index("ix_foster_placements_org_id_updated_at", "org_id", "updated_at"),
+        Index("ix_foster_placements_org_id_created_at_id", "org_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -336,6 +424,9 @@ class FosterPlacementNote(Base):
 
 class MedicalRecord(Base):
     __tablename__ = "medical_records"
+    __table_args__ = (
+        Index("ix_medical_records_pet_id_date", "pet_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -352,6 +443,9 @@ class MedicalRecord(Base):
 
 class Appointment(Base):
     __tablename__ = "appointments"
+    __table_args__ = (
+        Index("ix_appointments_org_id_date_time", "org_id", "date_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -366,6 +460,9 @@ class Appointment(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_org_id_start_datetime", "org_id", "start_datetime"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -381,6 +478,10 @@ class Event(Base):
 
 class EventSignup(Base):
     __tablename__ = "event_signups"
+    __table_args__ = (
+        Index("ix_event_signups_event_id", "event_id"),
+        Index("ix_event_signups_user_id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
@@ -393,6 +494,10 @@ class EventSignup(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_org_id_status", "org_id", "status"),
+        Index("ix_tasks_org_id_assigned_to_user_id", "org_id", "assigned_to_user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -425,6 +530,10 @@ class ExpenseCategory(Base):
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_org_id_date_incurred", "org_id", "date_incurred"),
+        Index("ix_expenses_org_id_updated_at", "org_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -436,10 +545,14 @@ class Expense(Base):
     vendor_name = Column(String, nullable=True)
     recorded_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class MessageThread(Base):
     __tablename__ = "message_threads"
+    __table_args__ = (
+        Index("ix_message_threads_org_id_created_at", "org_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -455,6 +568,9 @@ class MessageThread(Base):
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_thread_id_sent_at", "thread_id", "sent_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     thread_id = Column(Integer, ForeignKey("message_threads.id"), nullable=False)
@@ -465,6 +581,10 @@ class Message(Base):
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        Index("ix_payments_org_id_status_created_at", "org_id", "status", "created_at"),
+        Index("ix_payments_org_id_updated_at", "org_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -478,6 +598,7 @@ class Payment(Base):
     status = Column(Enum(PaymentStatus), default=PaymentStatus.pending)
     status_detail = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class DocumentVisibility(enum.Enum):
@@ -489,6 +610,10 @@ class DocumentVisibility(enum.Enum):
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_org_id_created_at", "org_id", "created_at"),
+        Index("ix_documents_person_id", "person_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -544,6 +669,9 @@ class Coupon(Base):
 
 class Person(Base):
     __tablename__ = "people"
+    __table_args__ = (
+        Index("ix_people_org_id_updated_at", "org_id", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -600,6 +728,9 @@ class Person(Base):
 
 class PersonNote(Base):
     __tablename__ = "person_notes"
+    __table_args__ = (
+        Index("ix_person_notes_person_id", "person_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -615,6 +746,10 @@ class PersonNote(Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_org_id_created_at", "org_id", "created_at"),
+        Index("ix_audit_logs_org_id_entity_type_entity_id", "org_id", "entity_type", "entity_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
@@ -624,3 +759,84 @@ class AuditLog(Base):
     action = Column(String, nullable=False)
     details = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class OrgDailyMetric(Base):
+    """Per-org daily rollup backing the /stats trend endpoints (see rollups.py)"""
+    __tablename__ = "org_daily_metrics"
+    __table_args__ = (
+        UniqueConstraint("org_id", "day", "metric", name="uq_org_daily_metrics_org_day_metric"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    metric = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    total = Column(Float, nullable=False, default=0.0)
+
+
+class UserActivityDaily(Base):
+    """Per-user daily action counts fed by audit.log_action (see rollups.py)"""
+    __tablename__ = "user_activity_daily"
+    __table_args__ = (
+        UniqueConstraint("org_id", "day", "user_id", name="uq_user_activity_daily_org_day_user"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    action_count = Column(Integer, nullable=False, default=0)
+
+
+class PetStatusEvent(Base):
+    """One row per pet status transition (see pet_status.py)"""
+    __tablename__ = "pet_status_events"
+    __table_args__ = (
+        Index("ix_pet_status_events_org_to_status_changed", "org_id", "to_status", "changed_at"),
+        Index("ix_pet_status_events_pet_changed", "pet_id", "changed_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    pet_id = Column(Integer, ForeignKey("pets.id"), nullable=False)
+    from_status = Column(Enum(PetStatus), nullable=True)  # NULL for the initial status
+    to_status = Column(Enum(PetStatus), nullable=False)
+    changed_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    changed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    pet = relationship("Pet")
+
+
+class ExportJob(Base):
+    """A report export written to disk in the background (see export_jobs.py)"""
+    __tablename__ = "export_jobs"
+    __table_args__ = (
+        Index("ix_export_jobs_org_id_dedupe_key_created_at", "org_id", "dedupe_key", "created_at"),
+        # One unfinished job per export, so identical concurrent requests share it
+        Index(
+            "uq_export_jobs_org_id_dedupe_key_unfinished",
+            "org_id",
+            "dedupe_key",
+            unique=True,
+            sqlite_where=text("status IN ('pending', 'running')"),
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    org_id = Column(Integer, ForeignKey("organizations.id"), nullable=False)
+    requested_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    report = Column(String, nullable=False)
+    params_json = Column(Text, nullable=False, default="{}")
+    dedupe_key = Column(String(64), nullable=False)
+    status = Column(Enum(ExportJobStatus), nullable=False, default=ExportJobStatus.pending)
+    total_rows = Column(Integer, nullable=True)
+    rows_written = Column(Integer, nullable=False, default=0)
+    file_path = Column(String, nullable=True)  # relative to EXPORT_ROOT
+    size_bytes = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
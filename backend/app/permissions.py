@@ -20,7 +20,7 @@ ROLE_VOLUNTEER = "volunteer"
 ROLE_BOARD_MEMBER = "board_member"
 
 
-def _user_has_any_role(user: models.User, db: Session, role_names: List[str]) -> bool:
+def user_has_any_role(user: models.User, db: Session, role_names: List[str]) -> bool:
     """
     Return True if the user has at least one of the given roles.
     If role_names is empty, treat it as no restriction.
@@ -47,7 +47,7 @@ def require_any_role(role_names: List[str]):
         current_user: models.User = Depends(get_current_user),
         db: Session = Depends(get_db),
     ) -> models.User:
-        if not _user_has_any_role(current_user, db, role_names):
+        if not user_has_any_role(current_user, db, role_names):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
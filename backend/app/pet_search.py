@@ -0,0 +1,111 @@
+"""
+Full-text search, age ranges and facet counts for the pet list.
+
+The ``models.PET_SEARCH_COLUMNS`` (name, species, breed, color and public
+description) are indexed for prefix search, so each typed word matches the
+start of a word in any of them:
+
+- SQLite: an external-content FTS5 table ``pets_fts`` keyed by ``pets.id``,
+  kept in sync by insert/update/delete triggers on ``pets``
+- Postgres: a generated ``pets.search_vector`` tsvector column with a GIN
+  index
+
+Both are created with the ``pets`` table (the DDL is registered next to
+``models.Pet``, so ``create_all`` includes it) or by migration
+``014_add_pet_search``. They are maintained by the database itself, so bulk
+statements stay in sync too.
+"""
+import re
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    String,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    select,
+    table,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from . import models
+
+FTS_TABLE = table("pets_fts", column("rowid"))
+FACETS = ("species", "status", "sex", "altered_status")
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def words(text: Optional[str]) -> List[str]:
+    return _WORD.findall(text.lower()) if text else []
+
+
+def matches(db: Session, text: str):
+    """
+    Predicate for pets matching every word of ``text`` as a prefix, or None
+    when ``text`` has no words.
+    """
+    terms = words(text)
+    if not terms:
+        return None
+    if db.get_bind().dialect.name == "postgresql":
+        query = " & ".join(f"{term}:*" for term in terms)
+        return literal_column("pets.search_vector").op("@@")(func.to_tsquery("simple", query))
+    query = " ".join(f'"{term}"*' for term in terms)
+    return models.Pet.id.in_(
+        select(FTS_TABLE.c.rowid).where(literal_column("pets_fts").op("MATCH")(query))
+    )
+
+
+def _years_before(day: date, years: int) -> date:
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:  # 29 February
+        return day.replace(year=day.year - years, day=28)
+
+
+def age_range(min_age: Optional[int], max_age: Optional[int], today: Optional[date] = None) -> list:
+    """
+    ``date_of_birth`` range predicates for pets aged ``min_age`` to
+    ``max_age`` whole years. Pets without a birth date never match.
+    """
+    today = today or date.today()
+    predicates = []
+    if min_age is not None:
+        predicates.append(models.Pet.date_of_birth <= _years_before(today, min_age))
+    if max_age is not None:
+        predicates.append(models.Pet.date_of_birth > _years_before(today, max_age + 1))
+    return predicates
+
+
+def facet_counts(db: Session, statement) -> Dict[str, Dict[str, int]]:
+    """
+    Count the pets ``statement`` selects by each of ``FACETS``, in one
+    query. Missing values are counted under ``"unknown"``.
+    """
+    filtered = (
+        statement.with_only_columns(*(getattr(models.Pet, facet) for facet in FACETS))
+        .order_by(None)
+        .limit(None)
+        .cte("filtered_pets")
+    )
+    rows = db.execute(
+        union_all(
+            *(
+                select(
+                    literal(facet).label("facet"),
+                    cast(filtered.c[facet], String).label("value"),
+                    func.count().label("count"),
+                ).group_by(filtered.c[facet])
+                for facet in FACETS
+            )
+        )
+    ).all()
+    counts: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+    for facet, value, count in rows:
+        counts[facet][value if value is not None else "unknown"] = count
+    return counts
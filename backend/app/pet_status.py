@@ -0,0 +1,48 @@
+"""
+Pet status transition log.
+
+Every write path that changes ``Pet.status`` calls ``record_change`` in the
+same transaction, which appends a ``PetStatusEvent`` and keeps the daily
+adoption rollup in step. Adoption and time-in-status analytics are SQL
+aggregates over this table.
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from . import models, rollups
+
+
+def _status_value(status):
+    return status.value if hasattr(status, "value") else status
+
+
+def record_change(
+    db: Session,
+    pet: models.Pet,
+    previous_status,
+    user_id: Optional[int] = None,
+) -> Optional[models.PetStatusEvent]:
+    """
+    Log a transition from ``previous_status`` to the pet's current status.
+
+    Pass ``previous_status=None`` when the pet is first created. Returns the
+    new event, or None when the status did not change. The caller commits.
+    """
+    if previous_status is not None and _status_value(previous_status) == _status_value(
+        pet.status
+    ):
+        return None
+
+    event = models.PetStatusEvent(
+        org_id=pet.org_id,
+        pet=pet,
+        from_status=previous_status,
+        to_status=pet.status or models.PetStatus.intake,
+        changed_by_user_id=user_id,
+        changed_at=datetime.utcnow(),
+    )
+    db.add(event)
+    rollups.record_pet_status_changed(db, pet, previous_status)
+    return event
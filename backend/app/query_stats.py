@@ -0,0 +1,130 @@
+"""
+Per-request SQL instrumentation.
+
+SQLAlchemy ``before/after_cursor_execute`` listeners count statements and
+database time for the current request. ``QueryStatsMiddleware`` exposes the
+totals as ``X-DB-Queries`` / ``X-DB-Time-ms`` response headers and logs a
+warning when one normalized statement runs more than
+``N_PLUS_ONE_THRESHOLD`` times in a single request, which is the signature
+of an N+1 query pattern.
+"""
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "10"))
+
+QUERY_COUNT_HEADER = "X-DB-Queries"
+QUERY_TIME_HEADER = "X-DB-Time-ms"
+
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(\?|%\([^)]*\)s|:\w+)(\s*,\s*(\?|%\([^)]*\)s|:\w+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Statement counts and timings collected for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed = 0.0
+        self.statements = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self.elapsed * 1000.0
+
+    def add(self, statement: str, elapsed: float) -> None:
+        key = normalize_statement(statement)
+        with self._lock:
+            self.count += 1
+            self.elapsed += elapsed
+            self.statements[key] += 1
+
+    def repeated(self, threshold: int):
+        """Return ``[(statement, count)]`` executed more than ``threshold`` times."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count > threshold
+        ]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current() -> Optional[QueryStats]:
+    """Return the stats collector for the active request, if any."""
+    return _current.get()
+
+
+def normalize_statement(statement: str) -> str:
+    """Collapse whitespace and expanded IN-lists so equivalent SQL compares equal."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    return _PLACEHOLDER_LIST.sub("(?)", statement)
+
+
+# The start time lives on the statement's execution context, not the
+# connection: after_cursor_execute does not fire when a statement raises, and
+# a value left on a pooled connection would be read by a later statement.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and context is not None:
+        context._query_stats_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    start = getattr(context, "_query_stats_start", None)
+    if stats is None or start is None:
+        return
+    stats.add(statement, time.perf_counter() - start)
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware that scopes a ``QueryStats`` collector to each request."""
+
+    def __init__(self, app, threshold: Optional[int] = None):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers[QUERY_COUNT_HEADER] = str(stats.count)
+                headers[QUERY_TIME_HEADER] = f"{stats.elapsed_ms:.1f}"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current.reset(token)
+            threshold = self.threshold if self.threshold is not None else N_PLUS_ONE_THRESHOLD
+            for statement, count in stats.repeated(threshold):
+                logger.warning(
+                    "Possible N+1: statement ran %d times during %s %s: %s",
+                    count,
+                    scope.get("method"),
+                    scope.get("path"),
+                    statement,
+                )
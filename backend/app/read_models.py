@@ -0,0 +1,60 @@
+"""
+Projected read path for reports and analytics.
+
+Statements are Core ``select()`` over table columns and run on the session's
+connection, so results come back as lightweight named rows: no identity map,
+no instance state or attribute instrumentation, and columns a handler does
+not name (``description_internal``, ``answers_json``, ...) are never fetched.
+
+Use it for read-only row sets; anything that modifies rows keeps using ORM
+instances.
+"""
+from typing import Iterator, List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+# Rows fetched per round trip when streaming
+DEFAULT_BATCH_SIZE = 500
+
+
+def table(model):
+    """The Core table behind a mapped class."""
+    return model.__table__
+
+
+def columns(model, *names: str) -> list:
+    """Core columns of ``model`` by attribute name, for ``select(*columns(...))``."""
+    c = model.__table__.c
+    return [c[name] for name in names]
+
+
+def rows(db: Session, statement) -> List[Row]:
+    """Execute ``statement`` and return all rows."""
+    return db.connection().execute(statement).all()
+
+
+def stream(db: Session, statement, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Row]:
+    """Yield rows from a server-side cursor, ``batch_size`` rows per fetch."""
+    result = db.connection().execute(statement.execution_options(yield_per=batch_size))
+    try:
+        yield from result
+    finally:
+        result.close()
+
+
+def scalar(db: Session, statement):
+    """Execute ``statement`` and return the first column of the first row."""
+    return db.connection().execute(statement).scalar()
+
+
+def count(db: Session, statement) -> int:
+    """Number of rows ``statement`` would return."""
+    subquery = statement.order_by(None).subquery()
+    return scalar(db, select(func.count()).select_from(subquery)) or 0
+
+
+def max_of(db: Session, statement, column) -> Optional[object]:
+    """Largest value of ``column`` over the rows ``statement`` selects."""
+    return scalar(db, statement.with_only_columns(func.max(column)).order_by(None))
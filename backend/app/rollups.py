@@ -0,0 +1,449 @@
+"""
+Daily metrics rollup.
+
+``org_daily_metrics`` holds one row per (org, day, metric) with a running
+count and amount total. Write paths call the ``record_*`` helpers in the
+same transaction as the change they describe, and the /stats trend
+endpoints read the rollup instead of grouping raw tables.
+
+Dimensioned metrics are stored as ``"<metric>:<value>"`` (for example
+``"payment_purpose:donation"``) so a single table serves every breakdown.
+Payments without a provider are stored under an empty dimension.
+
+There are no edit or delete endpoints for payments and expenses, so
+changes made outside the write paths (admin scripts, SQL) are only picked
+up by ``rebuild``. ``rebuild_rollups.py --days N`` recomputes just the
+recent days and is cheap enough to run on a schedule.
+"""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models, stats_cache, timebuckets
+
+PET_INTAKE = "pet_intake"
+PET_ADOPTED = "pet_adopted"
+APPLICATION_TYPE = "application_type"
+APPLICATION_STATUS = "application_status"
+PAYMENT_PURPOSE = "payment_purpose"
+PAYMENT_PROVIDER = "payment_provider"
+EXPENSE = "expense"
+
+
+def metric_key(metric: str, value=None) -> str:
+    """Return the stored metric name, optionally qualified by a dimension."""
+    if value is None:
+        return metric
+    value = value.value if hasattr(value, "value") else str(value)
+    return f"{metric}:{value}"
+
+
+def _as_day(value) -> date:
+    if value is None:
+        return datetime.utcnow().date()
+    return timebuckets.bucket_date(value)
+
+
+def _increment(db: Session, model, keys: Dict, increments: Dict) -> None:
+    """
+    Add ``increments`` to the row of ``model`` identified by ``keys``.
+
+    Uses an atomic INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and SQLite
+    so concurrent writers never lose increments. The caller commits.
+    """
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(table).values(**keys, **increments)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(keys),
+            set_={
+                column: table.c[column] + stmt.excluded[column]
+                for column in increments
+            },
+        )
+        db.execute(stmt)
+        return
+
+    row = (
+        db.query(model)
+        .filter(*(getattr(model, column) == value for column, value in keys.items()))
+        .first()
+    )
+    if row is None:
+        db.add(model(**keys, **increments))
+    else:
+        for column, value in increments.items():
+            setattr(row, column, getattr(row, column) + value)
+
+
+def record(
+    db: Session,
+    org_id: int,
+    day,
+    metric: str,
+    count: int = 1,
+    amount: float = 0.0,
+) -> None:
+    """Add ``count`` and ``amount`` to the (org, day, metric) rollup row."""
+    _increment(
+        db,
+        models.OrgDailyMetric,
+        {"org_id": org_id, "day": _as_day(day), "metric": metric},
+        {"count": count, "total": amount or 0.0},
+    )
+
+
+def record_user_activity(
+    db: Session, org_id: int, user_id: int, day=None, count: int = 1
+) -> None:
+    """Add ``count`` actions to the user's ``user_activity_daily`` row."""
+    _increment(
+        db,
+        models.UserActivityDaily,
+        {"org_id": org_id, "day": _as_day(day), "user_id": user_id},
+        {"action_count": count},
+    )
+
+
+# ----------------------------------------------------------------------------
+# Write-path helpers
+# ----------------------------------------------------------------------------
+
+
+def record_pet_created(db: Session, pet: models.Pet) -> None:
+    """Count a new pet's intake; its initial status goes through pet_status."""
+    if pet.intake_date:
+        record(db, pet.org_id, pet.intake_date, PET_INTAKE)
+
+
+def record_pet_intake_changed(
+    db: Session, pet: models.Pet, previous_intake_date: Optional[date]
+) -> None:
+    if previous_intake_date == pet.intake_date:
+        return
+    if previous_intake_date:
+        record(db, pet.org_id, previous_intake_date, PET_INTAKE, count=-1)
+    if pet.intake_date:
+        record(db, pet.org_id, pet.intake_date, PET_INTAKE)
+
+
+def record_pet_status_changed(db: Session, pet: models.Pet, previous_status) -> None:
+    """Count an adoption on the day a pet enters the adopted status."""
+    if (
+        pet.status == models.PetStatus.adopted
+        and previous_status != models.PetStatus.adopted
+    ):
+        record(db, pet.org_id, None, PET_ADOPTED)
+
+
+def record_application_created(db: Session, app: models.Application) -> None:
+    day = app.created_at or datetime.utcnow()
+    status = app.status or models.ApplicationStatus.submitted
+    record(db, app.org_id, day, metric_key(APPLICATION_TYPE, app.type))
+    record(db, app.org_id, day, metric_key(APPLICATION_STATUS, status))
+
+
+def record_application_status_changed(
+    db: Session, app: models.Application, previous_status
+) -> None:
+    """Move an application between status buckets on its submission day."""
+    if previous_status == app.status:
+        return
+    day = app.created_at
+    record(db, app.org_id, day, metric_key(APPLICATION_STATUS, previous_status), -1)
+    record(db, app.org_id, day, metric_key(APPLICATION_STATUS, app.status))
+
+
+def _record_completed_payment(db: Session, payment: models.Payment, sign: int) -> None:
+    amount = sign * (payment.amount or 0.0)
+    record(
+        db,
+        payment.org_id,
+        payment.created_at,
+        metric_key(PAYMENT_PURPOSE, payment.purpose),
+        sign,
+        amount,
+    )
+    record(
+        db,
+        payment.org_id,
+        payment.created_at,
+        metric_key(PAYMENT_PROVIDER, payment.provider or ""),
+        sign,
+        amount,
+    )
+
+
+def record_payment_created(db: Session, payment: models.Payment) -> None:
+    if payment.status == models.PaymentStatus.completed:
+        _record_completed_payment(db, payment, 1)
+
+
+def record_payment_status_changed(
+    db: Session, payment: models.Payment, previous_status
+) -> None:
+    """Only completed payments are counted; track moves in and out of it."""
+    was_completed = previous_status == models.PaymentStatus.completed
+    is_completed = payment.status == models.PaymentStatus.completed
+    if is_completed and not was_completed:
+        _record_completed_payment(db, payment, 1)
+    elif was_completed and not is_completed:
+        _record_completed_payment(db, payment, -1)
+
+
+def record_expense_created(db: Session, expense: models.Expense) -> None:
+    record(db, expense.org_id, expense.date_incurred, EXPENSE, 1, expense.amount)
+
+
+# ----------------------------------------------------------------------------
+# Read helpers
+# ----------------------------------------------------------------------------
+
+
+def daily_series(
+    db: Session, org_id: int, since: date, metric: str, prefix: bool = False
+):
+    """
+    Return ``[(day, count, total)]`` for a metric, oldest first.
+
+    With ``prefix=True`` every dimension of ``metric`` is summed per day.
+    """
+    metric_filter = (
+        models.OrgDailyMetric.metric.like(f"{metric}:%")
+        if prefix
+        else models.OrgDailyMetric.metric == metric
+    )
+    return (
+        db.query(
+            models.OrgDailyMetric.day,
+            func.sum(models.OrgDailyMetric.count),
+            func.sum(models.OrgDailyMetric.total),
+        )
+        .filter(
+            models.OrgDailyMetric.org_id == org_id,
+            models.OrgDailyMetric.day >= since,
+            metric_filter,
+        )
+        .group_by(models.OrgDailyMetric.day)
+        .having(func.sum(models.OrgDailyMetric.count) != 0)
+        .order_by(models.OrgDailyMetric.day)
+        .all()
+    )
+
+
+def breakdown(
+    db: Session, org_id: int, since: date, metric: str
+) -> Dict[str, Tuple[int, float]]:
+    """Return ``{dimension: (count, total)}`` for a dimensioned metric."""
+    rows = (
+        db.query(
+            models.OrgDailyMetric.metric,
+            func.sum(models.OrgDailyMetric.count),
+            func.sum(models.OrgDailyMetric.total),
+        )
+        .filter(
+            models.OrgDailyMetric.org_id == org_id,
+            models.OrgDailyMetric.day >= since,
+            models.OrgDailyMetric.metric.like(f"{metric}:%"),
+        )
+        .group_by(models.OrgDailyMetric.metric)
+        .all()
+    )
+    prefix_len = len(metric) + 1
+    return {
+        name[prefix_len:]: (int(count), float(total or 0.0))
+        for name, count, total in rows
+        if count
+    }
+
+
+def active_users(db: Session, org_id: int, since: date) -> int:
+    """Return how many distinct users acted on or after ``since``."""
+    return (
+        db.query(func.count(models.UserActivityDaily.user_id.distinct()))
+        .filter(
+            models.UserActivityDaily.org_id == org_id,
+            models.UserActivityDaily.day >= since,
+        )
+        .scalar()
+        or 0
+    )
+
+
+def first_active_users(db: Session, org_id: int, since: date) -> int:
+    """Return how many users' first recorded activity is on or after ``since``."""
+    first_days = (
+        db.query(models.UserActivityDaily.user_id)
+        .filter(models.UserActivityDaily.org_id == org_id)
+        .group_by(models.UserActivityDaily.user_id)
+        .having(func.min(models.UserActivityDaily.day) >= since)
+        .subquery()
+    )
+    return db.query(func.count()).select_from(first_days).scalar() or 0
+
+
+# ----------------------------------------------------------------------------
+# Rebuild
+# ----------------------------------------------------------------------------
+
+
+def rebuild(
+    db: Session, org_id: Optional[int] = None, since: Optional[date] = None
+) -> int:
+    """
+    Recompute the rollup from the raw tables and return the rows written.
+
+    With ``since``, only rollup days on or after it are recomputed; older
+    rows are left as they are.
+
+    Adoptions are counted on the day of each adopted transition in
+    ``pet_status_events``; adopted pets that predate the log are counted on
+    the day they were created.
+    """
+    buckets: Dict[Tuple[int, date, str], list] = defaultdict(lambda: [0, 0.0])
+
+    def add(rows, metric_for_row):
+        for row in rows:
+            org, day, key, count, total = metric_for_row(row)
+            if day is None:
+                continue
+            bucket = buckets[(org, _as_day(day), key)]
+            bucket[0] += count
+            bucket[1] += float(total or 0.0)
+
+    start = datetime.combine(since, datetime.min.time()) if since is not None else None
+
+    def scoped(query, model, day_column):
+        if org_id is not None:
+            query = query.filter(model.org_id == org_id)
+        if start is not None:
+            query = query.filter(day_column >= start)
+        return query
+
+    Pet = models.Pet
+    intake_day = timebuckets.bucket(db, Pet.intake_date, "day")
+    add(
+        scoped(
+            db.query(Pet.org_id, intake_day, func.count(Pet.id)), Pet, Pet.intake_date
+        ).filter(Pet.intake_date.isnot(None)).group_by(Pet.org_id, intake_day),
+        lambda r: (r[0], r[1], PET_INTAKE, r[2], 0.0),
+    )
+    Event = models.PetStatusEvent
+    adopted_day = timebuckets.bucket(db, Event.changed_at, "day")
+    add(
+        scoped(
+            db.query(Event.org_id, adopted_day, func.count(Event.id)), Event, Event.changed_at
+        )
+        .filter(Event.to_status == models.PetStatus.adopted)
+        .group_by(Event.org_id, adopted_day),
+        lambda r: (r[0], r[1], PET_ADOPTED, r[2], 0.0),
+    )
+    logged_adoptions = db.query(Event.pet_id).filter(
+        Event.to_status == models.PetStatus.adopted
+    )
+    created_day = timebuckets.bucket(db, Pet.created_at, "day")
+    add(
+        scoped(db.query(Pet.org_id, created_day, func.count(Pet.id)), Pet, Pet.created_at)
+        .filter(
+            Pet.status == models.PetStatus.adopted,
+            Pet.id.notin_(logged_adoptions),
+        )
+        .group_by(Pet.org_id, created_day),
+        lambda r: (r[0], r[1], PET_ADOPTED, r[2], 0.0),
+    )
+
+    App = models.Application
+    app_day = timebuckets.bucket(db, App.created_at, "day")
+    add(
+        scoped(
+            db.query(App.org_id, app_day, App.type, func.count(App.id)), App, App.created_at
+        )
+        .group_by(App.org_id, app_day, App.type),
+        lambda r: (r[0], r[1], metric_key(APPLICATION_TYPE, r[2]), r[3], 0.0),
+    )
+    add(
+        scoped(
+            db.query(App.org_id, app_day, App.status, func.count(App.id)), App, App.created_at
+        )
+        .group_by(App.org_id, app_day, App.status),
+        lambda r: (r[0], r[1], metric_key(APPLICATION_STATUS, r[2]), r[3], 0.0),
+    )
+
+    Pay = models.Payment
+    pay_day = timebuckets.bucket(db, Pay.created_at, "day")
+    for column, metric in ((Pay.purpose, PAYMENT_PURPOSE), (Pay.provider, PAYMENT_PROVIDER)):
+        add(
+            scoped(
+                db.query(
+                    Pay.org_id, pay_day, column, func.count(Pay.id), func.sum(Pay.amount)
+                ),
+                Pay,
+                Pay.created_at,
+            )
+            .filter(Pay.status == models.PaymentStatus.completed)
+            .group_by(Pay.org_id, pay_day, column),
+            lambda r, metric=metric: (
+                r[0], r[1], metric_key(metric, r[2] or ""), r[3], r[4]
+            ),
+        )
+
+    Exp = models.Expense
+    exp_day = timebuckets.bucket(db, Exp.date_incurred, "day")
+    add(
+        scoped(
+            db.query(Exp.org_id, exp_day, func.count(Exp.id), func.sum(Exp.amount)),
+            Exp,
+            Exp.date_incurred,
+        ).group_by(Exp.org_id, exp_day),
+        lambda r: (r[0], r[1], EXPENSE, r[2], r[3]),
+    )
+
+    delete_query = db.query(models.OrgDailyMetric)
+    if org_id is not None:
+        delete_query = delete_query.filter(models.OrgDailyMetric.org_id == org_id)
+    if since is not None:
+        delete_query = delete_query.filter(models.OrgDailyMetric.day >= since)
+    delete_query.delete(synchronize_session=False)
+
+    db.bulk_insert_mappings(
+        models.OrgDailyMetric,
+        [
+            {"org_id": org, "day": day, "metric": key, "count": count, "total": total}
+            for (org, day, key), (count, total) in buckets.items()
+        ],
+    )
+    db.commit()
+    stats_cache.cache.invalidate(org_id, [models.OrgDailyMetric.__tablename__])
+    return len(buckets)
+
+
+def rebuild_user_activity(db: Session, org_id: Optional[int] = None) -> int:
+    """Recompute ``user_activity_daily`` from ``audit_logs``; return rows written."""
+    Log = models.AuditLog
+    day = timebuckets.bucket(db, Log.created_at, "day")
+    query = (
+        db.query(Log.org_id, Log.user_id, day, func.count(Log.id))
+        .filter(Log.user_id.isnot(None), Log.created_at.isnot(None))
+        .group_by(Log.org_id, Log.user_id, day)
+    )
+    delete_query = db.query(models.UserActivityDaily)
+    if org_id is not None:
+        query = query.filter(Log.org_id == org_id)
+        delete_query = delete_query.filter(models.UserActivityDaily.org_id == org_id)
+
+    rows = [
+        {"org_id": org, "user_id": user_id, "day": _as_day(value), "action_count": count}
+        for org, user_id, value, count in query
+    ]
+    delete_query.delete(synchronize_session=False)
+    db.bulk_insert_mappings(models.UserActivityDaily, rows)
+    db.commit()
+    stats_cache.cache.invalidate(org_id, [models.UserActivityDaily.__tablename__])
+    return len(rows)
@@ -4,13 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import models, rollups, schemas
 from ..deps import get_current_user, get_db
 from ..permissions import (
     ROLE_ADMIN,
     ROLE_APPLICATION_SCREENER,
     ROLE_SUPER_ADMIN,
     require_any_role,
+    user_has_any_role,
 )
 
 router = APIRouter(prefix="/applications", tags=["applications"])
@@ -34,6 +35,14 @@ def _get_application_for_org(
     return app
 
 
+def _is_screener(db: Session, user: models.User) -> bool:
+    """Return True if the user may see every application in the org."""
+    # One joined query instead of lazy-loading user.roles[*].role
+    return user_has_any_role(
+        user, db, [ROLE_SUPER_ADMIN, ROLE_ADMIN, ROLE_APPLICATION_SCREENER]
+    )
+
+
 @router.post("/", response_model=schemas.Application)
 def create_application(
     app_in: schemas.ApplicationCreate,
@@ -54,6 +63,7 @@ def create_application(
         answers_json=app_in.answers_json,
     )
     db.add(app)
+    rollups.record_application_created(db, app)
     db.commit()
     db.refresh(app)
     return app
@@ -79,18 +89,7 @@ def list_applications(
     q = db.query(models.Application).filter(models.Application.org_id == user.org_id)
 
     # Role based visibility
-    privileged = False
-    for user_role in user.roles:
-        # user_role is a UserRole instance, its Role object is in user_role.role
-        if user_role.role and user_role.role.name in (
-            ROLE_SUPER_ADMIN,
-            ROLE_ADMIN,
-            ROLE_APPLICATION_SCREENER,
-        ):
-            privileged = True
-            break
-
-    if not privileged:
+    if not _is_screener(db, user):
         q = q.filter(models.Application.applicant_user_id == user.id)
 
     # Type filter
@@ -143,14 +142,7 @@ def get_application(
 
     # Non privileged users can only see their own application
     if app.applicant_user_id != user.id:
-        for role in user.roles:
-            if role.role_name in (
-                ROLE_SUPER_ADMIN,
-                ROLE_ADMIN,
-                ROLE_APPLICATION_SCREENER,
-            ):
-                break
-        else:
+        if not _is_screener(db, user):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions to view this application",
@@ -181,8 +173,10 @@ def update_application(
     Restricted to screeners and admins.
     """
     app = _get_application_for_org(db, user.org_id, app_id)
+    previous_status = app.status
     for field, value in app_in.dict(exclude_unset=True).items():
         setattr(app, field, value)
+    rollups.record_application_status_changed(db, app, previous_status)
     db.commit()
     db.refresh(app)
     return app
@@ -3,7 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import models, rollups, schemas
 from ..deps import get_current_user, get_db
 from ..permissions import (
     ROLE_ADMIN,
@@ -77,6 +77,7 @@ def create_expense(
         recorded_by_user_id=user.id,
     )
     db.add(exp)
+    rollups.record_expense_created(db, exp)
     db.commit()
     db.refresh(exp)
     return exp
@@ -2,14 +2,18 @@
 Foster Coordinator Router
 Endpoints for foster management, matching algorithm, and coordinator dashboard
 """
+import base64
+import threading
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import and_, case, func, or_, select, tuple_, update
+from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import foster_matching, match_cache, models, pet_status, read_models, schemas, stats_cache
 from ..deps import get_db, get_current_user
 from ..permissions import require_role
 
@@ -197,126 +201,57 @@ def update_foster_profile_admin(
 
 
 @router.get("/dashboard/stats", response_model=schemas.FosterCoordinatorStats)
+@stats_cache.cached(models.FosterProfile, models.Pet, models.FosterPlacement)
 def get_coordinator_stats(
     db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    user: models.User = Depends(get_current_user),
 ):
     """Get statistics for the foster coordinator dashboard"""
-    org_id = current_user.org_id
-
-    # Count active foster profiles
-    total_active_fosters = (
-        db.query(func.count(models.FosterProfile.id))
-        .filter(models.FosterProfile.org_id == org_id)
-        .scalar()
-    )
-
-    # Count available foster profiles
-    total_available_fosters = (
-        db.query(func.count(models.FosterProfile.id))
-        .filter(
-            and_(
-                models.FosterProfile.org_id == org_id,
-                models.FosterProfile.is_available == True,
-            )
-        )
-        .scalar()
-    )
-
-    # Count pets needing foster
-    pets_needing_foster = (
-        db.query(func.count(models.Pet.id))
-        .filter(
-            and_(
-                models.Pet.org_id == org_id,
-                or_(
-                    models.Pet.status == models.PetStatus.intake,
-                    models.Pet.status == models.PetStatus.needs_foster,
-                ),
-            )
-        )
-        .scalar()
-    )
-
-    # Count pets currently in foster
-    pets_in_foster = (
-        db.query(func.count(models.Pet.id))
-        .filter(
-            and_(
-                models.Pet.org_id == org_id,
-                models.Pet.status == models.PetStatus.in_foster,
-            )
-        )
-        .scalar()
-    )
-
-    # Calculate average placement duration
-    avg_duration_result = (
-        db.query(func.avg(models.FosterProfile.avg_foster_duration_days))
-        .filter(models.FosterProfile.org_id == org_id)
-        .scalar()
-    )
-    avg_placement_duration_days = float(avg_duration_result) if avg_duration_result else None
-
-    # Get recent placements with pet information
-    recent_placements_raw = (
-        db.query(models.FosterPlacement)
-        .options(joinedload(models.FosterPlacement.pet))
-        .filter(models.FosterPlacement.org_id == org_id)
-        .order_by(models.FosterPlacement.created_at.desc())
-        .limit(10)
-        .all()
-    )
-
-    # Manually populate pet_name and pet_species for each placement
-    recent_placements = []
-    for placement in recent_placements_raw:
-        placement_dict = {
-            "id": placement.id,
-            "org_id": placement.org_id,
-            "pet_id": placement.pet_id,
-            "foster_profile_id": placement.foster_profile_id,
-            "start_date": placement.start_date,
-            "expected_end_date": placement.expected_end_date,
-            "actual_end_date": placement.actual_end_date,
-            "outcome": placement.outcome,
-            "placement_notes": placement.placement_notes,
-            "return_reason": placement.return_reason,
-            "success_notes": placement.success_notes,
-            "agreement_signed": placement.agreement_signed,
-            "agreement_signed_date": placement.agreement_signed_date,
-            "created_at": placement.created_at,
-            "updated_at": placement.updated_at,
-            "pet_name": placement.pet.name if placement.pet else None,
-            "pet_species": placement.pet.species if placement.pet else None,
-        }
-        recent_placements.append(schemas.FosterPlacement(**placement_dict))
-
-    # Calculate available foster capacity
-    available_capacity_result = (
-        db.query(
-            func.sum(
-                models.FosterProfile.max_capacity - models.FosterProfile.current_capacity
-            )
-        )
-        .filter(
-            and_(
-                models.FosterProfile.org_id == org_id,
-                models.FosterProfile.is_available == True,
-            )
-        )
-        .scalar()
-    )
-    available_foster_capacity = int(available_capacity_result) if available_capacity_result else 0
+    org_id = user.org_id
+    profile = read_models.table(models.FosterProfile).c
+    pet = read_models.table(models.Pet).c
+    placement = read_models.table(models.FosterPlacement)
+
+    # Foster counts, average duration and spare capacity in one pass
+    available = profile.is_available == True
+    fosters = read_models.rows(db, select(
+        func.count(profile.id).label("total"),
+        func.count(case((available, 1))).label("available"),
+        func.avg(profile.avg_foster_duration_days).label("avg_duration"),
+        func.sum(case((available, profile.max_capacity - profile.current_capacity))).label("spare"),
+    ).where(profile.org_id == org_id))[0]
+
+    # Pets needing foster and pets in foster in one pass
+    needing_foster = (models.PetStatus.intake, models.PetStatus.needs_foster)
+    pets = read_models.rows(db, select(
+        func.count(case((pet.status.in_(needing_foster), 1))).label("needing_foster"),
+        func.count(case((pet.status == models.PetStatus.in_foster, 1))).label("in_foster"),
+    ).where(
+        pet.org_id == org_id,
+        pet.status.in_(needing_foster + (models.PetStatus.in_foster,)),
+    ))[0]
+
+    # Recent placements with pet information
+    recent_placements = read_models.rows(db, select(
+        *placement.c,
+        pet.name.label("pet_name"),
+        pet.species.label("pet_species"),
+    ).select_from(
+        placement.outerjoin(read_models.table(models.Pet), pet.id == placement.c.pet_id)
+    ).where(
+        placement.c.org_id == org_id
+    ).order_by(
+        placement.c.created_at.desc()
+    ).limit(10))
 
     return schemas.FosterCoordinatorStats(
-        total_active_fosters=total_active_fosters or 0,
-        total_available_fosters=total_available_fosters or 0,
-        pets_needing_foster=pets_needing_foster or 0,
-        pets_in_foster=pets_in_foster or 0,
-        avg_placement_duration_days=avg_placement_duration_days,
-        recent_placements=recent_placements,
-        available_foster_capacity=available_foster_capacity,
+        total_active_fosters=fosters.total or 0,
+        total_available_fosters=fosters.available or 0,
+        pets_needing_foster=pets.needing_foster or 0,
+        pets_in_foster=pets.in_foster or 0,
+        avg_placement_duration_days=float(fosters.avg_duration) if fosters.avg_duration else None,
+        recent_placements=[dict(row._mapping) for row in recent_placements],
+        available_foster_capacity=int(fosters.spare) if fosters.spare else 0,
     )
 
 
@@ -328,187 +263,80 @@ def get_coordinator_stats(
 @router.get("/matches/suggest", response_model=List[schemas.FosterMatch])
 def suggest_foster_matches(
     pet_id: Optional[int] = None,
+    mode: str = Query(
+        "suggest",
+        pattern="^(suggest|assign)$",
+        description="suggest: top 3 fosters per pet; assign: one foster per pet within capacity",
+    ),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     """
     Enhanced matching algorithm that suggests optimal foster placements
     based on multiple criteria including experience, capacity, preferences, and compatibility
-    """
-    org_id = current_user.org_id
-
-    # Get pets needing foster
-    pets_query = db.query(models.Pet).filter(
-        and_(
-            models.Pet.org_id == org_id,
-            or_(
-                models.Pet.status == models.PetStatus.intake,
-                models.Pet.status == models.PetStatus.needs_foster,
-            ),
-        )
-    )
-
-    if pet_id:
-        pets_query = pets_query.filter(models.Pet.id == pet_id)
-
-    pets = pets_query.all()
-
-    # Get available foster profiles
-    foster_profiles = (
-        db.query(models.FosterProfile)
-        .join(models.User)
-        .filter(
-            and_(
-                models.FosterProfile.org_id == org_id,
-                models.FosterProfile.is_available == True,
-                models.FosterProfile.current_capacity < models.FosterProfile.max_capacity,
-            )
-        )
-        .all()
-    )
 
+    With ``mode=assign`` each pet gets at most one foster, no foster gets more
+    pets than their spare capacity, and the total match score is maximized.
+    """
+    # Served from the org's cached score matrix, patched as pets and profiles
+    # change; the entry is only read while ``use`` holds the org's lock
     matches = []
-
-    for pet in pets:
-        # Calculate match scores for each foster
-        foster_scores = []
-
-        for profile in foster_profiles:
-            score = 0.0
-            reasons = []
-
-            # Base score: availability and capacity
-            if profile.current_capacity < profile.max_capacity:
-                score += 20
-                reasons.append("Has available capacity")
-
-            # Species preference match
-            if profile.preferred_species:
-                preferred_list = [s.strip().lower() for s in profile.preferred_species.split(",")]
-                if pet.species.lower() in preferred_list:
-                    score += 30
-                    reasons.append(f"Prefers {pet.species}")
-
-            # Experience level matching
-            # Check if pet needs special care
-            pet_needs_medical = False
-            pet_needs_behavioral = False
-
-            # Check medical records for special needs
-            medical_keywords = ["special", "medication", "chronic", "treatment"]
-            if pet.description_internal:
-                desc_lower = pet.description_internal.lower()
-                if any(keyword in desc_lower for keyword in medical_keywords):
-                    pet_needs_medical = True
-
-            behavioral_keywords = ["aggressive", "anxious", "fearful", "training needed"]
-            if pet.description_internal:
-                desc_lower = pet.description_internal.lower()
-                if any(keyword in desc_lower for keyword in behavioral_keywords):
-                    pet_needs_behavioral = True
-
-            # Match special needs with foster capabilities
-            if pet_needs_medical and profile.can_handle_medical:
-                score += 25
-                reasons.append("Can handle medical needs")
-            elif pet_needs_medical and not profile.can_handle_medical:
-                score -= 20
-                reasons.append("Pet needs medical care")
-
-            if pet_needs_behavioral and profile.can_handle_behavioral:
-                score += 25
-                reasons.append("Can handle behavioral issues")
-            elif pet_needs_behavioral and not profile.can_handle_behavioral:
-                score -= 20
-                reasons.append("Pet needs behavioral support")
-
-            # Experience level bonus
-            if profile.experience_level == models.FosterExperienceLevel.advanced:
-                score += 15
-                reasons.append("Experienced foster")
-            elif profile.experience_level == models.FosterExperienceLevel.intermediate:
-                score += 10
-                reasons.append("Intermediate experience")
-
-            # Track record bonus
-            if profile.total_fosters > 0:
-                success_rate = (
-                    profile.successful_adoptions / profile.total_fosters
-                    if profile.total_fosters > 0
-                    else 0
+    with match_cache.cache.use(db, current_user.org_id) as entry:
+        pet_features, profile_features = entry.pet_features, entry.profile_features
+
+        if mode == "assign":
+            pairs = entry.plan(pet_id)
+        else:
+            # Top 3 positive-scoring fosters per pet
+            pairs = entry.suggestions(pet_id)
+
+        for i, j, score in pairs:
+            pet = entry.pets[i]
+            profile = entry.profiles[j]
+            matches.append(
+                schemas.FosterMatch(
+                    pet_id=pet.id,
+                    pet_name=pet.name,
+                    pet_species=pet.species,
+                    pet_status=pet.status.value,
+                    foster_user_id=profile.user_id,
+                    foster_name=profile.full_name,
+                    foster_email=profile.email,
+                    match_score=score,
+                    match_reasons=foster_matching.reasons(pet_features, profile_features, i, j),
+                    current_foster_load=profile.current_capacity,
+                    max_capacity=profile.max_capacity,
                 )
-                if success_rate > 0.8:
-                    score += 20
-                    reasons.append(f"High success rate ({success_rate:.0%})")
-                elif success_rate > 0.5:
-                    score += 10
-                    reasons.append(f"Good success rate ({success_rate:.0%})")
-
-            # Rating bonus
-            if profile.rating and profile.rating >= 4.5:
-                score += 15
-                reasons.append(f"Highly rated ({profile.rating:.1f}★)")
-            elif profile.rating and profile.rating >= 4.0:
-                score += 10
-                reasons.append(f"Well rated ({profile.rating:.1f}★)")
-
-            # Current load balancing - prefer fosters with lower current load
-            capacity_ratio = profile.current_capacity / profile.max_capacity if profile.max_capacity > 0 else 1
-            if capacity_ratio == 0:
-                score += 15
-                reasons.append("No current fosters")
-            elif capacity_ratio < 0.5:
-                score += 10
-                reasons.append("Low current load")
-
-            # Qualifications check
-            if profile.background_check_status == "approved":
-                score += 10
-                reasons.append("Background check approved")
-
-            if profile.references_checked:
-                score += 5
-                reasons.append("References verified")
-
-            foster_scores.append(
-                {
-                    "profile": profile,
-                    "score": score,
-                    "reasons": reasons,
-                }
             )
 
-        # Sort by score and take top matches
-        foster_scores.sort(key=lambda x: x["score"], reverse=True)
-
-        # Create match objects for top 3 fosters per pet
-        for i, foster_match in enumerate(foster_scores[:3]):
-            if foster_match["score"] > 0:  # Only include positive matches
-                profile = foster_match["profile"]
-                matches.append(
-                    schemas.FosterMatch(
-                        pet_id=pet.id,
-                        pet_name=pet.name,
-                        pet_species=pet.species,
-                        pet_status=pet.status.value,
-                        foster_user_id=profile.user_id,
-                        foster_name=profile.user.full_name,
-                        foster_email=profile.user.email,
-                        match_score=foster_match["score"],
-                        match_reasons=foster_match["reasons"],
-                        current_foster_load=profile.current_capacity,
-                        max_capacity=profile.max_capacity,
-                    )
-                )
-
     return matches
 
 
+@router.get("/matches/cache")
+def match_cache_info(current_user: models.User = Depends(get_current_user)):
+    """Get match cache hit counters and the age and size of this org's entry"""
+    return match_cache.cache.info(current_user.org_id)
+
+
 # ============================================================================
 # FOSTER PLACEMENT WORKFLOW
 # ============================================================================
 
 
+# SQLite has no row locks, so placements there are serialized per process
+_sqlite_placement_lock = threading.Lock()
+
+
+@contextmanager
+def _placement_lock(db: Session):
+    """Hold across a capacity check and its increment, alongside ``FOR UPDATE``."""
+    if db.get_bind().dialect.name == "sqlite":
+        with _sqlite_placement_lock:
+            yield
+    else:
+        yield
+
+
 @router.post("/placements", response_model=schemas.FosterPlacement)
 def create_foster_placement(
     placement: schemas.FosterPlacementCreate,
@@ -527,53 +355,187 @@ def create_foster_placement(
     if not pet:
         raise HTTPException(status_code=404, detail="Pet not found")
 
-    # Verify foster profile exists
-    foster_profile = (
-        db.query(models.FosterProfile)
-        .filter(
-            and_(
-                models.FosterProfile.id == placement.foster_profile_id,
-                models.FosterProfile.org_id == org_id,
+    with _placement_lock(db):
+        # Verify foster profile exists, locking it until the commit
+        foster_profile = (
+            db.query(models.FosterProfile)
+            .filter(
+                and_(
+                    models.FosterProfile.id == placement.foster_profile_id,
+                    models.FosterProfile.org_id == org_id,
+                )
             )
+            .with_for_update()
+            .first()
         )
-        .first()
-    )
-    if not foster_profile:
-        raise HTTPException(status_code=404, detail="Foster profile not found")
-
-    # Check foster capacity
-    if foster_profile.current_capacity >= foster_profile.max_capacity:
-        raise HTTPException(status_code=400, detail="Foster is at maximum capacity")
-
-    # Check if foster is available
-    if not foster_profile.is_available:
-        raise HTTPException(status_code=400, detail="Foster is not currently available")
-
-    # Create placement
-    db_placement = models.FosterPlacement(
-        org_id=org_id,
-        pet_id=placement.pet_id,
-        foster_profile_id=placement.foster_profile_id,
-        expected_end_date=placement.expected_end_date,
-        placement_notes=placement.placement_notes,
-    )
-    db.add(db_placement)
+        if not foster_profile:
+            raise HTTPException(status_code=404, detail="Foster profile not found")
+
+        # Check foster capacity
+        if foster_profile.current_capacity >= foster_profile.max_capacity:
+            raise HTTPException(status_code=400, detail="Foster is at maximum capacity")
+
+        # Check if foster is available
+        if not foster_profile.is_available:
+            raise HTTPException(status_code=400, detail="Foster is not currently available")
+
+        # Create placement
+        db_placement = models.FosterPlacement(
+            org_id=org_id,
+            pet_id=placement.pet_id,
+            foster_profile_id=placement.foster_profile_id,
+            expected_end_date=placement.expected_end_date,
+            placement_notes=placement.placement_notes,
+        )
+        db.add(db_placement)
 
-    # Update pet status
-    pet.status = models.PetStatus.in_foster
-    pet.foster_user_id = foster_profile.user_id
+        # Update pet status
+        previous_pet_status = pet.status
+        pet.status = models.PetStatus.in_foster
+        pet.foster_user_id = foster_profile.user_id
+        pet_status.record_change(db, pet, previous_pet_status, current_user.id)
 
-    # Update foster capacity
-    foster_profile.current_capacity += 1
-    foster_profile.total_fosters += 1
+        # Update foster capacity
+        foster_profile.current_capacity += 1
+        foster_profile.total_fosters += 1
 
-    db.commit()
+        db.commit()
     db.refresh(db_placement)
     return db_placement
 
 
-@router.get("/placements", response_model=List[schemas.FosterPlacement])
+@router.post("/placements/batch", response_model=List[schemas.FosterPlacement])
+def create_foster_placements_batch(
+    batch: schemas.FosterPlacementBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """
+    Place several pets at once (e.g. a litter) in a single transaction.
+
+    The foster profiles involved are locked before their capacity is checked,
+    and every placement is validated before any is written: the placements
+    are inserted together, the pets move to in_foster with one UPDATE, and
+    the whole batch commits once or not at all.
+    """
+    org_id = current_user.org_id
+    requested = batch.placements
+    if not requested:
+        raise HTTPException(status_code=400, detail="No placements given")
+    pet_ids = [item.pet_id for item in requested]
+    if len(set(pet_ids)) != len(pet_ids):
+        raise HTTPException(status_code=400, detail="A pet can only be placed once per batch")
+
+    pets = {
+        pet.id: pet
+        for pet in db.query(models.Pet).filter(
+            and_(models.Pet.id.in_(pet_ids), models.Pet.org_id == org_id)
+        )
+    }
+    if len(pets) != len(pet_ids):
+        raise HTTPException(status_code=404, detail="Pet not found")
+
+    requested_slots = Counter(item.foster_profile_id for item in requested)
+    with _placement_lock(db):
+        # Locked in id order so concurrent batches cannot deadlock
+        profiles = {
+            profile.id: profile
+            for profile in db.query(models.FosterProfile)
+            .filter(
+                and_(
+                    models.FosterProfile.id.in_(requested_slots),
+                    models.FosterProfile.org_id == org_id,
+                )
+            )
+            .order_by(models.FosterProfile.id)
+            .with_for_update()
+        }
+        if len(profiles) != len(requested_slots):
+            raise HTTPException(status_code=404, detail="Foster profile not found")
+
+        for profile_id, slots in requested_slots.items():
+            profile = profiles[profile_id]
+            if not profile.is_available:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Foster profile {profile_id} is not currently available",
+                )
+            if profile.current_capacity + slots > profile.max_capacity:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"Foster profile {profile_id} has room for "
+                        f"{max(profile.max_capacity - profile.current_capacity, 0)} "
+                        f"more pets, {slots} requested"
+                    ),
+                )
+
+        placements = [
+            models.FosterPlacement(
+                org_id=org_id,
+                pet_id=item.pet_id,
+                foster_profile_id=item.foster_profile_id,
+                expected_end_date=item.expected_end_date,
+                placement_notes=item.placement_notes,
+            )
+            for item in requested
+        ]
+        db.add_all(placements)
+        db.flush()
+        placement_ids = [placement.id for placement in placements]
+
+        previous_statuses = {pet_id: pet.status for pet_id, pet in pets.items()}
+        foster_user_ids = {
+            item.pet_id: profiles[item.foster_profile_id].user_id for item in requested
+        }
+        db.execute(
+            update(models.Pet)
+            .where(models.Pet.id.in_(pet_ids))
+            .values(
+                status=models.PetStatus.in_foster,
+                foster_user_id=case(foster_user_ids, value=models.Pet.id),
+            )
+            .execution_options(
+                synchronize_session="fetch", org_id=org_id, changed_ids=pet_ids
+            )
+        )
+        for pet_id, pet in pets.items():
+            pet_status.record_change(db, pet, previous_statuses[pet_id], current_user.id)
+
+        for profile_id, slots in requested_slots.items():
+            profiles[profile_id].current_capacity += slots
+            profiles[profile_id].total_fosters += slots
+
+        db.commit()
+
+    return (
+        db.query(models.FosterPlacement)
+        .filter(models.FosterPlacement.id.in_(placement_ids))
+        .order_by(models.FosterPlacement.id)
+        .all()
+    )
+
+
+PLACEMENTS_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_placement_cursor(created_at: datetime, placement_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{placement_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_placement_cursor(cursor: str) -> Tuple[datetime, int]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    created_at, placement_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+    return datetime.fromisoformat(created_at), int(placement_id)
+
+
+@router.get(
+    "/placements",
+    response_model=Union[List[schemas.FosterPlacement], List[schemas.FosterPlacementSummary]],
+)
 def list_foster_placements(
+    response: Response,
     active_only: bool = False,
     foster_profile_id: Optional[int] = None,
     pet_id: Optional[int] = None,
@@ -581,55 +543,101 @@ def list_foster_placements(
     search: Optional[str] = None,
     start_date_from: Optional[datetime] = None,
     start_date_to: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(
+        None,
+        description=f"{PLACEMENTS_CURSOR_HEADER} header of the previous page",
+    ),
+    view: str = Query("full", pattern="^(full|slim)$"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    """List foster placements with advanced filtering"""
-    query = db.query(models.FosterPlacement).options(
-        joinedload(models.FosterPlacement.pet),
-        joinedload(models.FosterPlacement.foster_profile)
-    ).filter(
-        models.FosterPlacement.org_id == current_user.org_id
+    """
+    List foster placements with advanced filtering, newest first.
+
+    Pages are ``limit`` rows long; while more remain, the cursor for the
+    next page is returned in the X-Next-Cursor header. ``view=slim`` returns
+    only the placement summary with pet name/species and foster name.
+    """
+    placement = read_models.table(models.FosterPlacement)
+    pet = read_models.table(models.Pet).c
+    joined = placement.outerjoin(read_models.table(models.Pet), pet.id == placement.c.pet_id)
+
+    if view == "slim":
+        profile = read_models.table(models.FosterProfile).c
+        user = read_models.table(models.User).c
+        joined = joined.outerjoin(
+            read_models.table(models.FosterProfile), profile.id == placement.c.foster_profile_id
+        ).outerjoin(read_models.table(models.User), user.id == profile.user_id)
+        columns = [
+            placement.c.id,
+            placement.c.pet_id,
+            placement.c.foster_profile_id,
+            placement.c.start_date,
+            placement.c.expected_end_date,
+            placement.c.outcome,
+            placement.c.created_at,
+            pet.name.label("pet_name"),
+            pet.species.label("pet_species"),
+            user.full_name.label("foster_name"),
+        ]
+    else:
+        columns = [*placement.c, pet.name.label("pet_name"), pet.species.label("pet_species")]
+
+    statement = select(*columns).select_from(joined).where(
+        placement.c.org_id == current_user.org_id
     )
 
     # Active only filter
     if active_only:
-        query = query.filter(
-            models.FosterPlacement.outcome == models.PlacementOutcome.active
+        statement = statement.where(
+            placement.c.outcome == models.PlacementOutcome.active
         )
 
     # Outcome filter
     if outcome:
         try:
             outcome_enum = models.PlacementOutcome(outcome)
-            query = query.filter(models.FosterPlacement.outcome == outcome_enum)
+            statement = statement.where(placement.c.outcome == outcome_enum)
         except ValueError:
             pass
 
     # Foster profile filter
     if foster_profile_id:
-        query = query.filter(
-            models.FosterPlacement.foster_profile_id == foster_profile_id
-        )
+        statement = statement.where(placement.c.foster_profile_id == foster_profile_id)
 
     # Pet filter
     if pet_id:
-        query = query.filter(models.FosterPlacement.pet_id == pet_id)
+        statement = statement.where(placement.c.pet_id == pet_id)
 
     # Date range filters
     if start_date_from:
-        query = query.filter(models.FosterPlacement.start_date >= start_date_from)
+        statement = statement.where(placement.c.start_date >= start_date_from)
 
     if start_date_to:
-        query = query.filter(models.FosterPlacement.start_date <= start_date_to)
+        statement = statement.where(placement.c.start_date <= start_date_to)
 
     # Search filter (search pet name)
     if search:
-        query = query.join(models.Pet).filter(
-            models.Pet.name.ilike(f"%{search}%")
-        )
+        statement = statement.where(pet.name.ilike(f"%{search}%"))
 
-    return query.order_by(models.FosterPlacement.created_at.desc()).all()
+    # Keyset pagination, backed by ix_foster_placements_org_id_created_at_id
+    if cursor:
+        try:
+            after = decode_placement_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        statement = statement.where(tuple_(placement.c.created_at, placement.c.id) < after)
+
+    rows = read_models.rows(db, statement.order_by(
+        placement.c.created_at.desc(), placement.c.id.desc()
+    ).limit(limit + 1))
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[PLACEMENTS_CURSOR_HEADER] = encode_placement_cursor(
+            rows[-1].created_at, rows[-1].id
+        )
+    return [dict(row._mapping) for row in rows]
 
 
 @router.get("/placements/{placement_id}", response_model=schemas.FosterPlacement)
@@ -714,11 +722,13 @@ def update_foster_placement(
                 foster_profile.avg_foster_duration_days = float(duration)
 
         # Update pet status
+        previous_pet_status = pet.status
         if placement.outcome == models.PlacementOutcome.adopted:
             pet.status = models.PetStatus.adopted
         elif placement.outcome == models.PlacementOutcome.returned:
             pet.status = models.PetStatus.needs_foster
         pet.foster_user_id = None
+        pet_status.record_change(db, pet, previous_pet_status, current_user.id)
 
     placement.updated_at = datetime.utcnow()
     db.commit()
@@ -783,6 +793,7 @@ def complete_foster_placement(
         foster_profile.avg_foster_duration_days = float(duration)
 
     # Update pet status
+    previous_pet_status = pet.status
     if outcome == models.PlacementOutcome.adopted:
         pet.status = models.PetStatus.adopted
     elif outcome == models.PlacementOutcome.returned:
@@ -791,6 +802,7 @@ def complete_foster_placement(
         pet.status = models.PetStatus.needs_foster
 
     pet.foster_user_id = None
+    pet_status.record_change(db, pet, previous_pet_status, current_user.id)
 
     placement.updated_at = datetime.utcnow()
     db.commit()
@@ -5,7 +5,7 @@ import stripe
 from fastapi import APIRouter, Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
 
-from .. import audit, models
+from .. import audit, models, rollups
 from ..deps import get_db
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
@@ -63,6 +63,7 @@ async def stripe_webhook(
         payment.status_detail = f"stripe:{event_type}"
         payment.gateway_payment_id = data_object.get("id")
 
+    rollups.record_payment_status_changed(db, payment, previous_status)
     db.commit()
 
     if previous_status != payment.status:
@@ -114,6 +115,7 @@ async def paypal_webhook(
         payment.status_detail = f"paypal:{event_type}"
         payment.gateway_payment_id = resource.get("id")
 
+    rollups.record_payment_status_changed(db, payment, previous_status)
     db.commit()
 
     if previous_status != payment.status:
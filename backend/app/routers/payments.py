@@ -3,7 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import models, rollups, schemas
 from ..deps import get_current_user, get_db
 from ..permissions import (
     ROLE_ADMIN,
@@ -35,6 +35,7 @@ def create_payment(
         provider=pay_in.provider,
     )
     db.add(payment)
+    rollups.record_payment_created(db, payment)
     db.commit()
     db.refresh(payment)
     return payment
@@ -1,9 +1,9 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import care_needs, models, pet_search, pet_status, rollups, schemas
 from ..deps import get_current_user, get_db
 from ..permissions import (
     ROLE_ADMIN,
@@ -56,27 +56,28 @@ def create_pet(
         )
 
     pet = models.Pet(**pet_in.dict())
+    care_needs.apply(pet)
     db.add(pet)
+    rollups.record_pet_created(db, pet)
+    pet_status.record_change(db, pet, None, user.id)
     db.commit()
     db.refresh(pet)
     return pet
 
 
-@router.get("/", response_model=List[schemas.Pet])
-def list_pets(
-    status_filter: Optional[schemas.PetStatus] = None,
-    species: Optional[str] = None,
-    breed: Optional[str] = None,
-    sex: Optional[str] = None,
-    search: Optional[str] = None,
-    min_age: Optional[int] = None,
-    max_age: Optional[int] = None,
-    altered_status: Optional[str] = None,
-    db: Session = Depends(get_db),
-    user=Depends(get_current_user),
+def _filtered_pets(
+    db: Session,
+    org_id: int,
+    status_filter: Optional[schemas.PetStatus],
+    species: Optional[str],
+    breed: Optional[str],
+    sex: Optional[str],
+    search: Optional[str],
+    min_age: Optional[int],
+    max_age: Optional[int],
+    altered_status: Optional[str],
 ):
-    """Return all pets for the current organization with advanced filtering."""
-    q = db.query(models.Pet).filter(models.Pet.org_id == user.org_id)
+    q = db.query(models.Pet).filter(models.Pet.org_id == org_id)
 
     # Status filter
     if status_filter is not None:
@@ -98,21 +99,85 @@ def list_pets(
     if altered_status:
         q = q.filter(models.Pet.altered_status == altered_status)
 
-    # Search across name, species, breed
+    # Full-text prefix search across name, species, breed, color, description
     if search:
-        search_term = f"%{search}%"
-        q = q.filter(
-            (models.Pet.name.ilike(search_term)) |
-            (models.Pet.species.ilike(search_term)) |
-            (models.Pet.breed.ilike(search_term))
-        )
+        match = pet_search.matches(db, search)
+        if match is not None:
+            q = q.filter(match)
+
+    # Age filters, as date_of_birth ranges
+    q = q.filter(*pet_search.age_range(min_age, max_age))
+
+    return q
 
-    # Age filters (approximate calculation if date_of_birth exists)
-    # Note: This is a simplified version. Production code would calculate age properly
 
+@router.get("/", response_model=List[schemas.Pet])
+def list_pets(
+    status_filter: Optional[schemas.PetStatus] = None,
+    species: Optional[str] = None,
+    breed: Optional[str] = None,
+    sex: Optional[str] = None,
+    search: Optional[str] = None,
+    min_age: Optional[int] = Query(None, ge=0),
+    max_age: Optional[int] = Query(None, ge=0),
+    altered_status: Optional[str] = None,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """Return all pets for the current organization with advanced filtering."""
+    q = _filtered_pets(
+        db,
+        user.org_id,
+        status_filter=status_filter,
+        species=species,
+        breed=breed,
+        sex=sex,
+        search=search,
+        min_age=min_age,
+        max_age=max_age,
+        altered_status=altered_status,
+    )
     return q.order_by(models.Pet.created_at.desc()).all()
 
 
+@router.get("/search", response_model=schemas.PetSearchResults)
+def search_pets(
+    status_filter: Optional[schemas.PetStatus] = None,
+    species: Optional[str] = None,
+    breed: Optional[str] = None,
+    sex: Optional[str] = None,
+    search: Optional[str] = None,
+    min_age: Optional[int] = Query(None, ge=0),
+    max_age: Optional[int] = Query(None, ge=0),
+    altered_status: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=200),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    """
+    Filter like the pet list, returning the newest ``limit`` matches plus
+    the total and species/status/sex/altered_status counts over all of them.
+    """
+    q = _filtered_pets(
+        db,
+        user.org_id,
+        status_filter=status_filter,
+        species=species,
+        breed=breed,
+        sex=sex,
+        search=search,
+        min_age=min_age,
+        max_age=max_age,
+        altered_status=altered_status,
+    )
+    facets = pet_search.facet_counts(db, q.statement)
+    return {
+        "items": q.order_by(models.Pet.created_at.desc()).limit(limit).all(),
+        "total": sum(facets["status"].values()),
+        "facets": facets,
+    }
+
+
 @router.get("/{pet_id}", response_model=schemas.Pet)
 def get_pet(
     pet_id: int,
@@ -142,9 +207,15 @@ def update_pet(
 ):
     """Update a pet's core fields and status."""
     pet = _get_pet_for_org(db, user.org_id, pet_id)
+    previous_status = pet.status
+    previous_intake_date = pet.intake_date
     update_data = pet_in.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(pet, field, value)
+    if "description_internal" in update_data:
+        care_needs.apply(pet)
+    rollups.record_pet_intake_changed(db, pet, previous_intake_date)
+    pet_status.record_change(db, pet, previous_status, user.id)
     db.commit()
     db.refresh(pet)
     return pet
@@ -193,8 +264,10 @@ def assign_foster(
 
     pet.foster_user_id = foster.id
     # Move status to in_foster when appropriate
+    previous_status = pet.status
     if pet.status in [schemas.PetStatus.intake, schemas.PetStatus.needs_foster]:
         pet.status = schemas.PetStatus.in_foster
+    pet_status.record_change(db, pet, previous_status, user.id)
 
     db.commit()
     db.refresh(pet)
@@ -221,8 +294,10 @@ def unassign_foster(
     pet = _get_pet_for_org(db, user.org_id, pet_id)
 
     pet.foster_user_id = None
+    previous_status = pet.status
     if pet.status == schemas.PetStatus.in_foster:
         pet.status = schemas.PetStatus.needs_foster
+    pet_status.record_change(db, pet, previous_status, user.id)
 
     db.commit()
     db.refresh(pet)
@@ -3,7 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from .. import models, schemas
+from .. import models, rollups, schemas
 from ..deps import get_db
 
 router = APIRouter(prefix="/public", tags=["public"])
@@ -56,6 +56,7 @@ def request_adoption(
         answers_json=None,
     )
     db.add(app)
+    rollups.record_application_created(db, app)
     db.commit()
     db.refresh(app)
     return app
@@ -2,54 +2,289 @@
 Reports Router
 Endpoints for generating and exporting various reports
 """
+import base64
+import contextvars
 import csv
-import io
+import inspect
+import json
+import logging
+import os
+import re
+import tempfile
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy import func, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import func, and_, select
 from sqlalchemy.orm import Session
 
-from .. import models
+from .. import export_jobs, models, read_models, schemas, timebuckets
 from ..deps import get_current_user, get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
-def generate_csv(headers: list, rows: list) -> StreamingResponse:
-    """Generate a CSV file from headers and rows"""
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(headers)
-    writer.writerows(rows)
+# Rows fetched per round trip from the server-side cursor and written per
+# CSV chunk, so an export never holds more than this many rows in memory.
+EXPORT_CHUNK_ROWS = 500
 
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=report.csv"}
-    )
 
+class _Echo:
+    """File-like target that hands each formatted CSV line straight back."""
 
-@router.get("/pets/export")
-def export_pets_report(
+    def write(self, value):
+        return value
+
+
+def _csv_chunks(headers: list, rows: Iterable, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    """Format ``rows`` lazily as CSV, yielding one string per ``chunk_rows`` rows."""
+    writer = csv.writer(_Echo())
+    chunk = [writer.writerow(headers)]
+    for row in rows:
+        chunk.append(writer.writerow(row))
+        if len(chunk) >= chunk_rows:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _date(value) -> str:
+    return value.strftime("%Y-%m-%d") if value else ""
+
+
+def _enum(value) -> str:
+    return value.value if hasattr(value, "value") else str(value)
+
+
+class Export(NamedTuple):
+    """A CSV export: its header row, a projected select and a row formatter.
+
+    ``statement`` is a Core ``select()`` run through ``read_models``, so rows
+    are plain named tuples rather than ORM instances. ``watermark`` is the
+    column that moves forward whenever an exported row changes; delta
+    exports filter and resume on it.
+    """
+
+    db: Session
+    headers: List[str]
+    statement: object
+    row: Callable
+    watermark: object
+
+    def rows(self) -> Iterator[list]:
+        results = read_models.stream(self.db, self.statement, EXPORT_CHUNK_ROWS)
+        return (self.row(result) for result in results)
+
+    def count(self) -> int:
+        return read_models.count(self.db, self.statement)
+
+    def high_watermark(self) -> Optional[datetime]:
+        return read_models.max_of(self.db, self.statement, self.watermark)
+
+    def up_to(self, until: datetime) -> "Export":
+        return self._replace(statement=self.statement.where(self.watermark <= until))
+
+
+# ============================================================================
+# DELTA CURSORS
+# ============================================================================
+
+EXPORT_CURSOR_HEADER = "X-Export-Cursor"
+
+# updated_at is stamped at flush, not at commit, so a row can become visible
+# after rows stamped later than it were exported. Cursors are held this many
+# seconds behind the export time; the next delta repeats rows changed in
+# that window (consumers de-duplicate on ID) instead of skipping a late
+# commit. It must exceed the longest write transaction.
+EXPORT_CURSOR_LAG_SECONDS = int(os.getenv("EXPORT_CURSOR_LAG_SECONDS", "300"))
+
+
+def encode_cursor(watermark: datetime) -> str:
+    return base64.urlsafe_b64encode(watermark.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> datetime:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return datetime.fromisoformat(base64.urlsafe_b64decode(padded.encode()).decode())
+
+
+def export_since(
+    since: Optional[str] = Query(
+        default=None,
+        description=f"Cursor from a previous export's {EXPORT_CURSOR_HEADER} header; "
+        "only rows changed after it are returned",
+    ),
+) -> Optional[datetime]:
+    """Decode the ``since`` cursor of a delta export"""
+    if since is None:
+        return None
+    try:
+        return decode_cursor(since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid export cursor")
+
+
+def _window(statement, watermark, since: Optional[datetime], created=None, days: Optional[int] = None):
+    """Rows changed after ``since`` for a delta export, else the ``days`` window on ``created``."""
+    if since is not None:
+        return statement.where(watermark > since)
+    if created is not None:
+        cutoff_date, _ = timebuckets.last_n_days(days)
+        statement = statement.where(created >= cutoff_date)
+    return statement
+
+
+# ============================================================================
+# OUTPUT FORMATS
+# ============================================================================
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
+
+class ExportOutput(NamedTuple):
+    """Negotiated representation of an export response."""
+
+    format: str  # "csv" or "ndjson"
+    gzip: bool
+
+
+def _quality(header: Optional[str], values) -> float:
+    """Highest q-value the header gives any of ``values`` (0 when absent)."""
+    best = 0.0
+    for part in (header or "").split(","):
+        token, _, params = part.strip().partition(";")
+        if token.strip().lower() not in values:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        best = max(best, q)
+    return best
+
+
+def negotiate_export(
+    request: Request,
+    format: Optional[str] = Query(
+        default=None,
+        pattern="^(csv|ndjson)$",
+        description="Output format; overrides the Accept header",
+    ),
+) -> ExportOutput:
+    """Pick CSV or NDJSON and whether to gzip from the query and headers"""
+    if format is None:
+        accept = request.headers.get("accept")
+        prefers_ndjson = _quality(accept, NDJSON_MEDIA_TYPES) > _quality(accept, ("text/csv",))
+        format = "ndjson" if prefers_ndjson else "csv"
+    gzip = _quality(request.headers.get("accept-encoding"), ("gzip",)) > 0
+    return ExportOutput(format, gzip)
+
+
+def _field_name(header: str) -> str:
+    """NDJSON key for a CSV header, e.g. "Duration (days)" -> "duration_days"."""
+    return "_".join(re.findall(r"[a-z0-9]+", header.lower()))
+
+
+def _ndjson_chunks(headers: list, rows: Iterable, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    """Format ``rows`` lazily as one JSON object per line, ``chunk_rows`` lines per chunk."""
+    fields = [_field_name(header) for header in headers]
+    chunk = []
+    for row in rows:
+        chunk.append(json.dumps(dict(zip(fields, row)), default=str) + "\n")
+        if len(chunk) >= chunk_rows:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Compress text chunks into a single gzip stream as they arrive."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _respond(
+    export: Export, output: ExportOutput, since: Optional[datetime] = None
+) -> StreamingResponse:
+    """Stream an export in the negotiated format
+
+    Rows are pulled from the cursor while the response is being sent; the
+    request's session stays open until then. The export is capped at its
+    current high watermark. The cursor for the next delta export is that
+    watermark held back by ``EXPORT_CURSOR_LAG_SECONDS``, and never earlier
+    than the incoming cursor.
+    """
+    until = export.high_watermark()
+    if until is not None:
+        export = export.up_to(until)
+        cursor = min(until, datetime.utcnow() - timedelta(seconds=EXPORT_CURSOR_LAG_SECONDS))
+        if since is not None:
+            cursor = max(cursor, since)
+    else:
+        cursor = since
+
+    if output.format == "ndjson":
+        body = _ndjson_chunks(export.headers, export.rows())
+        media_type, filename = "application/x-ndjson", "report.ndjson"
+    else:
+        body = _csv_chunks(export.headers, export.rows())
+        media_type, filename = "text/csv", "report.csv"
+
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Vary": "Accept, Accept-Encoding",
+    }
+    if cursor is not None:
+        headers[EXPORT_CURSOR_HEADER] = encode_cursor(cursor)
+    if output.gzip:
+        body = _gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+# ============================================================================
+# EXPORT BUILDERS
+# ============================================================================
+
+
+def pets_export(
+    db: Session,
+    org_id: int,
     status_filter: Optional[str] = None,
     species: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export pets report as CSV"""
-    query = db.query(models.Pet).filter(models.Pet.org_id == current_user.org_id)
+    since: Optional[datetime] = None,
+) -> Export:
+    pet = read_models.table(models.Pet).c
+    statement = select(
+        pet.id, pet.name, pet.species, pet.breed, pet.sex, pet.status,
+        pet.intake_date, pet.date_of_birth, pet.microchip_number,
+        pet.altered_status, pet.description_public,
+    ).where(pet.org_id == org_id)
 
     if status_filter:
-        query = query.filter(models.Pet.status == status_filter)
+        statement = statement.where(pet.status == status_filter)
 
     if species:
-        query = query.filter(models.Pet.species.ilike(f"%{species}%"))
+        statement = statement.where(pet.species.ilike(f"%{species}%"))
 
-    pets = query.all()
+    statement = _window(statement, pet.updated_at, since)
 
     headers = [
         "ID", "Name", "Species", "Breed", "Sex", "Status",
@@ -57,81 +292,86 @@ def export_pets_report(
         "Description"
     ]
 
-    rows = []
-    for pet in pets:
-        rows.append([
-            pet.id,
-            pet.name or "",
-            pet.species or "",
-            pet.breed or "",
-            pet.sex or "",
-            pet.status.value if hasattr(pet.status, "value") else str(pet.status),
-            pet.intake_date.strftime("%Y-%m-%d") if pet.intake_date else "",
-            pet.date_of_birth.strftime("%Y-%m-%d") if pet.date_of_birth else "",
-            pet.microchip_number or "",
-            pet.altered_status or "",
-            pet.description_public or ""
-        ])
-
-    return generate_csv(headers, rows)
-
-
-@router.get("/adoptions/export")
-def export_adoptions_report(
-    days: int = Query(default=90, ge=1, le=365),
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export adoptions report as CSV"""
-    cutoff_date = datetime.now() - timedelta(days=days)
-
-    # Get adopted pets
-    pets = db.query(models.Pet).filter(
-        models.Pet.org_id == current_user.org_id,
-        models.Pet.status == models.PetStatus.adopted,
-        models.Pet.updated_at >= cutoff_date
-    ).all()
+    def row(result):
+        return [
+            result.id,
+            result.name or "",
+            result.species or "",
+            result.breed or "",
+            result.sex or "",
+            _enum(result.status),
+            _date(result.intake_date),
+            _date(result.date_of_birth),
+            result.microchip_number or "",
+            _enum(result.altered_status) if result.altered_status else "",
+            result.description_public or ""
+        ]
+
+    return Export(db, headers, statement.order_by(pet.id), row, pet.updated_at)
+
+
+def adoptions_export(
+    db: Session, org_id: int, days: int = 90, since: Optional[datetime] = None
+) -> Export:
+    """One row per move into the adopted status, taken from the pet status log."""
+    events = read_models.table(models.PetStatusEvent)
+    pets = read_models.table(models.Pet)
+    event, pet = events.c, pets.c
+    statement = select(
+        pet.id, pet.name, pet.species, pet.breed, pet.adopter_user_id,
+        pet.intake_date, pet.created_at, event.changed_at,
+    ).select_from(events.join(pets, pet.id == event.pet_id)).where(
+        event.org_id == org_id,
+        event.to_status == models.PetStatus.adopted
+    )
+    statement = _window(statement, event.changed_at, since, event.changed_at, days)
 
     headers = [
         "Pet ID", "Pet Name", "Species", "Breed",
         "Adopter ID", "Adoption Date", "Days in System"
     ]
 
-    rows = []
-    for pet in pets:
-        days_in_system = (pet.updated_at - pet.intake_date).days if pet.intake_date else 0
-        rows.append([
-            pet.id,
-            pet.name or "",
-            pet.species or "",
-            pet.breed or "",
-            pet.adopter_user_id or "",
-            pet.updated_at.strftime("%Y-%m-%d") if pet.updated_at else "",
+    def row(result):
+        intake = result.intake_date or (result.created_at.date() if result.created_at else None)
+        days_in_system = (result.changed_at.date() - intake).days if intake else 0
+        return [
+            result.id,
+            result.name or "",
+            result.species or "",
+            result.breed or "",
+            result.adopter_user_id or "",
+            _date(result.changed_at),
             days_in_system
-        ])
+        ]
 
-    return generate_csv(headers, rows)
+    statement = statement.order_by(event.changed_at, event.id)
+    return Export(db, headers, statement, row, event.changed_at)
 
 
-@router.get("/foster/placements/export")
-def export_foster_placements_report(
+def foster_placements_export(
+    db: Session,
+    org_id: int,
     active_only: bool = False,
-    days: int = Query(default=90, ge=1, le=365),
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export foster placements report as CSV"""
-    query = db.query(models.FosterPlacement).filter(
-        models.FosterPlacement.org_id == current_user.org_id
+    days: int = 90,
+    since: Optional[datetime] = None,
+) -> Export:
+    placements = read_models.table(models.FosterPlacement)
+    pets = read_models.table(models.Pet)
+    placement, pet = placements.c, pets.c
+    statement = select(
+        placement.id, placement.pet_id, pet.name.label("pet_name"),
+        placement.foster_profile_id, placement.start_date,
+        placement.expected_end_date, placement.actual_end_date,
+        placement.outcome, placement.placement_notes,
+    ).select_from(placements.outerjoin(pets, pet.id == placement.pet_id)).where(
+        placement.org_id == org_id
     )
 
     if active_only:
-        query = query.filter(models.FosterPlacement.outcome == models.PlacementOutcome.active)
+        statement = statement.where(placement.outcome == models.PlacementOutcome.active)
+        statement = _window(statement, placement.updated_at, since)
     else:
-        cutoff_date = datetime.now() - timedelta(days=days)
-        query = query.filter(models.FosterPlacement.created_at >= cutoff_date)
-
-    placements = query.all()
+        statement = _window(statement, placement.updated_at, since, placement.created_at, days)
 
     headers = [
         "Placement ID", "Pet ID", "Pet Name", "Foster Profile ID",
@@ -139,40 +379,40 @@ def export_foster_placements_report(
         "Duration (days)", "Notes"
     ]
 
-    rows = []
-    for placement in placements:
-        pet = placement.pet
+    def row(result):
         duration = ""
-        if placement.actual_end_date:
-            duration = (placement.actual_end_date - placement.start_date).days
-        elif placement.outcome == models.PlacementOutcome.active:
-            duration = (datetime.now() - placement.start_date).days
-
-        rows.append([
-            placement.id,
-            placement.pet_id,
-            pet.name if pet else "",
-            placement.foster_profile_id,
-            placement.start_date.strftime("%Y-%m-%d") if placement.start_date else "",
-            placement.expected_end_date.strftime("%Y-%m-%d") if placement.expected_end_date else "",
-            placement.actual_end_date.strftime("%Y-%m-%d") if placement.actual_end_date else "",
-            placement.outcome.value if hasattr(placement.outcome, "value") else str(placement.outcome),
+        if result.actual_end_date and result.start_date:
+            duration = (result.actual_end_date - result.start_date).days
+        elif result.outcome == models.PlacementOutcome.active and result.start_date:
+            duration = (datetime.now() - result.start_date).days
+
+        return [
+            result.id,
+            result.pet_id,
+            result.pet_name or "",
+            result.foster_profile_id,
+            _date(result.start_date),
+            _date(result.expected_end_date),
+            _date(result.actual_end_date),
+            _enum(result.outcome),
             duration,
-            placement.placement_notes or ""
-        ])
+            result.placement_notes or ""
+        ]
 
-    return generate_csv(headers, rows)
+    return Export(db, headers, statement.order_by(placement.id), row, placement.updated_at)
 
 
-@router.get("/foster/performance/export")
-def export_foster_performance_report(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export foster performance report as CSV"""
-    profiles = db.query(models.FosterProfile).filter(
-        models.FosterProfile.org_id == current_user.org_id
-    ).all()
+def foster_performance_export(
+    db: Session, org_id: int, since: Optional[datetime] = None
+) -> Export:
+    profile = read_models.table(models.FosterProfile).c
+    statement = select(
+        profile.id, profile.user_id, profile.experience_level,
+        profile.max_capacity, profile.current_capacity, profile.total_fosters,
+        profile.successful_adoptions, profile.avg_foster_duration_days,
+        profile.rating, profile.is_available,
+    ).where(profile.org_id == org_id)
+    statement = _window(statement, profile.updated_at, since)
 
     headers = [
         "Profile ID", "User ID", "Experience Level", "Max Capacity",
@@ -180,175 +420,168 @@ def export_foster_performance_report(
         "Avg Duration (days)", "Rating", "Status"
     ]
 
-    rows = []
-    for profile in profiles:
-        rows.append([
-            profile.id,
-            profile.user_id,
-            profile.experience_level.value if hasattr(profile.experience_level, "value") else str(profile.experience_level),
-            profile.max_capacity or 0,
-            profile.current_capacity or 0,
-            profile.total_fosters or 0,
-            profile.successful_adoptions or 0,
-            f"{profile.avg_foster_duration_days:.1f}" if profile.avg_foster_duration_days else "0",
-            f"{profile.rating:.1f}" if profile.rating else "0",
-            profile.status or "unknown"
-        ])
-
-    return generate_csv(headers, rows)
-
-
-@router.get("/applications/export")
-def export_applications_report(
+    def row(result):
+        return [
+            result.id,
+            result.user_id,
+            _enum(result.experience_level),
+            result.max_capacity or 0,
+            result.current_capacity or 0,
+            result.total_fosters or 0,
+            result.successful_adoptions or 0,
+            f"{result.avg_foster_duration_days:.1f}" if result.avg_foster_duration_days else "0",
+            f"{result.rating:.1f}" if result.rating else "0",
+            "available" if result.is_available else "unavailable"
+        ]
+
+    return Export(db, headers, statement.order_by(profile.id), row, profile.updated_at)
+
+
+def applications_export(
+    db: Session,
+    org_id: int,
     type_filter: Optional[str] = None,
     status_filter: Optional[str] = None,
-    days: int = Query(default=90, ge=1, le=365),
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export applications report as CSV"""
-    cutoff_date = datetime.now() - timedelta(days=days)
-
-    query = db.query(models.Application).filter(
-        models.Application.org_id == current_user.org_id,
-        models.Application.created_at >= cutoff_date
-    )
+    days: int = 90,
+    since: Optional[datetime] = None,
+) -> Export:
+    application = read_models.table(models.Application).c
+    statement = select(
+        application.id, application.type, application.status,
+        application.applicant_user_id, application.pet_id, application.created_at,
+        application.updated_at,
+    ).where(application.org_id == org_id)
+    statement = _window(statement, application.updated_at, since, application.created_at, days)
 
     if type_filter:
         try:
             app_type = models.ApplicationType(type_filter)
-            query = query.filter(models.Application.type == app_type)
+            statement = statement.where(application.type == app_type)
         except ValueError:
             pass
 
     if status_filter:
         try:
             app_status = models.ApplicationStatus(status_filter)
-            query = query.filter(models.Application.status == app_status)
+            statement = statement.where(application.status == app_status)
         except ValueError:
             pass
 
-    applications = query.all()
-
     headers = [
         "Application ID", "Type", "Status", "Applicant User ID",
         "Pet ID", "Submitted Date", "Updated Date", "Days Pending"
     ]
 
-    rows = []
-    for app in applications:
-        days_pending = (datetime.now() - app.created_at).days if app.status in [
-            models.ApplicationStatus.submitted,
-            models.ApplicationStatus.under_review,
-            models.ApplicationStatus.interview_scheduled
-        ] else 0
-
-        rows.append([
-            app.id,
-            app.type.value if hasattr(app.type, "value") else str(app.type),
-            app.status.value if hasattr(app.status, "value") else str(app.status),
-            app.applicant_user_id,
-            app.pet_id or "",
-            app.created_at.strftime("%Y-%m-%d") if app.created_at else "",
-            app.updated_at.strftime("%Y-%m-%d") if app.updated_at else "",
-            days_pending
-        ])
-
-    return generate_csv(headers, rows)
-
-
-@router.get("/financial/donations/export")
-def export_donations_report(
-    days: int = Query(default=365, ge=1, le=730),
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export donations report as CSV"""
-    cutoff_date = datetime.now() - timedelta(days=days)
-
-    payments = db.query(models.Payment).filter(
-        models.Payment.org_id == current_user.org_id,
-        models.Payment.status == models.PaymentStatus.completed,
-        models.Payment.created_at >= cutoff_date
-    ).all()
+    pending = {
+        models.ApplicationStatus.submitted,
+        models.ApplicationStatus.under_review,
+        models.ApplicationStatus.interview_scheduled,
+    }
+    now = datetime.now()
+
+    def row(result):
+        return [
+            result.id,
+            _enum(result.type),
+            _enum(result.status),
+            result.applicant_user_id or "",
+            result.pet_id or "",
+            _date(result.created_at),
+            _date(result.updated_at),
+            (now - result.created_at).days if result.status in pending and result.created_at else 0
+        ]
+
+    return Export(db, headers, statement.order_by(application.id), row, application.updated_at)
+
+
+def donations_export(
+    db: Session, org_id: int, days: int = 365, since: Optional[datetime] = None
+) -> Export:
+    payment = read_models.table(models.Payment).c
+    statement = select(
+        payment.id, payment.amount, payment.created_at, payment.user_id,
+        payment.purpose, payment.status,
+    ).where(
+        payment.org_id == org_id,
+        payment.status == models.PaymentStatus.completed
+    )
+    statement = _window(statement, payment.updated_at, since, payment.created_at, days)
 
     headers = [
         "Payment ID", "Amount", "Date", "User ID", "Purpose", "Status"
     ]
 
-    rows = []
-    for payment in payments:
-        rows.append([
-            payment.id,
-            f"${payment.amount:.2f}" if payment.amount else "$0.00",
-            payment.created_at.strftime("%Y-%m-%d") if payment.created_at else "",
-            payment.user_id or "",
-            payment.purpose.value if hasattr(payment.purpose, "value") else str(payment.purpose),
-            payment.status.value if hasattr(payment.status, "value") else str(payment.status)
-        ])
-
-    return generate_csv(headers, rows)
-
-
-@router.get("/financial/expenses/export")
-def export_expenses_report(
-    days: int = Query(default=365, ge=1, le=730),
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export expenses report as CSV"""
-    cutoff_date = datetime.now() - timedelta(days=days)
-
-    expenses = db.query(models.Expense).filter(
-        models.Expense.org_id == current_user.org_id,
-        models.Expense.date_incurred >= cutoff_date
-    ).all()
+    def row(result):
+        return [
+            result.id,
+            f"${result.amount:.2f}" if result.amount else "$0.00",
+            _date(result.created_at),
+            result.user_id or "",
+            _enum(result.purpose),
+            _enum(result.status)
+        ]
+
+    statement = statement.order_by(payment.created_at, payment.id)
+    return Export(db, headers, statement, row, payment.updated_at)
+
+
+def expenses_export(
+    db: Session, org_id: int, days: int = 365, since: Optional[datetime] = None
+) -> Export:
+    expenses = read_models.table(models.Expense)
+    categories = read_models.table(models.ExpenseCategory)
+    expense, category = expenses.c, categories.c
+    statement = select(
+        expense.id, category.name.label("category"), expense.amount,
+        expense.date_incurred, expense.description,
+    ).select_from(
+        expenses.outerjoin(categories, category.id == expense.category_id)
+    ).where(expense.org_id == org_id)
+    statement = _window(statement, expense.updated_at, since, expense.date_incurred, days)
 
     headers = [
         "Expense ID", "Category", "Amount", "Date", "Description"
     ]
 
-    rows = []
-    for expense in expenses:
-        category = ""
-        if expense.category_id:
-            cat = db.query(models.ExpenseCategory).filter(
-                models.ExpenseCategory.id == expense.category_id
-            ).first()
-            category = cat.name if cat else ""
-
-        rows.append([
-            expense.id,
-            category,
-            f"${expense.amount:.2f}" if expense.amount else "$0.00",
-            expense.date_incurred.strftime("%Y-%m-%d") if expense.date_incurred else "",
-            expense.description or ""
-        ])
+    def row(result):
+        return [
+            result.id,
+            result.category or "",
+            f"${result.amount:.2f}" if result.amount else "$0.00",
+            _date(result.date_incurred),
+            result.description or ""
+        ]
 
-    return generate_csv(headers, rows)
+    statement = statement.order_by(expense.date_incurred, expense.id)
+    return Export(db, headers, statement, row, expense.updated_at)
 
 
-@router.get("/people/export")
-def export_people_report(
+def people_export(
+    db: Session,
+    org_id: int,
     tag_filter: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
-    """Export people/contacts report as CSV"""
-    query = db.query(models.Person).filter(models.Person.org_id == current_user.org_id)
+    since: Optional[datetime] = None,
+) -> Export:
+    person = read_models.table(models.Person).c
+    statement = select(
+        person.id, person.first_name, person.last_name, person.email,
+        person.phone, person.street_1, person.city, person.state,
+        person.zip_code, person.tag_adopter, person.tag_foster,
+        person.tag_volunteer, person.tag_donor,
+    ).where(person.org_id == org_id)
 
     # Apply tag filter if provided
     if tag_filter:
         tag_map = {
-            "adopter": models.Person.tag_adopter,
-            "foster": models.Person.tag_foster,
-            "volunteer": models.Person.tag_volunteer,
-            "donor": models.Person.tag_donor
+            "adopter": person.tag_adopter,
+            "foster": person.tag_foster,
+            "volunteer": person.tag_volunteer,
+            "donor": person.tag_donor
         }
         if tag_filter in tag_map:
-            query = query.filter(tag_map[tag_filter] == True)
+            statement = statement.where(tag_map[tag_filter] == True)
 
-    people = query.all()
+    statement = _window(statement, person.updated_at, since)
 
     headers = [
         "ID", "First Name", "Last Name", "Email", "Phone",
@@ -356,29 +589,381 @@ def export_people_report(
         "Tags"
     ]
 
-    rows = []
-    for person in people:
+    def row(result):
         tags = []
-        if person.tag_adopter:
+        if result.tag_adopter:
             tags.append("adopter")
-        if person.tag_foster:
+        if result.tag_foster:
             tags.append("foster")
-        if person.tag_volunteer:
+        if result.tag_volunteer:
             tags.append("volunteer")
-        if person.tag_donor:
+        if result.tag_donor:
             tags.append("donor")
 
-        rows.append([
-            person.id,
-            person.first_name or "",
-            person.last_name or "",
-            person.email or "",
-            person.phone or "",
-            person.street_1 or "",
-            person.city or "",
-            person.state or "",
-            person.zip_code or "",
+        return [
+            result.id,
+            result.first_name or "",
+            result.last_name or "",
+            result.email or "",
+            result.phone or "",
+            result.street_1 or "",
+            result.city or "",
+            result.state or "",
+            result.zip_code or "",
             ", ".join(tags)
-        ])
+        ]
+
+    return Export(db, headers, statement.order_by(person.id), row, person.updated_at)
+
+
+EXPORTS = {
+    "pets": pets_export,
+    "adoptions": adoptions_export,
+    "foster_placements": foster_placements_export,
+    "foster_performance": foster_performance_export,
+    "applications": applications_export,
+    "donations": donations_export,
+    "expenses": expenses_export,
+    "people": people_export,
+}
+
+
+# ============================================================================
+# STREAMED EXPORTS
+# ============================================================================
+
+
+@router.get("/pets/export")
+def export_pets_report(
+    status_filter: Optional[str] = None,
+    species: Optional[str] = None,
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export pets report as CSV or NDJSON"""
+    export = pets_export(db, current_user.org_id, status_filter, species, since=since)
+    return _respond(export, output, since)
+
+
+@router.get("/adoptions/export")
+def export_adoptions_report(
+    days: int = Query(default=90, ge=1, le=365),
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export adoptions report as CSV or NDJSON"""
+    export = adoptions_export(db, current_user.org_id, days, since=since)
+    return _respond(export, output, since)
+
+
+@router.get("/foster/placements/export")
+def export_foster_placements_report(
+    active_only: bool = False,
+    days: int = Query(default=90, ge=1, le=365),
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export foster placements report as CSV or NDJSON"""
+    export = foster_placements_export(db, current_user.org_id, active_only, days, since=since)
+    return _respond(export, output, since)
+
+
+@router.get("/foster/performance/export")
+def export_foster_performance_report(
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export foster performance report as CSV or NDJSON"""
+    export = foster_performance_export(db, current_user.org_id, since=since)
+    return _respond(export, output, since)
+
+
+@router.get("/applications/export")
+def export_applications_report(
+    type_filter: Optional[str] = None,
+    status_filter: Optional[str] = None,
+    days: int = Query(default=90, ge=1, le=365),
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export applications report as CSV or NDJSON"""
+    export = applications_export(
+        db, current_user.org_id, type_filter, status_filter, days, since=since
+    )
+    return _respond(export, output, since)
 
-    return generate_csv(headers, rows)
+
+@router.get("/financial/donations/export")
+def export_donations_report(
+    days: int = Query(default=365, ge=1, le=730),
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export donations report as CSV or NDJSON"""
+    export = donations_export(db, current_user.org_id, days, since=since)
+    return _respond(export, output, since)
+
+
+@router.get("/financial/expenses/export")
+def export_expenses_report(
+    days: int = Query(default=365, ge=1, le=730),
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export expenses report as CSV or NDJSON"""
+    export = expenses_export(db, current_user.org_id, days, since=since)
+    return _respond(export, output, since)
+
+
+@router.get("/people/export")
+def export_people_report(
+    tag_filter: Optional[str] = None,
+    since: Optional[datetime] = Depends(export_since),
+    db: Session = Depends(get_db),
+    output: ExportOutput = Depends(negotiate_export),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export people/contacts report as CSV or NDJSON"""
+    export = people_export(db, current_user.org_id, tag_filter, since=since)
+    return _respond(export, output, since)
+
+
+# ============================================================================
+# SNAPSHOT ARCHIVE
+# ============================================================================
+
+SNAPSHOT_MAX_WORKERS = int(os.getenv("REPORTS_SNAPSHOT_MAX_WORKERS", "4"))
+
+# Each rendered report stays in memory up to this size, then spills to disk
+SNAPSHOT_SPOOL_BYTES = int(os.getenv("REPORTS_SNAPSHOT_SPOOL_BYTES", str(1024 * 1024)))
+
+_snapshot_executor = ThreadPoolExecutor(
+    max_workers=SNAPSHOT_MAX_WORKERS, thread_name_prefix="reports-snapshot"
+)
+
+
+def _accepted_params(build: Callable, values: dict) -> dict:
+    """The non-empty ``values`` that the export builder takes as arguments."""
+    accepted = inspect.signature(build).parameters
+    return {
+        name: value
+        for name, value in values.items()
+        if value is not None and name in accepted
+    }
+
+
+def _render_report(name: str, bind, org_id: int, params: dict):
+    """Write one report's CSV to a spooled temp file on its own session."""
+    build = EXPORTS[name]
+    session = Session(bind=bind, autoflush=False)
+    spool = tempfile.SpooledTemporaryFile(max_size=SNAPSHOT_SPOOL_BYTES)
+    try:
+        export = build(session, org_id, **_accepted_params(build, params))
+        for chunk in _csv_chunks(export.headers, export.rows()):
+            spool.write(chunk.encode("utf-8"))
+    except Exception:
+        spool.close()
+        raise
+    finally:
+        session.close()
+    spool.seek(0)
+    return spool
+
+
+class _ZipStream:
+    """Unseekable sink for ZipFile; the bytes written so far are drained by the caller."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _snapshot_chunks(futures: dict, chunk_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """Add each report to a ZIP as soon as it finishes, yielding archive bytes."""
+    sink = _ZipStream()
+    errors = {}
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                spool = future.result()
+            except Exception as exc:
+                logger.exception("Snapshot report %s failed", name)
+                errors[name] = str(exc) or exc.__class__.__name__
+                continue
+
+            with spool, archive.open(f"{name}.csv", "w") as entry:
+                while True:
+                    data = spool.read(chunk_bytes)
+                    if not data:
+                        break
+                    entry.write(data)
+                    yield sink.drain()
+
+        if errors:
+            archive.writestr(
+                "errors.txt",
+                "".join(f"{name}: {message}\n" for name, message in sorted(errors.items())),
+            )
+    yield sink.drain()
+
+
+@router.get("/snapshot")
+def export_snapshot(
+    days: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=365,
+        description="Window for reports that take one; each report's default otherwise",
+    ),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Export every report as CSV files in one ZIP archive
+
+    Reports are built concurrently on a bounded thread pool, each with its
+    own database session, and added to the streamed archive in the order
+    they finish. A report that fails is listed in ``errors.txt`` inside the
+    archive instead of aborting the download.
+    """
+    bind = db.get_bind()
+    params = {"days": days}
+
+    # Copy the request context so per-request query stats include the workers
+    futures = {
+        _snapshot_executor.submit(
+            contextvars.copy_context().run,
+            _render_report,
+            name,
+            bind,
+            current_user.org_id,
+            params,
+        ): name
+        for name in EXPORTS
+    }
+
+    filename = f"snapshot-{datetime.utcnow():%Y-%m-%d}.zip"
+    return StreamingResponse(
+        _snapshot_chunks(futures),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+# ============================================================================
+# BACKGROUND EXPORT JOBS
+# ============================================================================
+
+
+def _get_job(db: Session, job_id: int, org_id: int) -> models.ExportJob:
+    job = db.query(models.ExportJob).filter(
+        models.ExportJob.id == job_id,
+        models.ExportJob.org_id == org_id
+    ).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@router.post(
+    "/exports",
+    response_model=schemas.ExportJob,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def create_export_job(
+    job_in: schemas.ExportJobCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Start writing an export to disk in the background
+
+    Poll ``GET /reports/exports/{id}`` until the job is completed, then fetch
+    the file from its download URL. An identical request for the same org
+    within EXPORT_JOB_REUSE_SECONDS, or while an identical job is still
+    running, returns the existing job instead of starting another one.
+    """
+    build = EXPORTS.get(job_in.report)
+    if build is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown report '{job_in.report}'. Choose from: {', '.join(EXPORTS)}",
+        )
+
+    # Keep only the filters this report accepts, so irrelevant ones do not
+    # defeat deduplication
+    params = _accepted_params(build, job_in.dict(exclude={"report"}))
+
+    export_jobs.sweep(db)
+    job, created = export_jobs.get_or_create(
+        db, current_user.org_id, current_user.id, job_in.report, params
+    )
+    if created:
+        export_jobs.submit(job.id, db.get_bind(), build)
+        db.refresh(job)
+    return export_jobs.with_progress(job)
+
+
+@router.get("/exports/{job_id}", response_model=schemas.ExportJob)
+def get_export_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Get the status and progress of an export job"""
+    return export_jobs.with_progress(_get_job(db, job_id, current_user.org_id))
+
+
+@router.get("/exports/{job_id}/download")
+def download_export_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Download a finished export
+
+    Served as a plain file, so clients can resume an interrupted download
+    with a ``Range`` header.
+    """
+    job = _get_job(db, job_id, current_user.org_id)
+    if job.status == models.ExportJobStatus.expired:
+        raise HTTPException(status_code=410, detail="Export file has expired")
+    if job.status != models.ExportJobStatus.completed:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Export job is {_enum(job.status)}",
+        )
+
+    path = export_jobs.artifact_path(job)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=410, detail="Export file has expired")
+
+    return FileResponse(
+        path,
+        media_type="text/csv",
+        filename=f"{job.report}-{job.id}.csv",
+    )
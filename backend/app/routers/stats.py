@@ -1,38 +1,48 @@
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, and_, or_, extract
+import contextvars
+import inspect
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, List, Literal, Optional
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, and_, or_, extract, case, select
 from sqlalchemy.orm import Session
 
-from .. import models
+from .. import models, read_models, rollups, stats_cache, timebuckets
 from ..deps import get_current_user, get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/adoptions_by_month")
+@stats_cache.cached(models.Application)
 def adoptions_by_month(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> List[Dict]:
+    month = timebuckets.bucket(db, models.Application.created_at, "month")
     rows = (
-        db.query(
-            func.strftime("%Y-%m", models.Application.created_at).label("month"),
-            func.count(models.Application.id),
-        )
+        db.query(month, func.count(models.Application.id))
         .filter(
             models.Application.org_id == user.org_id,
             models.Application.type == models.ApplicationType.adoption,
             models.Application.status == models.ApplicationStatus.approved,
         )
-        .group_by("month")
-        .order_by("month")
+        .group_by(month)
+        .order_by(month)
         .all()
     )
-    return [{"month": m, "count": c} for m, c in rows]
+    return [
+        {"month": timebuckets.bucket_label(m, "month"), "count": c} for m, c in rows
+    ]
 
 
 @router.get("/donations_summary")
+@stats_cache.cached(models.Payment)
 def donations_summary(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> Dict:
@@ -48,6 +58,7 @@ def donations_summary(
 
 
 @router.get("/pets_by_status")
+@stats_cache.cached(models.Pet)
 def pets_by_status(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> List[Dict]:
@@ -65,34 +76,35 @@ def pets_by_status(
 
 
 @router.get("/expenses_by_category")
+@stats_cache.cached(models.Expense, models.ExpenseCategory)
 def expenses_by_category(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> List[Dict]:
     rows = (
         db.query(
             models.Expense.category_id,
+            models.ExpenseCategory.name,
             func.count(models.Expense.id),
             func.sum(models.Expense.amount),
         )
+        .outerjoin(
+            models.ExpenseCategory,
+            and_(
+                models.ExpenseCategory.id == models.Expense.category_id,
+                models.ExpenseCategory.org_id == user.org_id,
+            ),
+        )
         .filter(models.Expense.org_id == user.org_id)
-        .group_by(models.Expense.category_id)
+        .group_by(models.Expense.category_id, models.ExpenseCategory.name)
         .all()
     )
 
     out: List[Dict] = []
-    for cat_id, count, total in rows:
-        cat = (
-            db.query(models.ExpenseCategory)
-            .filter(
-                models.ExpenseCategory.id == cat_id,
-                models.ExpenseCategory.org_id == user.org_id,
-            )
-            .first()
-        )
+    for cat_id, cat_name, count, total in rows:
         out.append(
             {
                 "category_id": cat_id,
-                "category_name": cat.name if cat else "Unknown",
+                "category_name": cat_name or "Unknown",
                 "count": count,
                 "total": float(total or 0.0),
             }
@@ -100,156 +112,179 @@ def expenses_by_category(
     return out
 
 
+def _count_if(condition):
+    """COUNT of the rows matching ``condition`` as a conditional aggregate."""
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _sum_if(column, condition):
+    """SUM of ``column`` over the rows matching ``condition``."""
+    return func.coalesce(func.sum(case((condition, column), else_=0)), 0)
+
+
 @router.get("/comprehensive_metrics")
+@stats_cache.cached(
+    models.Pet,
+    models.PetStatusEvent,
+    models.FosterProfile,
+    models.FosterPlacement,
+    models.Application,
+    models.Task,
+    models.Payment,
+    models.Expense,
+    models.Person,
+)
 def comprehensive_metrics(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> Dict:
-    """Get comprehensive metrics for the organization dashboard"""
+    """Get comprehensive metrics for the organization dashboard
+
+    Metrics that share a table are conditional aggregates in one query
+    against it (pets, foster profiles, applications, tasks, payments,
+    expenses, people). Monthly adoptions come from a separate query on the
+    status log, and active placements from a count on foster_placements.
+    That is nine queries, each a round trip, whatever the number of metrics
+    per table.
+    """
+    org_id = user.org_id
+    month_start, month_end = timebuckets.month_range()
 
     # Pet metrics
-    total_pets = db.query(func.count(models.Pet.id)).filter(
-        models.Pet.org_id == user.org_id
-    ).scalar() or 0
-
-    pets_available = db.query(func.count(models.Pet.id)).filter(
-        models.Pet.org_id == user.org_id,
-        models.Pet.status == models.PetStatus.available
-    ).scalar() or 0
-
-    pets_in_foster = db.query(func.count(models.Pet.id)).filter(
-        models.Pet.org_id == user.org_id,
-        models.Pet.status == models.PetStatus.in_foster
-    ).scalar() or 0
+    total_pets, pets_available, pets_in_foster = db.query(
+        func.count(models.Pet.id),
+        _count_if(models.Pet.status == models.PetStatus.available),
+        _count_if(models.Pet.status == models.PetStatus.in_foster),
+    ).filter(
+        models.Pet.org_id == org_id
+    ).one()
 
-    # TODO: Add updated_at field to Pet model to track when status changed
-    # For now, counting all adopted pets instead of just this month
-    pets_adopted_this_month = db.query(func.count(models.Pet.id)).filter(
-        models.Pet.org_id == user.org_id,
-        models.Pet.status == models.PetStatus.adopted
+    # Adoptions this month come from the status log (index range scan)
+    pets_adopted_this_month = db.query(
+        func.count(func.distinct(models.PetStatusEvent.pet_id))
+    ).filter(
+        models.PetStatusEvent.org_id == org_id,
+        models.PetStatusEvent.to_status == models.PetStatus.adopted,
+        timebuckets.in_range(models.PetStatusEvent.changed_at, month_start, month_end)
     ).scalar() or 0
 
     # Foster metrics
-    total_foster_profiles = db.query(func.count(models.FosterProfile.id)).filter(
-        models.FosterProfile.org_id == user.org_id
-    ).scalar() or 0
-
-    active_foster_profiles = db.query(func.count(models.FosterProfile.id)).filter(
-        models.FosterProfile.org_id == user.org_id,
-        models.FosterProfile.is_available == True
-    ).scalar() or 0
+    foster_row = db.query(
+        func.count(models.FosterProfile.id),
+        _count_if(models.FosterProfile.is_available == True),
+        _sum_if(
+            models.FosterProfile.max_capacity,
+            models.FosterProfile.is_available == True,
+        ),
+    ).filter(
+        models.FosterProfile.org_id == org_id
+    ).one()
+    total_foster_profiles, active_foster_profiles, total_capacity = foster_row
 
     active_placements = db.query(func.count(models.FosterPlacement.id)).filter(
-        models.FosterPlacement.org_id == user.org_id,
+        models.FosterPlacement.org_id == org_id,
         models.FosterPlacement.outcome == models.PlacementOutcome.active
     ).scalar() or 0
 
-    # Calculate foster capacity
-    total_capacity = db.query(
-        func.coalesce(func.sum(models.FosterProfile.max_capacity), 0)
-    ).filter(
-        models.FosterProfile.org_id == user.org_id,
-        models.FosterProfile.is_available == True
-    ).scalar() or 0
-
     available_capacity = int(total_capacity) - active_placements
 
     # Application metrics
-    pending_applications = db.query(func.count(models.Application.id)).filter(
-        models.Application.org_id == user.org_id,
-        models.Application.status.in_([
-            models.ApplicationStatus.submitted,
-            models.ApplicationStatus.under_review,
-            models.ApplicationStatus.interview_scheduled
-        ])
-    ).scalar() or 0
-
-    approved_applications_this_month = db.query(func.count(models.Application.id)).filter(
-        models.Application.org_id == user.org_id,
-        models.Application.status == models.ApplicationStatus.approved,
-        func.strftime("%Y-%m", models.Application.updated_at) == datetime.now().strftime("%Y-%m")
-    ).scalar() or 0
+    # Applications carry no updated_at, so approvals are bucketed by the
+    # month the application was submitted.
+    pending_applications, approved_applications_this_month = db.query(
+        _count_if(
+            models.Application.status.in_([
+                models.ApplicationStatus.submitted,
+                models.ApplicationStatus.under_review,
+                models.ApplicationStatus.interview_scheduled
+            ])
+        ),
+        _count_if(
+            and_(
+                models.Application.status == models.ApplicationStatus.approved,
+                timebuckets.in_range(
+                    models.Application.created_at, month_start, month_end
+                )
+            )
+        ),
+    ).filter(
+        models.Application.org_id == org_id
+    ).one()
 
     # Task metrics
-    open_tasks = db.query(func.count(models.Task.id)).filter(
-        models.Task.org_id == user.org_id,
+    open_tasks, urgent_tasks = db.query(
+        func.count(models.Task.id),
+        _count_if(models.Task.priority == models.TaskPriority.urgent),
+    ).filter(
+        models.Task.org_id == org_id,
         models.Task.status.in_([models.TaskStatus.open, models.TaskStatus.in_progress])
-    ).scalar() or 0
-
-    urgent_tasks = db.query(func.count(models.Task.id)).filter(
-        models.Task.org_id == user.org_id,
-        models.Task.status.in_([models.TaskStatus.open, models.TaskStatus.in_progress]),
-        models.Task.priority == models.TaskPriority.urgent
-    ).scalar() or 0
+    ).one()
 
     # Financial metrics
-    total_donations = db.query(
-        func.coalesce(func.sum(models.Payment.amount), 0.0)
+    total_donations, donations_this_month = db.query(
+        func.coalesce(func.sum(models.Payment.amount), 0.0),
+        _sum_if(
+            models.Payment.amount,
+            timebuckets.in_range(models.Payment.created_at, month_start, month_end)
+        ),
     ).filter(
-        models.Payment.org_id == user.org_id,
+        models.Payment.org_id == org_id,
         models.Payment.status == models.PaymentStatus.completed
-    ).scalar() or 0.0
+    ).one()
 
     total_expenses = db.query(
         func.coalesce(func.sum(models.Expense.amount), 0.0)
     ).filter(
-        models.Expense.org_id == user.org_id
-    ).scalar() or 0.0
-
-    donations_this_month = db.query(
-        func.coalesce(func.sum(models.Payment.amount), 0.0)
-    ).filter(
-        models.Payment.org_id == user.org_id,
-        models.Payment.status == models.PaymentStatus.completed,
-        func.strftime("%Y-%m", models.Payment.created_at) == datetime.now().strftime("%Y-%m")
+        models.Expense.org_id == org_id
     ).scalar() or 0.0
 
     # Volunteer/people metrics
-    total_volunteers = db.query(func.count(models.Person.id)).filter(
-        models.Person.org_id == user.org_id,
-        models.Person.tag_volunteer == True
-    ).scalar() or 0
+    total_volunteers, total_donors = db.query(
+        _count_if(models.Person.tag_volunteer == True),
+        _count_if(models.Person.tag_donor == True),
+    ).filter(
+        models.Person.org_id == org_id
+    ).one()
 
-    total_donors = db.query(func.count(models.Person.id)).filter(
-        models.Person.org_id == user.org_id,
-        models.Person.tag_donor == True
-    ).scalar() or 0
+    total_donations = float(total_donations or 0.0)
+    total_expenses = float(total_expenses)
 
     return {
         "pet_metrics": {
             "total_pets": total_pets,
-            "pets_available": pets_available,
-            "pets_in_foster": pets_in_foster,
-            "pets_adopted_this_month": pets_adopted_this_month
+            "pets_available": int(pets_available),
+            "pets_in_foster": int(pets_in_foster),
+            "pets_adopted_this_month": int(pets_adopted_this_month)
         },
         "foster_metrics": {
             "total_foster_profiles": total_foster_profiles,
-            "active_foster_profiles": active_foster_profiles,
+            "active_foster_profiles": int(active_foster_profiles),
             "active_placements": active_placements,
             "total_capacity": int(total_capacity),
             "available_capacity": available_capacity
         },
         "application_metrics": {
-            "pending_applications": pending_applications,
-            "approved_applications_this_month": approved_applications_this_month
+            "pending_applications": int(pending_applications),
+            "approved_applications_this_month": int(approved_applications_this_month)
         },
         "task_metrics": {
             "open_tasks": open_tasks,
-            "urgent_tasks": urgent_tasks
+            "urgent_tasks": int(urgent_tasks)
         },
         "financial_metrics": {
-            "total_donations": float(total_donations),
-            "total_expenses": float(total_expenses),
-            "donations_this_month": float(donations_this_month),
-            "net_balance": float(total_donations - total_expenses)
+            "total_donations": total_donations,
+            "total_expenses": total_expenses,
+            "donations_this_month": float(donations_this_month or 0.0),
+            "net_balance": total_donations - total_expenses
         },
         "people_metrics": {
-            "total_volunteers": total_volunteers,
-            "total_donors": total_donors
+            "total_volunteers": int(total_volunteers),
+            "total_donors": int(total_donors)
         }
     }
 
 
 @router.get("/intake_trends")
+@stats_cache.cached(models.Pet, models.OrgDailyMetric)
 def intake_trends(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -257,57 +292,34 @@ def intake_trends(
 ) -> List[Dict]:
     """Get pet intake trends over time"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_day = timebuckets.since_day(days)
 
-    rows = (
-        db.query(
-            func.date(models.Pet.intake_date).label("date"),
-            func.count(models.Pet.id).label("count")
-        )
-        .filter(
-            models.Pet.org_id == user.org_id,
-            models.Pet.intake_date >= cutoff_date
-        )
-        .group_by(func.date(models.Pet.intake_date))
-        .order_by(func.date(models.Pet.intake_date))
-        .all()
-    )
+    rows = rollups.daily_series(db, user.org_id, cutoff_day, rollups.PET_INTAKE)
 
-    return [{"date": str(date), "count": count} for date, count in rows]
+    return [{"date": str(date), "count": int(count)} for date, count, _ in rows]
 
 
 @router.get("/adoption_trends")
+@stats_cache.cached(models.Pet, models.PetStatusEvent, models.OrgDailyMetric)
 def adoption_trends(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
     user=Depends(get_current_user)
 ) -> List[Dict]:
-    """Get adoption trends over time"""
+    """Get adoption trends over time
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    Adoptions are counted on the day the pet entered the adopted status.
+    """
 
-    # TODO: Add updated_at field to Pet model to track when status changed
-    # For now, using created_at as approximation (not accurate for adoption trends)
-    # This will show when pets were added to system, not when they were adopted
-    rows = (
-        db.query(
-            func.date(models.Pet.created_at).label("date"),
-            func.count(models.Pet.id).label("count")
-        )
-        .filter(
-            models.Pet.org_id == user.org_id,
-            models.Pet.status == models.PetStatus.adopted,
-            models.Pet.created_at >= cutoff_date
-        )
-        .group_by(func.date(models.Pet.created_at))
-        .order_by(func.date(models.Pet.created_at))
-        .all()
-    )
+    cutoff_day = timebuckets.since_day(days)
+
+    rows = rollups.daily_series(db, user.org_id, cutoff_day, rollups.PET_ADOPTED)
 
-    return [{"date": str(date), "count": count} for date, count in rows]
+    return [{"date": str(date), "count": int(count)} for date, count, _ in rows]
 
 
 @router.get("/foster_performance")
+@stats_cache.cached(models.FosterPlacement, models.FosterProfile, models.User)
 def foster_performance(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> Dict:
@@ -352,26 +364,32 @@ def foster_performance(
     ).scalar() or 0.0
 
     # Top performing fosters
-    top_fosters = db.query(
-        models.FosterProfile.id,
-        models.FosterProfile.user_id,
-        models.FosterProfile.successful_adoptions,
-        models.FosterProfile.rating
-    ).filter(
-        models.FosterProfile.org_id == user.org_id,
-        models.FosterProfile.is_available == True
+    profile = read_models.table(models.FosterProfile).c
+    users = read_models.table(models.User).c
+    top_fosters = read_models.rows(db, select(
+        profile.id,
+        profile.user_id,
+        profile.successful_adoptions,
+        profile.rating,
+        users.full_name
+    ).outerjoin_from(
+        read_models.table(models.FosterProfile),
+        read_models.table(models.User),
+        users.id == profile.user_id
+    ).where(
+        profile.org_id == user.org_id,
+        profile.is_available == True
     ).order_by(
-        models.FosterProfile.successful_adoptions.desc(),
-        models.FosterProfile.rating.desc()
-    ).limit(10).all()
+        profile.successful_adoptions.desc(),
+        profile.rating.desc()
+    ).limit(10))
 
     top_fosters_data = []
     for profile in top_fosters:
-        user_obj = db.query(models.User).filter(models.User.id == profile.user_id).first()
         top_fosters_data.append({
             "profile_id": profile.id,
             "user_id": profile.user_id,
-            "user_name": user_obj.full_name if user_obj else "Unknown",
+            "user_name": profile.full_name or "Unknown",
             "successful_adoptions": profile.successful_adoptions or 0,
             "rating": float(profile.rating) if profile.rating else 0.0
         })
@@ -386,6 +404,7 @@ def foster_performance(
 
 
 @router.get("/species_breakdown")
+@stats_cache.cached(models.Pet)
 def species_breakdown(
     db: Session = Depends(get_db), user=Depends(get_current_user)
 ) -> List[Dict]:
@@ -405,6 +424,7 @@ def species_breakdown(
 
 
 @router.get("/application_trends")
+@stats_cache.cached(models.Application, models.OrgDailyMetric)
 def application_trends(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -412,64 +432,35 @@ def application_trends(
 ) -> Dict:
     """Get application submission and approval trends"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_day = timebuckets.since_day(days)
 
     # Applications by type
-    by_type = db.query(
-        models.Application.type,
-        func.count(models.Application.id)
-    ).filter(
-        models.Application.org_id == user.org_id,
-        models.Application.created_at >= cutoff_date
-    ).group_by(
-        models.Application.type
-    ).all()
+    by_type = rollups.breakdown(db, user.org_id, cutoff_day, rollups.APPLICATION_TYPE)
+    type_data = {app_type: count for app_type, (count, _) in by_type.items()}
 
-    type_data = {}
-    for app_type, count in by_type:
-        type_value = app_type.value if hasattr(app_type, "value") else str(app_type)
-        type_data[type_value] = count
-
-    # Applications by status
-    by_status = db.query(
-        models.Application.status,
-        func.count(models.Application.id)
-    ).filter(
-        models.Application.org_id == user.org_id,
-        models.Application.created_at >= cutoff_date
-    ).group_by(
-        models.Application.status
-    ).all()
-
-    status_data = {}
-    for app_status, count in by_status:
-        status_value = app_status.value if hasattr(app_status, "value") else str(app_status)
-        status_data[status_value] = count
+    # Applications by (current) status, bucketed by submission day
+    by_status = rollups.breakdown(
+        db, user.org_id, cutoff_day, rollups.APPLICATION_STATUS
+    )
+    status_data = {app_status: count for app_status, (count, _) in by_status.items()}
 
     # Daily submissions
-    daily_submissions = db.query(
-        func.date(models.Application.created_at).label("date"),
-        func.count(models.Application.id).label("count")
-    ).filter(
-        models.Application.org_id == user.org_id,
-        models.Application.created_at >= cutoff_date
-    ).group_by(
-        func.date(models.Application.created_at)
-    ).order_by(
-        func.date(models.Application.created_at)
-    ).all()
+    daily_submissions = rollups.daily_series(
+        db, user.org_id, cutoff_day, rollups.APPLICATION_TYPE, prefix=True
+    )
 
     return {
         "by_type": type_data,
         "by_status": status_data,
         "daily_submissions": [
-            {"date": str(date), "count": count}
-            for date, count in daily_submissions
+            {"date": str(date), "count": int(count)}
+            for date, count, _ in daily_submissions
         ]
     }
 
 
 @router.get("/medical_operations")
+@stats_cache.cached(models.Pet, models.MedicalRecord, models.Appointment)
 def medical_operations(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -477,7 +468,7 @@ def medical_operations(
 ) -> Dict:
     """Get medical and veterinary operations metrics"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_date, _ = timebuckets.last_n_days(days)
 
     # Total medical records
     total_records = db.query(func.count(models.MedicalRecord.id)).filter(
@@ -533,6 +524,7 @@ def medical_operations(
 
 
 @router.get("/event_participation")
+@stats_cache.cached(models.Event, models.EventSignup)
 def event_participation(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -540,18 +532,18 @@ def event_participation(
 ) -> Dict:
     """Get event participation and volunteer engagement metrics"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_date, _ = timebuckets.last_n_days(days)
 
     # Total events
     total_events = db.query(func.count(models.Event.id)).filter(
         models.Event.org_id == user.org_id,
-        models.Event.date_time >= cutoff_date
+        models.Event.start_datetime >= cutoff_date
     ).scalar() or 0
 
     # Upcoming events
     upcoming_events = db.query(func.count(models.Event.id)).filter(
         models.Event.org_id == user.org_id,
-        models.Event.date_time >= datetime.now()
+        models.Event.start_datetime >= datetime.now()
     ).scalar() or 0
 
     # Total signups
@@ -559,7 +551,7 @@ def event_participation(
         models.Event
     ).filter(
         models.Event.org_id == user.org_id,
-        models.Event.date_time >= cutoff_date
+        models.Event.start_datetime >= cutoff_date
     ).scalar() or 0
 
     # Average signups per event
@@ -574,7 +566,7 @@ def event_participation(
         models.EventSignup
     ).filter(
         models.Event.org_id == user.org_id,
-        models.Event.date_time >= cutoff_date,
+        models.Event.start_datetime >= cutoff_date,
         models.Event.capacity.isnot(None)
     ).group_by(
         models.Event.id
@@ -594,6 +586,7 @@ def event_participation(
 
 
 @router.get("/communication_metrics")
+@stats_cache.cached(models.MessageThread, models.Message)
 def communication_metrics(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -601,7 +594,7 @@ def communication_metrics(
 ) -> Dict:
     """Get messaging and communication metrics"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_date, _ = timebuckets.last_n_days(days)
 
     # Total message threads
     total_threads = db.query(func.count(models.MessageThread.id)).filter(
@@ -614,7 +607,7 @@ def communication_metrics(
         models.MessageThread
     ).filter(
         models.MessageThread.org_id == user.org_id,
-        models.Message.created_at >= cutoff_date
+        models.Message.sent_at >= cutoff_date
     ).scalar() or 0
 
     # Average messages per thread
@@ -639,6 +632,7 @@ def communication_metrics(
 
 
 @router.get("/document_metrics")
+@stats_cache.cached(models.Document)
 def document_metrics(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -646,12 +640,12 @@ def document_metrics(
 ) -> Dict:
     """Get document management metrics"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    cutoff_date, _ = timebuckets.last_n_days(days)
 
     # Total documents
     total_docs = db.query(func.count(models.Document.id)).filter(
         models.Document.org_id == user.org_id,
-        models.Document.uploaded_at >= cutoff_date
+        models.Document.created_at >= cutoff_date
     ).scalar() or 0
 
     # Documents by visibility
@@ -660,7 +654,7 @@ def document_metrics(
         func.count(models.Document.id)
     ).filter(
         models.Document.org_id == user.org_id,
-        models.Document.uploaded_at >= cutoff_date
+        models.Document.created_at >= cutoff_date
     ).group_by(
         models.Document.visibility
     ).all()
@@ -670,23 +664,17 @@ def document_metrics(
         vis_value = visibility.value if hasattr(visibility, "value") else str(visibility)
         visibility_data[vis_value] = count
 
-    # Documents by entity type (pet, application, person)
+    # Documents by linked entity
     pet_docs = db.query(func.count(models.Document.id)).filter(
         models.Document.org_id == user.org_id,
         models.Document.pet_id.isnot(None),
-        models.Document.uploaded_at >= cutoff_date
-    ).scalar() or 0
-
-    application_docs = db.query(func.count(models.Document.id)).filter(
-        models.Document.org_id == user.org_id,
-        models.Document.application_id.isnot(None),
-        models.Document.uploaded_at >= cutoff_date
+        models.Document.created_at >= cutoff_date
     ).scalar() or 0
 
     person_docs = db.query(func.count(models.Document.id)).filter(
         models.Document.org_id == user.org_id,
         models.Document.person_id.isnot(None),
-        models.Document.uploaded_at >= cutoff_date
+        models.Document.created_at >= cutoff_date
     ).scalar() or 0
 
     return {
@@ -694,13 +682,13 @@ def document_metrics(
         "by_visibility": visibility_data,
         "by_entity": {
             "pet_documents": pet_docs,
-            "application_documents": application_docs,
             "person_documents": person_docs
         }
     }
 
 
 @router.get("/financial_operations")
+@stats_cache.cached(models.Payment, models.Expense, models.OrgDailyMetric)
 def financial_operations(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
@@ -708,120 +696,176 @@ def financial_operations(
 ) -> Dict:
     """Get detailed financial operations metrics"""
 
-    cutoff_date = datetime.now() - timedelta(days=days)
-
-    # Payments by purpose
-    by_purpose = db.query(
-        models.Payment.purpose,
-        func.count(models.Payment.id),
-        func.coalesce(func.sum(models.Payment.amount), 0.0)
-    ).filter(
-        models.Payment.org_id == user.org_id,
-        models.Payment.created_at >= cutoff_date,
-        models.Payment.status == models.PaymentStatus.completed
-    ).group_by(
-        models.Payment.purpose
-    ).all()
-
-    purpose_data = {}
-    for purpose, count, total in by_purpose:
-        purpose_value = purpose.value if hasattr(purpose, "value") else str(purpose)
-        purpose_data[purpose_value] = {
-            "count": count,
-            "total_amount": float(total)
-        }
+    cutoff_day = timebuckets.since_day(days)
 
-    # Payments by provider
-    by_provider = db.query(
-        models.Payment.provider,
-        func.count(models.Payment.id),
-        func.coalesce(func.sum(models.Payment.amount), 0.0)
-    ).filter(
-        models.Payment.org_id == user.org_id,
-        models.Payment.created_at >= cutoff_date,
-        models.Payment.status == models.PaymentStatus.completed
-    ).group_by(
-        models.Payment.provider
-    ).all()
+    # Completed payments by purpose
+    by_purpose = rollups.breakdown(db, user.org_id, cutoff_day, rollups.PAYMENT_PURPOSE)
+    purpose_data = {
+        purpose: {"count": count, "total_amount": total}
+        for purpose, (count, total) in by_purpose.items()
+    }
 
-    provider_data = {}
-    for provider, count, total in by_provider:
-        provider_data[provider] = {
-            "count": count,
-            "total_amount": float(total)
-        }
+    # Completed payments by provider
+    by_provider = rollups.breakdown(
+        db, user.org_id, cutoff_day, rollups.PAYMENT_PROVIDER
+    )
+    # Payments without a provider are stored under an empty dimension and
+    # reported under None
+    provider_data = {
+        provider or None: {"count": count, "total_amount": total}
+        for provider, (count, total) in by_provider.items()
+    }
 
     # Daily payment trends
-    daily_payments = db.query(
-        func.date(models.Payment.created_at).label("date"),
-        func.count(models.Payment.id).label("count"),
-        func.coalesce(func.sum(models.Payment.amount), 0.0).label("total")
-    ).filter(
-        models.Payment.org_id == user.org_id,
-        models.Payment.created_at >= cutoff_date,
-        models.Payment.status == models.PaymentStatus.completed
-    ).group_by(
-        func.date(models.Payment.created_at)
-    ).order_by(
-        func.date(models.Payment.created_at)
-    ).all()
+    daily_payments = rollups.daily_series(
+        db, user.org_id, cutoff_day, rollups.PAYMENT_PURPOSE, prefix=True
+    )
 
     # Expense trends
-    daily_expenses = db.query(
-        func.date(models.Expense.date).label("date"),
-        func.count(models.Expense.id).label("count"),
-        func.coalesce(func.sum(models.Expense.amount), 0.0).label("total")
-    ).filter(
-        models.Expense.org_id == user.org_id,
-        models.Expense.date >= cutoff_date
-    ).group_by(
-        func.date(models.Expense.date)
-    ).order_by(
-        func.date(models.Expense.date)
-    ).all()
+    daily_expenses = rollups.daily_series(
+        db, user.org_id, cutoff_day, rollups.EXPENSE
+    )
 
     return {
         "by_purpose": purpose_data,
         "by_provider": provider_data,
         "daily_payments": [
-            {"date": str(date), "count": count, "total": float(total)}
+            {"date": str(date), "count": int(count), "total": float(total or 0.0)}
             for date, count, total in daily_payments
         ],
         "daily_expenses": [
-            {"date": str(date), "count": count, "total": float(total)}
+            {"date": str(date), "count": int(count), "total": float(total or 0.0)}
             for date, count, total in daily_expenses
         ]
     }
 
 
+def _avg_days_to_adoption(db: Session, org_id: int, start=None, end=None):
+    """Average days from intake (or creation) to the adopted status change."""
+    event = models.PetStatusEvent
+    query = db.query(
+        func.avg(
+            timebuckets.days_between(
+                db,
+                func.coalesce(models.Pet.intake_date, models.Pet.created_at),
+                event.changed_at,
+            )
+        )
+    ).join(
+        models.Pet, models.Pet.id == event.pet_id
+    ).filter(
+        event.org_id == org_id,
+        event.to_status == models.PetStatus.adopted
+    )
+    if start is not None:
+        query = query.filter(timebuckets.in_range(event.changed_at, start, end))
+    value = query.scalar()
+    return float(value) if value is not None else None
+
+
+@router.get("/time_to_adoption")
+@stats_cache.cached(models.Pet, models.PetStatusEvent)
+def time_to_adoption(
+    days: int = Query(default=365, ge=7, le=3650),
+    unit: Literal["day", "month", "year"] = "month",
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+) -> Dict:
+    """Get adoptions per period and the average days from intake to adoption"""
+
+    start, end = timebuckets.last_n_days(days)
+    event = models.PetStatusEvent
+    period = timebuckets.bucket(db, event.changed_at, unit)
+
+    rows = db.query(
+        period,
+        func.count(event.id),
+        func.avg(
+            timebuckets.days_between(
+                db,
+                func.coalesce(models.Pet.intake_date, models.Pet.created_at),
+                event.changed_at,
+            )
+        )
+    ).join(
+        models.Pet, models.Pet.id == event.pet_id
+    ).filter(
+        event.org_id == user.org_id,
+        event.to_status == models.PetStatus.adopted,
+        timebuckets.in_range(event.changed_at, start, end)
+    ).group_by(period).order_by(period).all()
+
+    avg_days = _avg_days_to_adoption(db, user.org_id, start, end)
+
+    return {
+        "avg_days_to_adoption": round(avg_days, 2) if avg_days is not None else 0,
+        "periods": [
+            {
+                "period": timebuckets.bucket_label(value, unit),
+                "adoptions": count,
+                "avg_days_to_adoption": round(float(avg or 0), 2),
+            }
+            for value, count, avg in rows
+        ]
+    }
+
+
+@router.get("/time_in_status")
+@stats_cache.cached(models.PetStatusEvent)
+def time_in_status(
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+) -> List[Dict]:
+    """Get the average days pets spend in each status
+
+    Each transition lasts until the pet's next transition (LEAD over the
+    pet's events), or until now for its current status.
+    """
+
+    event = models.PetStatusEvent
+    next_changed_at = func.lead(event.changed_at).over(
+        partition_by=event.pet_id, order_by=(event.changed_at, event.id)
+    )
+    spans = db.query(
+        event.to_status.label("status"),
+        event.changed_at.label("started_at"),
+        next_changed_at.label("ended_at"),
+    ).filter(
+        event.org_id == user.org_id
+    ).subquery()
+
+    duration = timebuckets.days_between(
+        db, spans.c.started_at, func.coalesce(spans.c.ended_at, datetime.utcnow())
+    )
+    rows = db.query(
+        spans.c.status,
+        func.count(),
+        func.avg(duration),
+        _count_if(spans.c.ended_at.is_(None)),
+    ).group_by(spans.c.status).all()
+
+    out: List[Dict] = []
+    for status, count, avg_days, current in rows:
+        status_value = status.value if hasattr(status, "value") else str(status)
+        out.append({
+            "status": status_value,
+            "transitions": count,
+            "pets_currently_in_status": int(current),
+            "avg_days_in_status": round(float(avg_days or 0), 2),
+        })
+    return out
+
+
 @router.get("/operational_efficiency")
+@stats_cache.cached(models.Pet, models.PetStatusEvent, models.Task, models.Application)
 def operational_efficiency(
     db: Session = Depends(get_db),
     user=Depends(get_current_user)
 ) -> Dict:
     """Get operational efficiency metrics"""
 
-    # Average time to adoption (from intake to adopted status)
-    # Note: This is an approximation since we don't track status change timestamps
-    adopted_pets = db.query(
-        models.Pet.intake_date,
-        models.Pet.created_at
-    ).filter(
-        models.Pet.org_id == user.org_id,
-        models.Pet.status == models.PetStatus.adopted,
-        models.Pet.intake_date.isnot(None)
-    ).all()
-
-    if adopted_pets:
-        # Calculate average days from intake to now (approximation)
-        total_days = sum(
-            (datetime.now().date() - pet.intake_date).days
-            for pet in adopted_pets
-            if pet.intake_date
-        )
-        avg_days_to_adoption = total_days / len(adopted_pets)
-    else:
-        avg_days_to_adoption = 0
+    # Average time to adoption (from intake to the adopted transition)
+    avg_days_to_adoption = _avg_days_to_adoption(db, user.org_id) or 0
 
     # Task completion rate
     total_tasks = db.query(func.count(models.Task.id)).filter(
@@ -855,14 +899,15 @@ def operational_efficiency(
         avg_task_completion_hours = 0
 
     # Application processing efficiency
-    approved_apps = db.query(
-        models.Application.created_at,
-        models.Application.updated_at
-    ).filter(
-        models.Application.org_id == user.org_id,
-        models.Application.status == models.ApplicationStatus.approved,
-        models.Application.updated_at.isnot(None)
-    ).all()
+    application = read_models.table(models.Application).c
+    approved_apps = read_models.rows(db, select(
+        application.created_at,
+        application.updated_at
+    ).where(
+        application.org_id == user.org_id,
+        application.status == models.ApplicationStatus.approved,
+        application.updated_at.isnot(None)
+    ))
 
     if approved_apps:
         total_days = sum(
@@ -882,28 +927,29 @@ def operational_efficiency(
 
 
 @router.get("/user_activity")
+@stats_cache.cached(
+    models.User, models.Role, models.UserRole, models.AuditLog, models.UserActivityDaily
+)
 def user_activity(
     days: int = Query(default=30, ge=7, le=365),
     db: Session = Depends(get_db),
     user=Depends(get_current_user)
 ) -> Dict:
-    """Get user and staff activity metrics"""
+    """Get user and staff activity metrics
 
-    cutoff_date = datetime.now() - timedelta(days=days)
+    Activity comes from the user_activity_daily rollup that audit.log_action
+    maintains, so the window never scans audit_logs.
+    """
+
+    cutoff_day = timebuckets.since_day(days)
 
     # Total users
     total_users = db.query(func.count(models.User.id)).filter(
         models.User.org_id == user.org_id
     ).scalar() or 0
 
-    # Active users (users who created/updated something recently)
-    # Using audit logs if available
-    active_user_ids = db.query(models.AuditLog.user_id.distinct()).filter(
-        models.AuditLog.org_id == user.org_id,
-        models.AuditLog.created_at >= cutoff_date
-    ).all()
-
-    active_users = len(active_user_ids) if active_user_ids else 0
+    # Active users (users with at least one audited action in the window)
+    active_users = rollups.active_users(db, user.org_id, cutoff_day)
 
     # Users by role
     role_counts = db.query(
@@ -921,11 +967,9 @@ def user_activity(
 
     users_by_role = {role: count for role, count in role_counts}
 
-    # New users registered in period
-    new_users = db.query(func.count(models.User.id)).filter(
-        models.User.org_id == user.org_id,
-        models.User.created_at >= cutoff_date
-    ).scalar() or 0
+    # New users: users has no created_at, so count users whose first
+    # recorded activity falls in the period
+    new_users = rollups.first_active_users(db, user.org_id, cutoff_day)
 
     return {
         "total_users": total_users,
@@ -933,3 +977,124 @@ def user_activity(
         "new_users": new_users,
         "users_by_role": users_by_role
     }
+
+
+# ============================================================================
+# COMPOSITE DASHBOARD
+# ============================================================================
+
+DASHBOARD_MAX_WORKERS = int(os.getenv("STATS_DASHBOARD_MAX_WORKERS", "4"))
+DASHBOARD_SECTION_ERROR = "section failed"
+
+DASHBOARD_SECTIONS = {
+    "adoptions_by_month": adoptions_by_month,
+    "donations_summary": donations_summary,
+    "pets_by_status": pets_by_status,
+    "expenses_by_category": expenses_by_category,
+    "comprehensive_metrics": comprehensive_metrics,
+    "intake_trends": intake_trends,
+    "adoption_trends": adoption_trends,
+    "foster_performance": foster_performance,
+    "species_breakdown": species_breakdown,
+    "application_trends": application_trends,
+    "medical_operations": medical_operations,
+    "event_participation": event_participation,
+    "communication_metrics": communication_metrics,
+    "document_metrics": document_metrics,
+    "financial_operations": financial_operations,
+    "time_to_adoption": time_to_adoption,
+    "time_in_status": time_in_status,
+    "operational_efficiency": operational_efficiency,
+    "user_activity": user_activity,
+}
+
+# Left out when no sections are named: tasks do not record when they were
+# completed, so operational_efficiency cannot compute its task timings yet
+DASHBOARD_DEFAULT_SECTIONS = [
+    name for name in DASHBOARD_SECTIONS if name != "operational_efficiency"
+]
+
+_dashboard_executor = ThreadPoolExecutor(
+    max_workers=DASHBOARD_MAX_WORKERS, thread_name_prefix="stats-dashboard"
+)
+
+
+def _run_section(name: str, bind, user, days: int):
+    """Compute one dashboard section on its own session."""
+    section = DASHBOARD_SECTIONS[name]
+    kwargs = {"user": user}
+    if "days" in inspect.signature(section).parameters:
+        kwargs["days"] = days
+
+    session = Session(bind=bind, autoflush=False)
+    try:
+        return section(db=session, **kwargs)
+    finally:
+        session.close()
+
+
+@router.get("/dashboard")
+def dashboard(
+    sections: Optional[str] = Query(
+        default=None,
+        description="Comma-separated section names; every section except "
+        "operational_efficiency when omitted",
+    ),
+    days: int = Query(default=30, ge=7, le=365),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user)
+) -> Dict:
+    """Get several stats sections in one request
+
+    Sections run concurrently on a bounded thread pool, each with its own
+    database session, so the response takes about as long as the slowest
+    section. A failing section is reported under ``errors`` and does not
+    affect the others.
+    """
+
+    if sections:
+        requested = [name.strip() for name in sections.split(",") if name.strip()]
+    else:
+        requested = list(DASHBOARD_DEFAULT_SECTIONS)
+
+    unknown = [name for name in requested if name not in DASHBOARD_SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown sections: {', '.join(unknown)}",
+        )
+
+    # Authenticated once; workers only need the ids, not the ORM object
+    section_user = SimpleNamespace(id=user.id, org_id=user.org_id)
+    bind = db.get_bind()
+
+    # Copy the request context so per-request query stats include the workers
+    futures = {
+        name: _dashboard_executor.submit(
+            contextvars.copy_context().run,
+            _run_section,
+            name,
+            bind,
+            section_user,
+            days,
+        )
+        for name in dict.fromkeys(requested)
+    }
+
+    results: Dict = {}
+    errors: Dict = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception:
+            # Details stay in the log; they can include SQL and schema names
+            logger.exception("Stats dashboard section %s failed", name)
+            errors[name] = DASHBOARD_SECTION_ERROR
+
+    return {"sections": results, "errors": errors}
+
+
+@router.get("/cache")
+def cache_info(user=Depends(get_current_user)) -> Dict:
+    """Get stats cache hit/miss counters and backend usage"""
+    return stats_cache.cache.info()
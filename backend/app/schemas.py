@@ -1,6 +1,6 @@
 from datetime import datetime, date
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, EmailStr, Field, validator
 
@@ -244,11 +244,21 @@ class Pet(PetBase):
     id: int
     org_id: int
     created_at: datetime
+    needs_medical: bool = False
+    needs_behavioral: bool = False
+    care_keywords: Optional[str] = None
 
     class Config:
         orm_mode = True
 
 
+class PetSearchResults(BaseModel):
+    """A page of matching pets with counts over every match"""
+    items: List[Pet]
+    total: int
+    facets: Dict[str, Dict[str, int]]
+
+
 class FosterAssignment(BaseModel):
     foster_user_id: int
 
@@ -668,6 +678,11 @@ class FosterPlacementCreate(FosterPlacementBase):
     org_id: int
 
 
+class FosterPlacementBatchCreate(BaseModel):
+    """Several placements created together; all succeed or none do."""
+    placements: List[FosterPlacementBase]
+
+
 class FosterPlacementUpdate(BaseModel):
     expected_end_date: Optional[datetime] = None
     actual_end_date: Optional[datetime] = None
@@ -698,6 +713,20 @@ class FosterPlacement(FosterPlacementBase):
         orm_mode = True
 
 
+class FosterPlacementSummary(BaseModel):
+    """Slim placement row for long placement lists"""
+    id: int
+    pet_id: int
+    foster_profile_id: int
+    start_date: datetime
+    expected_end_date: Optional[datetime] = None
+    outcome: PlacementOutcome
+    created_at: datetime
+    pet_name: Optional[str] = None
+    pet_species: Optional[str] = None
+    foster_name: Optional[str] = None
+
+
 class FosterMatch(BaseModel):
     """Represents a suggested foster match from the matching algorithm"""
     pet_id: int
@@ -873,3 +902,31 @@ class PersonNote(PersonNoteBase):
 
     class Config:
         orm_mode = True
+
+
+class ExportJobCreate(BaseModel):
+    """Filters a report does not accept are ignored"""
+    report: str
+    status_filter: Optional[str] = None
+    species: Optional[str] = None
+    type_filter: Optional[str] = None
+    tag_filter: Optional[str] = None
+    active_only: Optional[bool] = None
+    days: Optional[int] = Field(None, ge=1, le=730)
+
+
+class ExportJob(BaseModel):
+    id: int
+    report: str
+    status: str
+    total_rows: Optional[int] = None
+    rows_written: int = 0
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,417 @@
+"""
+Org-scoped cache for /stats responses.
+
+Entries are keyed by (org_id, endpoint, query params) plus the current
+version of every table the endpoint reads. A ``Session.after_flush`` hook
+records which (org, table) pairs a transaction touched and the versions are
+bumped once it commits, so a write makes exactly the affected entries
+unreachable; they then age out through the TTL or LRU eviction. Bulk
+statements skip the flush and are recorded as they execute, against the
+org in their ``org_id`` execution option or, without one, every org.
+
+Tables without an ``org_id`` column (roles, user_roles, messages, ...) are
+versioned globally and invalidate every org.
+
+Backends:
+
+- ``MemoryBackend``: per-process LRU bounded by ``STATS_CACHE_MAX_BYTES``
+- ``SQLiteBackend``: a file shared by every worker on the host, standing in
+  for a network cache such as Redis
+
+Configuration comes from ``STATS_CACHE_ENABLED``, ``STATS_CACHE_TTL``,
+``STATS_CACHE_MAX_BYTES``, ``STATS_CACHE_BACKEND`` and ``STATS_CACHE_PATH``.
+"""
+import functools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+STATS_CACHE_ENABLED = os.getenv("STATS_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "300"))
+STATS_CACHE_MAX_BYTES = int(os.getenv("STATS_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+STATS_CACHE_BACKEND = os.getenv("STATS_CACHE_BACKEND", "memory")
+STATS_CACHE_PATH = os.getenv("STATS_CACHE_PATH", "./stats_cache.db")
+
+GLOBAL_SCOPE = "*"
+
+_PENDING_KEY = "stats_cache_changes"
+
+
+# ----------------------------------------------------------------------------
+# Backends
+# ----------------------------------------------------------------------------
+
+
+class MemoryBackend:
+    """In-process LRU cache bounded by the total size of stored values."""
+
+    def __init__(self, max_bytes: int = STATS_CACHE_MAX_BYTES, clock: Callable[[], float] = time.monotonic):
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                self._discard(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (self.clock() + ttl, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def get_versions(self, keys: List[str]) -> List[int]:
+        with self._lock:
+            return [self._versions.get(key, 0) for key in keys]
+
+    def bump_versions(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._versions[key] = self._versions.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+            self.evictions = 0
+
+    def info(self) -> Dict:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._bytes -= len(value)
+
+
+class SQLiteBackend:
+    """
+    Cache stored in a local SQLite file so every worker process shares it.
+
+    Eviction is LRU on ``accessed_at`` once the stored values exceed
+    ``max_bytes``.
+    """
+
+    def __init__(self, path: str = STATS_CACHE_PATH, max_bytes: int = STATS_CACHE_MAX_BYTES, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.evictions = 0
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed_at "
+                "ON cache_entries (accessed_at)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_versions ("
+                "key TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        now = self.clock()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        now = self.clock()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now + ttl, now),
+            )
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            for old_key, old_size in conn.execute(
+                "SELECT key, size FROM cache_entries ORDER BY accessed_at"
+            ).fetchall():
+                conn.execute("DELETE FROM cache_entries WHERE key = ?", (old_key,))
+                self.evictions += 1
+                total -= old_size
+                if total <= self.max_bytes:
+                    break
+
+    def get_versions(self, keys: List[str]) -> List[int]:
+        if not keys:
+            return []
+        placeholders = ", ".join("?" for _ in keys)
+        with self._connect() as conn:
+            rows = dict(
+                conn.execute(
+                    f"SELECT key, version FROM cache_versions WHERE key IN ({placeholders})",
+                    keys,
+                ).fetchall()
+            )
+        return [rows.get(key, 0) for key in keys]
+
+    def bump_versions(self, keys: Iterable[str]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO cache_versions (key, version) VALUES (?, 1) "
+                "ON CONFLICT(key) DO UPDATE SET version = version + 1",
+                [(key,) for key in keys],
+            )
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries")
+            conn.execute("DELETE FROM cache_versions")
+        self.evictions = 0
+
+    def info(self) -> Dict:
+        with self._connect() as conn:
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()
+        return {
+            "backend": "sqlite",
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+# ----------------------------------------------------------------------------
+# Cache
+# ----------------------------------------------------------------------------
+
+
+def _version_key(scope, table: str) -> str:
+    return f"v:{scope}:{table}"
+
+
+class StatsCache:
+    """Versioned response cache with hit/miss counters."""
+
+    def __init__(self, backend, ttl: int = STATS_CACHE_TTL, enabled: bool = True):
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def key(self, org_id: int, endpoint: str, params: Dict, tables: Iterable[str]) -> str:
+        """Build the entry key, including the current version of each table."""
+        version_keys = []
+        for table in tables:
+            version_keys.append(_version_key(org_id, table))
+            version_keys.append(_version_key(GLOBAL_SCOPE, table))
+        versions = self.backend.get_versions(version_keys)
+        encoded_params = json.dumps(jsonable_encoder(params), sort_keys=True)
+        encoded_versions = ".".join(str(version) for version in versions)
+        return f"stats:{org_id}:{endpoint}:{encoded_params}:{encoded_versions}"
+
+    def get_or_compute(
+        self,
+        org_id: int,
+        endpoint: str,
+        params: Dict,
+        tables: Iterable[str],
+        compute: Callable,
+    ):
+        if not self.enabled:
+            return compute()
+
+        key = self.key(org_id, endpoint, params, tables)
+        cached = self.backend.get(key)
+        if cached is not None:
+            self._count(True)
+            return json.loads(cached)
+
+        self._count(False)
+        value = jsonable_encoder(compute())
+        self.backend.set(key, json.dumps(value), self.ttl)
+        return value
+
+    def invalidate(self, org_id, tables: Iterable[str]) -> None:
+        """Bump the version of ``tables`` for ``org_id`` (``None`` = every org)."""
+        scope = GLOBAL_SCOPE if org_id is None else org_id
+        self.backend.bump_versions(_version_key(scope, table) for table in tables)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            **self.backend.info(),
+        }
+
+
+def _make_backend():
+    if STATS_CACHE_BACKEND == "sqlite":
+        return SQLiteBackend(STATS_CACHE_PATH)
+    if STATS_CACHE_BACKEND != "memory":
+        logger.warning("Unknown STATS_CACHE_BACKEND %r; using memory", STATS_CACHE_BACKEND)
+    return MemoryBackend()
+
+
+cache = StatsCache(_make_backend(), enabled=STATS_CACHE_ENABLED)
+
+
+def cached(*models):
+    """
+    Cache a stats endpoint per org, invalidated by writes to ``models``.
+
+    The endpoint must be called with ``db`` and ``user`` keyword arguments,
+    as FastAPI and the composite dashboard do; every other keyword argument
+    is part of the cache key.
+    """
+    tables = tuple(model.__tablename__ for model in models)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            user = kwargs.get("user")
+            if args or user is None:
+                return func(*args, **kwargs)
+            params = {k: v for k, v in kwargs.items() if k not in ("db", "user")}
+            return cache.get_or_compute(
+                user.org_id,
+                func.__name__,
+                params,
+                tables,
+                lambda: func(**kwargs),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+# ----------------------------------------------------------------------------
+# Write-driven invalidation
+# ----------------------------------------------------------------------------
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    changes = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table is None:
+            continue
+        changes.add((getattr(obj, "org_id", None), table))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_changes(state):
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    mapper = state.bind_mapper
+    if mapper is None:
+        return
+    changes = state.session.info.setdefault(_PENDING_KEY, set())
+    changes.add((state.execution_options.get("org_id"), mapper.local_table.name))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_versions(session):
+    # Bumped on commit rather than flush so a concurrent reader cannot cache
+    # uncommitted-at-read-time data under the new version.
+    changes = session.info.pop(_PENDING_KEY, None)
+    if not changes:
+        return
+    by_scope: Dict = {}
+    for org_id, table in changes:
+        by_scope.setdefault(org_id, set()).add(table)
+    try:
+        for org_id, tables in by_scope.items():
+            cache.invalidate(org_id, tables)
+    except Exception:
+        logger.exception("Failed to invalidate stats cache")
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,93 @@
+"""
+Time bucketing helpers for stats and report queries.
+
+Filters are expressed as half-open ``column >= start AND column < end``
+ranges so they stay sargable (an index on the column can be range-scanned),
+and grouping uses ``date_trunc`` on PostgreSQL or ``strftime`` on SQLite.
+"""
+from datetime import date, datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import DateTime, and_, cast, extract, func
+from sqlalchemy.orm import Session
+
+UNITS = ("day", "month", "year")
+
+_SQLITE_FORMATS = {"day": "%Y-%m-%d", "month": "%Y-%m", "year": "%Y"}
+
+
+def _now(now: Optional[datetime]) -> datetime:
+    return now if now is not None else datetime.now()
+
+
+def day_range(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Return the ``[start, end)`` range covering the current day."""
+    start = datetime.combine(_now(now).date(), datetime.min.time())
+    return start, start + timedelta(days=1)
+
+
+def month_range(now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Return the ``[start, end)`` range covering the current month."""
+    start = _now(now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start, end
+
+
+def last_n_days(days: int, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+    """Return the ``[now - days, now)`` range for a rolling window."""
+    end = _now(now)
+    return end - timedelta(days=days), end
+
+
+def since_day(days: int, now: Optional[datetime] = None) -> date:
+    """Return the first calendar day of a rolling ``days`` window."""
+    return last_n_days(days, now)[0].date()
+
+
+def in_range(column, start, end):
+    """Sargable half-open range predicate for ``column``."""
+    return and_(column >= start, column < end)
+
+
+def bucket(db: Session, column, unit: str):
+    """
+    Return a SQL expression that truncates ``column`` to ``unit``.
+
+    PostgreSQL gets ``date_trunc`` (which an expression index can match);
+    SQLite and anything else fall back to ``strftime``.
+    """
+    if unit not in UNITS:
+        raise ValueError(f"Unsupported time bucket: {unit}")
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc(unit, column)
+    return func.strftime(_SQLITE_FORMATS[unit], column)
+
+
+def days_between(db: Session, start, end):
+    """SQL expression for the (fractional) number of days from start to end."""
+    if db.get_bind().dialect.name == "postgresql":
+        return extract("epoch", cast(end, DateTime) - cast(start, DateTime)) / 86400.0
+    return func.julianday(end) - func.julianday(start)
+
+
+def bucket_label(value, unit: str) -> Optional[str]:
+    """Normalise a bucket value from either dialect to its string label."""
+    if value is None:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.strftime(_SQLITE_FORMATS[unit])
+    return str(value)
+
+
+def bucket_date(value) -> Optional[date]:
+    """Convert a ``day`` bucket value from either dialect to a ``date``."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Recompute the stored pet care-needs flags from description_internal.
+
+Run once after applying migration 012_add_pet_care_needs, and again after
+changing the keyword list in app/care_needs.py.
+
+Usage:
+    python backfill_care_needs.py            # all organizations
+    python backfill_care_needs.py --org 3    # a single organization
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app import care_needs
+from app.database import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--org", type=int, default=None, help="Only backfill this org")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        changed = care_needs.backfill(db, org_id=args.org, batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    scope = f"org {args.org}" if args.org is not None else "all organizations"
+    print(f"Backfilled care needs for {scope}: {changed} pets updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Time the read-heavy API endpoints against the configured database.
+
+Intended to run after ``generate_synthetic_data.py`` so numbers reflect
+realistic volumes. Every GET endpoint under /stats and /reports without
+path parameters is benchmarked, plus /pets/, /people/ and
+/foster-coordinator/matches/suggest. Requests go through the full ASGI
+stack in-process, authenticated as the org's benchmark admin.
+
+Usage:
+    python benchmark_endpoints.py --output bench_results.json
+    python benchmark_endpoints.py --compare bench_results.json --threshold 20
+
+Results are written as JSON (timings in milliseconds). With ``--compare``
+the run is checked against a previous results file and the script exits
+non-zero if any endpoint's median regressed by more than ``--threshold``
+percent.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+
+from app import models, query_stats, stats_cache
+from app.database import SessionLocal
+from app.main import app
+from app.routers import reports, stats
+from app.security import create_access_token
+
+EXTRA_ENDPOINTS = ["/pets/", "/people/", "/foster-coordinator/matches/suggest"]
+BENCHMARKED_ROUTERS = [stats.router, reports.router]
+SKIPPED_ENDPOINTS = {"/stats/cache"}
+
+DATASET_TABLES = [
+    models.Pet,
+    models.Person,
+    models.Application,
+    models.Payment,
+    models.AuditLog,
+    models.FosterPlacement,
+    models.Task,
+    models.Expense,
+]
+
+
+def discover_endpoints():
+    """Return the benchmarked GET paths, in route order."""
+    paths = []
+    for router in BENCHMARKED_ROUTERS:
+        for route in router.routes:
+            if not isinstance(route, APIRoute) or "GET" not in route.methods:
+                continue
+            if "{" in route.path or route.path in SKIPPED_ENDPOINTS:
+                continue
+            paths.append(route.path)
+    return paths + EXTRA_ENDPOINTS
+
+
+def _percentile(samples, percent):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def benchmark(client, headers, paths, iterations=5, warmup=1):
+    """Time each path and return one result dict per endpoint."""
+    results = []
+    for path in paths:
+        for _ in range(warmup):
+            client.get(path, headers=headers)
+
+        timings, queries = [], []
+        response = None
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = client.get(path, headers=headers)
+            timings.append((time.perf_counter() - started) * 1000.0)
+            if query_stats.QUERY_COUNT_HEADER in response.headers:
+                queries.append(int(response.headers[query_stats.QUERY_COUNT_HEADER]))
+
+        results.append(
+            {
+                "endpoint": path,
+                "status": response.status_code,
+                "bytes": len(response.content),
+                "db_queries": max(queries) if queries else None,
+                "min_ms": round(min(timings), 3),
+                "median_ms": round(statistics.median(timings), 3),
+                "p95_ms": round(_percentile(timings, 95), 3),
+                "max_ms": round(max(timings), 3),
+                "mean_ms": round(statistics.fmean(timings), 3),
+            }
+        )
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Return ``[(endpoint, baseline_ms, current_ms, change)]`` regressions.
+
+    ``change`` is the median slowdown in percent, or the new status code when
+    an endpoint that used to succeed now fails.
+    """
+    previous = {row["endpoint"]: row for row in baseline.get("results", [])}
+    regressions = []
+    for row in results:
+        before = previous.get(row["endpoint"])
+        if not before:
+            continue
+        if before["status"] < 400 <= row["status"]:
+            regressions.append(
+                (row["endpoint"], before["median_ms"], row["median_ms"], f"HTTP {row['status']}")
+            )
+            continue
+        if not before["median_ms"]:
+            continue
+        change = (row["median_ms"] - before["median_ms"]) / before["median_ms"] * 100
+        if change > threshold:
+            regressions.append(
+                (row["endpoint"], before["median_ms"], row["median_ms"], f"+{change:.1f}%")
+            )
+    return regressions
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _benchmark_org(db, org_id=None):
+    """Return (org_id, admin email): the requested org, or the one with most pets."""
+    if org_id is None:
+        org_id = (
+            db.query(models.Pet.org_id)
+            .group_by(models.Pet.org_id)
+            .order_by(func.count(models.Pet.id).desc())
+            .limit(1)
+            .scalar()
+        )
+    if org_id is None:
+        raise SystemExit("No pets found; run generate_synthetic_data.py first")
+    email = f"admin-{org_id}@bench.example.org"
+    if not db.query(models.User.id).filter(models.User.email == email).first():
+        raise SystemExit(f"No benchmark admin {email}; run generate_synthetic_data.py")
+    return org_id, email
+
+
+def _dataset_counts(db, org_id):
+    return {
+        model.__tablename__: db.query(func.count(model.id))
+        .filter(model.org_id == org_id)
+        .scalar()
+        for model in DATASET_TABLES
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--org", type=int, default=None, help="Org to benchmark as")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--only", action="append", default=[], help="Only paths containing this text"
+    )
+    parser.add_argument(
+        "--with-cache",
+        action="store_true",
+        help="Leave the stats cache on (measures cache hits, not queries)",
+    )
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", default=None, help="Previous results file")
+    parser.add_argument(
+        "--threshold", type=float, default=20.0, help="Allowed median regression (%%)"
+    )
+    args = parser.parse_args()
+
+    stats_cache.cache.enabled = args.with_cache
+
+    db = SessionLocal()
+    try:
+        org_id, email = _benchmark_org(db, args.org)
+        dataset = _dataset_counts(db, org_id)
+        dialect = db.get_bind().dialect.name
+    finally:
+        db.close()
+
+    paths = discover_endpoints()
+    if args.only:
+        paths = [path for path in paths if any(part in path for part in args.only)]
+
+    headers = {"Authorization": f"Bearer {create_access_token(email)}"}
+    print(f"Benchmarking {len(paths)} endpoints as org {org_id} ({dialect})...")
+    with TestClient(app, raise_server_exceptions=False) as client:
+        results = benchmark(client, headers, paths, args.iterations, args.warmup)
+
+    for row in results:
+        print(
+            f"  {row['endpoint']:<45} {row['status']} "
+            f"median {row['median_ms']:9.1f} ms  p95 {row['p95_ms']:9.1f} ms  "
+            f"queries {row['db_queries']}"
+        )
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "database": dialect,
+        "org_id": org_id,
+        "dataset": dataset,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "stats_cache": args.with_cache,
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for endpoint, before, after, change in regressions:
+            print(f"  REGRESSION {endpoint}: {before:.1f} -> {after:.1f} ms ({change})")
+        if regressions:
+            sys.exit(1)
+        print(f"No endpoint regressed more than {args.threshold}%")
+
+
+if __name__ == "__main__":
+    main()
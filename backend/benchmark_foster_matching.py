@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Time foster match scoring at org sizes beyond what the test data covers.
+
+Pets and foster profiles are generated in memory (no database), then the
+feature extraction, score matrix and top-3 selection behind
+/foster-coordinator/matches/suggest (or the capacity-constrained plan with
+``--mode assign``) are timed for each pets x fosters size. ``--mode cache``
+times the per-org match cache instead: a full build, a hit, and patching
+one pet row and one profile column.
+
+Usage:
+    python benchmark_foster_matching.py
+    python benchmark_foster_matching.py --size 5000x5000 --output match_results.json
+    python benchmark_foster_matching.py --mode assign --size 3000x500
+    python benchmark_foster_matching.py --mode cache
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app import care_needs, foster_matching, match_cache, models
+
+DEFAULT_SIZES = ["1000x1000", "2000x2000", "5000x5000"]
+
+DESCRIPTIONS = [
+    None,
+    "Friendly and house trained",
+    "Needs medication twice daily",
+    "Anxious around other dogs, training needed",
+    "Chronic ear infection under treatment",
+]
+SPECIES = ["Dog", "Cat", "Rabbit", "Bird"]
+PREFERENCES = [None, "dog", "dog,cat", "cat", "rabbit, bird"]
+
+
+def population(pets, fosters, seed=11):
+    """Random pet and profile rows with the attributes the scorer reads."""
+    rng = random.Random(seed)
+    pet_rows = []
+    for pet_id in range(1, pets + 1):
+        needs = care_needs.scan(rng.choice(DESCRIPTIONS))
+        pet_rows.append(
+            SimpleNamespace(
+                id=pet_id,
+                species=rng.choice(SPECIES),
+                needs_medical=needs.needs_medical,
+                needs_behavioral=needs.needs_behavioral,
+            )
+        )
+    profile_rows = []
+    for profile_id in range(1, fosters + 1):
+        maximum = rng.randint(1, 4)
+        total = rng.randint(0, 20)
+        profile_rows.append(
+            SimpleNamespace(
+                id=profile_id,
+                user_id=profile_id,
+                current_capacity=rng.randint(0, maximum - 1),
+                max_capacity=maximum,
+                preferred_species=rng.choice(PREFERENCES),
+                can_handle_medical=rng.random() < 0.3,
+                can_handle_behavioral=rng.random() < 0.3,
+                experience_level=rng.choice(list(models.FosterExperienceLevel)),
+                total_fosters=total,
+                successful_adoptions=rng.randint(0, total),
+                rating=rng.choice([None, 3.8, 4.2, 4.7]),
+                background_check_status=rng.choice(["pending", "approved"]),
+                references_checked=rng.random() < 0.6,
+            )
+        )
+    return pet_rows, profile_rows
+
+
+def run(pets, profiles, mode="suggest"):
+    """Score every pair and render reasons for the returned matches."""
+    pet_features = foster_matching.pet_features(pets)
+    profile_features = foster_matching.profile_features(profiles)
+    if mode == "assign":
+        pairs = foster_matching.assign(pet_features, profile_features)
+    else:
+        pairs = foster_matching.best_matches(pet_features, profile_features)
+    return [
+        (i, j, score, foster_matching.reasons(pet_features, profile_features, i, j))
+        for i, j, score in pairs
+    ]
+
+
+def _timed(func):
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000.0
+
+
+def benchmark_cache(size, iterations=3):
+    """Time a match cache build, a cache hit, and one-pet and one-profile patches."""
+    pets, fosters = (int(part) for part in size.split("x"))
+    pet_rows, profile_rows = population(pets, fosters)
+    entry = match_cache.OrgMatches(pet_rows, profile_rows)
+    build = _timed(lambda: match_cache.OrgMatches(pet_rows, profile_rows))
+    timings = {"hit": [], "pet_patch": [], "profile_patch": []}
+    for n in range(iterations):
+        pet = pet_rows[n % pets]
+        timings["pet_patch"].append(_timed(lambda: entry.patch({pet.id: pet}, {})))
+        profile = profile_rows[n % fosters]
+        timings["profile_patch"].append(_timed(lambda: entry.patch({}, {profile.id: profile})))
+        entry.suggestions()
+        timings["hit"].append(_timed(entry.suggestions))
+    return {
+        "mode": "cache",
+        "pets": pets,
+        "fosters": fosters,
+        "build_ms": round(build, 3),
+        **{f"{name}_ms": round(statistics.median(values), 3) for name, values in timings.items()},
+    }
+
+
+def benchmark(size, iterations=3, mode="suggest"):
+    if mode == "cache":
+        return benchmark_cache(size, iterations)
+    pets, fosters = (int(part) for part in size.split("x"))
+    pet_rows, profile_rows = population(pets, fosters)
+    timings, matches = [], 0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        matches = len(run(pet_rows, profile_rows, mode))
+        timings.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "mode": mode,
+        "pets": pets,
+        "fosters": fosters,
+        "matches": matches,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--size", action="append", default=[], help="PETSxFOSTERS, e.g. 2000x500"
+    )
+    parser.add_argument("--mode", choices=["suggest", "assign", "cache"], default="suggest")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    results = [
+        benchmark(size, args.iterations, args.mode) for size in args.size or DEFAULT_SIZES
+    ]
+    for row in results:
+        if row["mode"] == "cache":
+            print(
+                f"  {row['pets']:>6} pets x {row['fosters']:>6} fosters  "
+                f"build {row['build_ms']:9.1f} ms  hit {row['hit_ms']:.3f} ms  "
+                f"pet patch {row['pet_patch_ms']:.1f} ms  "
+                f"profile patch {row['profile_patch_ms']:.1f} ms"
+            )
+            continue
+        print(
+            f"  {row['pets']:>6} pets x {row['fosters']:>6} fosters  "
+            f"median {row['median_ms']:9.1f} ms  ({row['matches']} matches)"
+        )
+    if args.output:
+        Path(args.output).write_text(json.dumps({"results": results}, indent=2))
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Compare ORM hydration with the projected read path for report exports.
+
+For each report the export's statement is run twice against the configured
+database: once selecting the whole mapped entity (what the reports used to
+load, large ``Text`` columns included) and once as the Core projection in
+``app.read_models``. Both paths build every CSV row; wall time and the
+``tracemalloc`` peak are recorded for each.
+
+Usage:
+    python benchmark_read_models.py --org 1 --output read_model_results.json
+    python benchmark_read_models.py --org 1 --report pets --iterations 5
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app import models, read_models
+from app.database import SessionLocal
+from app.routers import reports
+
+# Single-table reports whose rows can also be built from ORM instances
+REPORT_MODELS = {
+    "pets": models.Pet,
+    "people": models.Person,
+    "applications": models.Application,
+}
+
+
+def _orm_rows(db, export, model):
+    statement = export.statement.with_only_columns(*read_models.table(model).c)
+    entities = db.query(model).from_statement(statement).all()
+    return [export.row(entity) for entity in entities]
+
+
+def _projected_rows(db, export, model):
+    return [export.row(result) for result in read_models.rows(db, export.statement)]
+
+
+def _measure(db, export, model, load):
+    """Return (milliseconds, peak KiB, rows) for one cold load."""
+    db.expunge_all()
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        rows = load(db, export, model)
+        elapsed = (time.perf_counter() - started) * 1000.0
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    db.expunge_all()
+    return elapsed, peak / 1024.0, len(rows)
+
+
+def compare(db, org_id, report, iterations=3):
+    """Time and measure the ORM and projected paths for ``report``."""
+    model = REPORT_MODELS[report]
+    build = reports.EXPORTS[report]
+    params = {"days": 730} if report == "applications" else {}
+    export = build(db, org_id, **params)
+
+    result = {"report": report}
+    for name, load in (("orm", _orm_rows), ("projected", _projected_rows)):
+        samples = [_measure(db, export, model, load) for _ in range(iterations)]
+        result["rows"] = samples[0][2]
+        result[f"{name}_median_ms"] = round(statistics.median(s[0] for s in samples), 3)
+        result[f"{name}_peak_kib"] = round(max(s[1] for s in samples), 1)
+
+    result["time_saved_percent"] = _saving(result["orm_median_ms"], result["projected_median_ms"])
+    result["memory_saved_percent"] = _saving(result["orm_peak_kib"], result["projected_peak_kib"])
+    return result
+
+
+def _saving(before, after):
+    return round((before - after) / before * 100, 1) if before else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--org", type=int, required=True, help="Org whose rows to load")
+    parser.add_argument(
+        "--report", action="append", choices=sorted(REPORT_MODELS), default=[]
+    )
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--output", default="read_model_results.json")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        results = [
+            compare(db, args.org, report, args.iterations)
+            for report in args.report or sorted(REPORT_MODELS)
+        ]
+        dialect = db.get_bind().dialect.name
+    finally:
+        db.close()
+
+    for row in results:
+        print(
+            f"  {row['report']:<14} {row['rows']:>8} rows  "
+            f"orm {row['orm_median_ms']:9.1f} ms {row['orm_peak_kib']:10.1f} KiB  "
+            f"projected {row['projected_median_ms']:9.1f} ms "
+            f"{row['projected_peak_kib']:10.1f} KiB"
+        )
+
+    report = {
+        "generated_at": datetime.utcnow().isoformat(),
+        "database": dialect,
+        "org_id": args.org,
+        "iterations": args.iterations,
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
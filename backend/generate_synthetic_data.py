@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Bulk-load a large, deterministic synthetic dataset for benchmarking.
+
+Rows are generated from a seeded RNG and written with batched Core
+``executemany`` inserts, so millions of rows load in minutes instead of
+hours. Each organization gets an admin user (``admin-<org_id>@bench.example.org``,
+password ``benchmark``) that ``benchmark_endpoints.py`` logs in as.
+
+Usage:
+    python generate_synthetic_data.py --scale small
+    python generate_synthetic_data.py --scale large --seed 7
+    python generate_synthetic_data.py --orgs 5 --pets 50000 --anchor 2025-06-30
+
+Dates are spread over the ``--years`` before ``--anchor`` (default: today);
+pass a fixed anchor to reproduce the same dataset on another database.
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from itertools import islice
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import models, rollups
+from app.database import Base, engine as default_engine
+from app.permissions import ROLE_ADMIN, ROLE_FOSTER
+from app.security import get_password_hash
+from populate_test_data import (
+    CAT_BREEDS,
+    CAT_NAMES,
+    CITIES,
+    COLORS,
+    DOG_BREEDS,
+    DOG_NAMES,
+    FIRST_NAMES,
+    LAST_NAMES,
+    STATES,
+    TASK_TITLES,
+)
+
+BENCHMARK_PASSWORD = "benchmark"
+
+SCALES = {
+    "small": {
+        "orgs": 2,
+        "fosters_per_org": 20,
+        "pets": 2_000,
+        "people": 1_000,
+        "applications": 5_000,
+        "payments": 5_000,
+        "audit_logs": 5_000,
+        "tasks": 1_000,
+        "expenses": 1_000,
+    },
+    "medium": {
+        "orgs": 10,
+        "fosters_per_org": 50,
+        "pets": 100_000,
+        "people": 50_000,
+        "applications": 500_000,
+        "payments": 500_000,
+        "audit_logs": 500_000,
+        "tasks": 50_000,
+        "expenses": 50_000,
+    },
+    "large": {
+        "orgs": 100,
+        "fosters_per_org": 100,
+        "pets": 1_000_000,
+        "people": 500_000,
+        "applications": 5_000_000,
+        "payments": 5_000_000,
+        "audit_logs": 5_000_000,
+        "tasks": 200_000,
+        "expenses": 500_000,
+    },
+}
+
+EXPENSE_CATEGORIES = ["Veterinary", "Food", "Supplies", "Transport", "Facilities"]
+
+PET_STATUS_WEIGHTS = [
+    (models.PetStatus.available, 30),
+    (models.PetStatus.adopted, 35),
+    (models.PetStatus.in_foster, 10),
+    (models.PetStatus.intake, 10),
+    (models.PetStatus.needs_foster, 8),
+    (models.PetStatus.pending, 4),
+    (models.PetStatus.medical_hold, 3),
+]
+APPLICATION_TYPE_WEIGHTS = [
+    (models.ApplicationType.adoption, 70),
+    (models.ApplicationType.foster, 20),
+    (models.ApplicationType.volunteer, 10),
+]
+APPLICATION_STATUS_WEIGHTS = [
+    (models.ApplicationStatus.submitted, 20),
+    (models.ApplicationStatus.under_review, 15),
+    (models.ApplicationStatus.interview_scheduled, 5),
+    (models.ApplicationStatus.approved, 45),
+    (models.ApplicationStatus.denied, 15),
+]
+PAYMENT_PURPOSE_WEIGHTS = [
+    (models.PaymentPurpose.donation, 55),
+    (models.PaymentPurpose.adoption_fee, 30),
+    (models.PaymentPurpose.event_ticket, 10),
+    (models.PaymentPurpose.other, 5),
+]
+PAYMENT_STATUS_WEIGHTS = [
+    (models.PaymentStatus.completed, 85),
+    (models.PaymentStatus.pending, 8),
+    (models.PaymentStatus.failed, 5),
+    (models.PaymentStatus.refunded, 2),
+]
+TASK_STATUS_WEIGHTS = [
+    (models.TaskStatus.open, 30),
+    (models.TaskStatus.in_progress, 15),
+    (models.TaskStatus.completed, 50),
+    (models.TaskStatus.archived, 5),
+]
+
+
+def _weighted(weights):
+    values = [value for value, _ in weights]
+    cum_weights = []
+    total = 0
+    for _, weight in weights:
+        total += weight
+        cum_weights.append(total)
+    return values, cum_weights
+
+
+def _batched(rows, size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _stamp_updated_at(table, batch):
+    """Rows are generated unchanged since creation: updated_at = created_at."""
+    if "updated_at" in table.c and "created_at" in table.c:
+        for row in batch:
+            row.setdefault("updated_at", row.get("created_at"))
+    return batch
+
+
+def _next_id(conn, table) -> int:
+    return (conn.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def _org_share(total: int, orgs: int, org_index: int) -> int:
+    """Rows of a round-robin distributed entity that belong to one org."""
+    return total // orgs + (1 if org_index < total % orgs else 0)
+
+
+class SyntheticDataset:
+    """Deterministic row generators for one dataset, sharing id layout."""
+
+    def __init__(self, conn, counts, seed: int, anchor: date, years: int):
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.anchor = datetime.combine(anchor, datetime.min.time())
+        self.span_days = 365 * years
+        self.orgs = counts["orgs"]
+        self.fosters = counts["fosters_per_org"]
+        self.users_per_org = 1 + self.fosters
+
+        tables = Base.metadata.tables
+        self.base = {
+            name: _next_id(conn, tables[name])
+            for name in (
+                "organizations",
+                "users",
+                "foster_profiles",
+                "people",
+                "pets",
+                "expense_categories",
+            )
+        }
+        self.role_ids = dict(conn.execute(select(models.Role.name, models.Role.id)).all())
+        self.password_hash = get_password_hash(BENCHMARK_PASSWORD)
+
+        self.pet_statuses = _weighted(PET_STATUS_WEIGHTS)
+        self.application_types = _weighted(APPLICATION_TYPE_WEIGHTS)
+        self.application_statuses = _weighted(APPLICATION_STATUS_WEIGHTS)
+        self.payment_purposes = _weighted(PAYMENT_PURPOSE_WEIGHTS)
+        self.payment_statuses = _weighted(PAYMENT_STATUS_WEIGHTS)
+        self.task_statuses = _weighted(TASK_STATUS_WEIGHTS)
+
+    # -- id layout ----------------------------------------------------------
+
+    def org_id(self, org_index: int) -> int:
+        return self.base["organizations"] + org_index
+
+    def admin_id(self, org_index: int) -> int:
+        return self.base["users"] + org_index * self.users_per_org
+
+    def foster_user_id(self, org_index: int, foster_index: int) -> int:
+        return self.admin_id(org_index) + 1 + foster_index
+
+    def foster_profile_id(self, org_index: int, foster_index: int) -> int:
+        return self.base["foster_profiles"] + org_index * self.fosters + foster_index
+
+    def _random_row_id(self, table: str, org_index: int) -> int:
+        """Pick a row of a round-robin distributed table owned by ``org_index``."""
+        share = _org_share(self.counts[table], self.orgs, org_index)
+        return self.base[table] + org_index + self.orgs * self.rng.randrange(share)
+
+    def _random_user_id(self, org_index: int) -> int:
+        return self.admin_id(org_index) + self.rng.randrange(self.users_per_org)
+
+    def _pick(self, weighted):
+        values, cum_weights = weighted
+        return self.rng.choices(values, cum_weights=cum_weights)[0]
+
+    def _past(self) -> datetime:
+        seconds = self.rng.randrange(self.span_days * 86400)
+        return self.anchor - timedelta(seconds=seconds)
+
+    # -- generators ---------------------------------------------------------
+
+    def organizations(self):
+        for org_index in range(self.orgs):
+            org_id = self.org_id(org_index)
+            yield {
+                "id": org_id,
+                "name": f"Synthetic Rescue {org_id}",
+                "primary_contact_email": f"contact-{org_id}@bench.example.org",
+            }
+
+    def users(self):
+        for org_index in range(self.orgs):
+            org_id = self.org_id(org_index)
+            yield {
+                "id": self.admin_id(org_index),
+                "org_id": org_id,
+                "email": f"admin-{org_id}@bench.example.org",
+                "full_name": f"Benchmark Admin {org_id}",
+                "hashed_password": self.password_hash,
+                "is_active": True,
+            }
+            for foster_index in range(self.fosters):
+                user_id = self.foster_user_id(org_index, foster_index)
+                yield {
+                    "id": user_id,
+                    "org_id": org_id,
+                    "email": f"foster-{user_id}@bench.example.org",
+                    "full_name": f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}",
+                    "hashed_password": self.password_hash,
+                    "is_active": True,
+                }
+
+    def user_roles(self):
+        for org_index in range(self.orgs):
+            yield {"user_id": self.admin_id(org_index), "role_id": self.role_ids[ROLE_ADMIN]}
+            for foster_index in range(self.fosters):
+                yield {
+                    "user_id": self.foster_user_id(org_index, foster_index),
+                    "role_id": self.role_ids[ROLE_FOSTER],
+                }
+
+    def foster_profiles(self):
+        levels = list(models.FosterExperienceLevel)
+        home_types = list(models.HomeType)
+        for org_index in range(self.orgs):
+            for foster_index in range(self.fosters):
+                max_capacity = self.rng.randint(1, 4)
+                yield {
+                    "id": self.foster_profile_id(org_index, foster_index),
+                    "user_id": self.foster_user_id(org_index, foster_index),
+                    "org_id": self.org_id(org_index),
+                    "experience_level": self.rng.choice(levels),
+                    "preferred_species": self.rng.choice(["Dog", "Cat", "Dog,Cat"]),
+                    "preferred_ages": self.rng.choice(["puppy,kitten", "adult", "adult,senior", None]),
+                    "max_capacity": max_capacity,
+                    "current_capacity": 0,
+                    "home_type": self.rng.choice(home_types),
+                    "has_yard": self.rng.random() < 0.5,
+                    "has_other_pets": self.rng.random() < 0.4,
+                    "has_children": self.rng.random() < 0.3,
+                    "can_handle_medical": self.rng.random() < 0.3,
+                    "can_handle_behavioral": self.rng.random() < 0.3,
+                    "is_available": self.rng.random() < 0.8,
+                    "total_fosters": self.rng.randint(0, 25),
+                    "successful_adoptions": self.rng.randint(0, 20),
+                    "rating": round(self.rng.uniform(3.0, 5.0), 1),
+                    "created_at": self._past(),
+                }
+
+    def people(self):
+        for i in range(self.counts["people"]):
+            first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            person_id = self.base["people"] + i
+            yield {
+                "id": person_id,
+                "org_id": self.org_id(i % self.orgs),
+                "first_name": first,
+                "last_name": last,
+                "email": f"{first.lower()}.{last.lower()}.{person_id}@bench.example.org",
+                "phone": f"555-{self.rng.randint(1000, 9999)}",
+                "city": self.rng.choice(CITIES),
+                "state": self.rng.choice(STATES),
+                "tag_adopter": self.rng.random() < 0.3,
+                "tag_foster": self.rng.random() < 0.1,
+                "tag_volunteer": self.rng.random() < 0.2,
+                "tag_donor": self.rng.random() < 0.25,
+                "created_at": self._past(),
+            }
+
+    def pets(self, status_events, placements):
+        """Yield pets, appending their status log and foster placements."""
+        for i in range(self.counts["pets"]):
+            org_index = i % self.orgs
+            org_id = self.org_id(org_index)
+            pet_id = self.base["pets"] + i
+            species = "Dog" if self.rng.random() < 0.6 else "Cat"
+            status = self._pick(self.pet_statuses)
+            created_at = self._past()
+            foster_user_id = None
+
+            if status == models.PetStatus.in_foster and self.fosters:
+                foster_index = self.rng.randrange(self.fosters)
+                foster_user_id = self.foster_user_id(org_index, foster_index)
+                placements.append(
+                    {
+                        "org_id": org_id,
+                        "pet_id": pet_id,
+                        "foster_profile_id": self.foster_profile_id(org_index, foster_index),
+                        "start_date": created_at,
+                        "outcome": models.PlacementOutcome.active,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+
+            status_events.append(
+                {
+                    "org_id": org_id,
+                    "pet_id": pet_id,
+                    "from_status": None,
+                    "to_status": models.PetStatus.intake,
+                    "changed_at": created_at,
+                }
+            )
+            if status != models.PetStatus.intake:
+                changed_at = min(
+                    created_at + timedelta(days=self.rng.randint(1, 120)), self.anchor
+                )
+                status_events.append(
+                    {
+                        "org_id": org_id,
+                        "pet_id": pet_id,
+                        "from_status": models.PetStatus.intake,
+                        "to_status": status,
+                        "changed_at": changed_at,
+                    }
+                )
+
+            yield {
+                "id": pet_id,
+                "org_id": org_id,
+                "name": self.rng.choice(DOG_NAMES if species == "Dog" else CAT_NAMES),
+                "species": species,
+                "breed": self.rng.choice(DOG_BREEDS if species == "Dog" else CAT_BREEDS),
+                "sex": self.rng.choice(["Male", "Female"]),
+                "intake_date": created_at.date(),
+                "date_of_birth": created_at.date() - timedelta(days=self.rng.randint(60, 365 * 12)),
+                "color": self.rng.choice(COLORS),
+                "weight": round(self.rng.uniform(4, 90), 1),
+                "adoption_fee": float(self.rng.choice([50, 75, 100, 150, 250])),
+                "status": status,
+                "foster_user_id": foster_user_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+
+    def applications(self):
+        for i in range(self.counts["applications"]):
+            org_index = i % self.orgs
+            yield {
+                "org_id": self.org_id(org_index),
+                "applicant_person_id": self._random_row_id("people", org_index)
+                if self.counts["people"] >= self.orgs
+                else None,
+                "pet_id": self._random_row_id("pets", org_index)
+                if self.counts["pets"] >= self.orgs
+                else None,
+                "type": self._pick(self.application_types),
+                "status": self._pick(self.application_statuses),
+                "created_at": self._past(),
+            }
+
+    def payments(self):
+        for i in range(self.counts["payments"]):
+            org_index = i % self.orgs
+            yield {
+                "org_id": self.org_id(org_index),
+                "user_id": self._random_user_id(org_index),
+                "purpose": self._pick(self.payment_purposes),
+                "amount": round(self.rng.uniform(5, 500), 2),
+                "currency": "USD",
+                "provider": self.rng.choice(["stripe", "paypal", "manual"]),
+                "status": self._pick(self.payment_statuses),
+                "created_at": self._past(),
+            }
+
+    def audit_logs(self):
+        entity_types = ["pet", "application", "person", "task", "payment"]
+        actions = ["create", "update", "update", "update", "delete"]
+        for i in range(self.counts["audit_logs"]):
+            org_index = i % self.orgs
+            yield {
+                "org_id": self.org_id(org_index),
+                "user_id": self._random_user_id(org_index),
+                "entity_type": self.rng.choice(entity_types),
+                "entity_id": self.rng.randint(1, max(self.counts["pets"], 1)),
+                "action": self.rng.choice(actions),
+                "created_at": self._past(),
+            }
+
+    def tasks(self):
+        priorities = list(models.TaskPriority)
+        for i in range(self.counts["tasks"]):
+            org_index = i % self.orgs
+            created_at = self._past()
+            yield {
+                "org_id": self.org_id(org_index),
+                "title": self.rng.choice(TASK_TITLES).format(
+                    pet=self.rng.choice(DOG_NAMES), person=self.rng.choice(FIRST_NAMES)
+                ),
+                "status": self._pick(self.task_statuses),
+                "priority": self.rng.choice(priorities),
+                "due_date": created_at + timedelta(days=self.rng.randint(1, 30)),
+                "created_by_user_id": self.admin_id(org_index),
+                "assigned_to_user_id": self._random_user_id(org_index),
+                "created_at": created_at,
+            }
+
+    def expense_categories(self):
+        for org_index in range(self.orgs):
+            for offset, name in enumerate(EXPENSE_CATEGORIES):
+                yield {
+                    "id": self.base["expense_categories"]
+                    + org_index * len(EXPENSE_CATEGORIES)
+                    + offset,
+                    "org_id": self.org_id(org_index),
+                    "name": name,
+                    "is_active": True,
+                }
+
+    def expenses(self):
+        for i in range(self.counts["expenses"]):
+            org_index = i % self.orgs
+            incurred = self._past()
+            yield {
+                "org_id": self.org_id(org_index),
+                "category_id": self.base["expense_categories"]
+                + org_index * len(EXPENSE_CATEGORIES)
+                + self.rng.randrange(len(EXPENSE_CATEGORIES)),
+                "amount": round(self.rng.uniform(10, 2000), 2),
+                "currency": "USD",
+                "date_incurred": incurred,
+                "vendor_name": self.rng.choice(["PetSmart", "Chewy", "City Vet", "Costco"]),
+                "recorded_by_user_id": self.admin_id(org_index),
+                "created_at": incurred,
+            }
+
+
+def generate(
+    engine,
+    counts,
+    seed: int = 42,
+    anchor: date = None,
+    years: int = 3,
+    batch_size: int = 5_000,
+    rebuild_rollups: bool = True,
+    log=print,
+):
+    """Insert a synthetic dataset and return ``{table: rows_inserted}``."""
+    if counts["orgs"] < 1:
+        raise ValueError("At least one organization is required")
+    anchor = anchor or date.today()
+    tables = Base.metadata.tables
+    inserted = {}
+
+    def load(name, rows):
+        started = time.perf_counter()
+        total = 0
+        for batch in _batched(rows, batch_size):
+            with engine.begin() as conn:
+                conn.execute(tables[name].insert(), _stamp_updated_at(tables[name], batch))
+            total += len(batch)
+        inserted[name] = inserted.get(name, 0) + total
+        log(f"  {name:<20} {total:>10,} rows in {time.perf_counter() - started:6.1f}s")
+
+    with engine.begin() as conn:
+        roles = tables["roles"]
+        existing = set(conn.execute(select(roles.c.name)).scalars())
+        missing = [name for name in (ROLE_ADMIN, ROLE_FOSTER) if name not in existing]
+        if missing:
+            conn.execute(roles.insert(), [{"name": name} for name in missing])
+        dataset = SyntheticDataset(conn, counts, seed, anchor, years)
+
+    load("organizations", dataset.organizations())
+    load("users", dataset.users())
+    load("user_roles", dataset.user_roles())
+    load("foster_profiles", dataset.foster_profiles())
+    load("people", dataset.people())
+
+    # Pets are written together with the status log rows and placements
+    # derived from each batch, so those lists never outgrow one batch
+    started = time.perf_counter()
+    status_events, placements = [], []
+    for batch in _batched(dataset.pets(status_events, placements), batch_size):
+        with engine.begin() as conn:
+            conn.execute(tables["pets"].insert(), batch)
+            conn.execute(tables["pet_status_events"].insert(), status_events)
+            if placements:
+                conn.execute(tables["foster_placements"].insert(), placements)
+        inserted["pets"] = inserted.get("pets", 0) + len(batch)
+        inserted["pet_status_events"] = inserted.get("pet_status_events", 0) + len(status_events)
+        inserted["foster_placements"] = inserted.get("foster_placements", 0) + len(placements)
+        status_events.clear()
+        placements.clear()
+    log(
+        f"  {'pets':<20} {inserted.get('pets', 0):>10,} rows in "
+        f"{time.perf_counter() - started:6.1f}s (with status events and placements)"
+    )
+
+    load("applications", dataset.applications())
+    load("payments", dataset.payments())
+    load("audit_logs", dataset.audit_logs())
+    load("tasks", dataset.tasks())
+    load("expense_categories", dataset.expense_categories())
+    load("expenses", dataset.expenses())
+
+    first_org, last_org = dataset.org_id(0), dataset.org_id(counts["orgs"] - 1)
+    with engine.begin() as conn:
+        profiles = tables["foster_profiles"]
+        placements_table = tables["foster_placements"]
+        active = (
+            select(func.count(placements_table.c.id))
+            .where(
+                placements_table.c.foster_profile_id == profiles.c.id,
+                placements_table.c.outcome == models.PlacementOutcome.active,
+            )
+            .scalar_subquery()
+        )
+        conn.execute(
+            profiles.update()
+            .where(profiles.c.org_id.between(first_org, last_org))
+            .values(current_capacity=active)
+        )
+
+    if rebuild_rollups:
+        started = time.perf_counter()
+        with Session(bind=engine) as db:
+            for org_id in range(first_org, last_org + 1):
+                rollups.rebuild(db, org_id=org_id)
+                rollups.rebuild_user_activity(db, org_id=org_id)
+        log(f"  {'rollups':<20} {'rebuilt':>10} in {time.perf_counter() - started:6.1f}s")
+
+    return inserted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    for name in SCALES["small"]:
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            type=int,
+            default=None,
+            help=f"Override the {name.replace('_', ' ')} count of the chosen scale",
+        )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--anchor",
+        type=date.fromisoformat,
+        default=None,
+        help="Latest generated date (YYYY-MM-DD); defaults to today",
+    )
+    parser.add_argument("--years", type=int, default=3, help="History span in years")
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument(
+        "--skip-rollups", action="store_true", help="Do not rebuild org_daily_metrics"
+    )
+    args = parser.parse_args()
+
+    counts = dict(SCALES[args.scale])
+    for name in counts:
+        if getattr(args, name) is not None:
+            counts[name] = getattr(args, name)
+
+    Base.metadata.create_all(bind=default_engine)
+
+    print(f"Generating {args.scale} dataset (seed {args.seed})...")
+    print("=" * 60)
+    started = time.perf_counter()
+    inserted = generate(
+        default_engine,
+        counts,
+        seed=args.seed,
+        anchor=args.anchor,
+        years=args.years,
+        batch_size=args.batch_size,
+        rebuild_rollups=not args.skip_rollups,
+    )
+    print("=" * 60)
+    print(f"Inserted {sum(inserted.values()):,} rows in {time.perf_counter() - started:.1f}s")
+    print(f"Log in as admin-<org_id>@bench.example.org / {BENCHMARK_PASSWORD}")
+
+
+if __name__ == "__main__":
+    main()
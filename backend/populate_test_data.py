@@ -12,6 +12,7 @@ from random import choice, randint, uniform, sample
 # Add the app directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), "app"))
 
+from app import rollups
 from app.database import SessionLocal, engine
 from app.models import (
     Base,
@@ -345,6 +346,9 @@ def main():
         appointments = create_test_appointments(db, org.id, pets, 20)
         tasks = create_test_tasks(db, org.id, admin_user, pets, people, 20)
 
+        # Rows above were added directly, so derive the daily rollup from them
+        rollups.rebuild(db, org_id=org.id)
+
         print("=" * 60)
         print("Database population completed successfully!")
         print("=" * 60)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Rebuild the org_daily_metrics rollup from the raw pets, applications,
+payments and expenses tables, and user_activity_daily from audit_logs.
+
+Usage:
+    python rebuild_rollups.py            # all organizations
+    python rebuild_rollups.py --org 3    # a single organization
+    python rebuild_rollups.py --days 7   # only the last 7 days of daily metrics
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app import rollups, timebuckets
+from app.database import SessionLocal
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--org", type=int, default=None, help="Only rebuild this org")
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=None,
+        help="Only recompute daily metrics for the last N days (user activity is skipped)",
+    )
+    args = parser.parse_args()
+    since = timebuckets.since_day(args.days) if args.days is not None else None
+
+    db = SessionLocal()
+    try:
+        written = rollups.rebuild(db, org_id=args.org, since=since)
+        activity_written = (
+            rollups.rebuild_user_activity(db, org_id=args.org) if since is None else None
+        )
+    finally:
+        db.close()
+
+    scope = f"org {args.org}" if args.org is not None else "all organizations"
+    if since is not None:
+        scope += f" since {since}"
+    print(f"Rebuilt daily metrics for {scope}: {written} rows written")
+    if activity_written is not None:
+        print(f"Rebuilt user activity for {scope}: {activity_written} rows written")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,7 +40,7 @@ if not HTTPX_AVAILABLE:  # pragma: no cover - environment-specific
     def test_pet():
         pytest.skip(skip_reason)
 else:
-    from app import models
+    from app import match_cache, models, stats_cache
     from app.database import Base
     from app.deps import get_db
     from app.main import app
@@ -60,6 +60,8 @@ else:
     def db():
         """Create a fresh database for each test."""
         Base.metadata.create_all(bind=engine)
+        stats_cache.cache.clear()
+        match_cache.cache.clear()
         db = TestingSessionLocal()
         try:
             yield db
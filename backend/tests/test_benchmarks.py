@@ -0,0 +1,104 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+import benchmark_endpoints
+import benchmark_foster_matching
+import benchmark_read_models
+import generate_synthetic_data
+from app import models
+from app.database import Base
+
+TINY = {
+    "orgs": 2,
+    "fosters_per_org": 3,
+    "pets": 40,
+    "people": 20,
+    "applications": 30,
+    "payments": 30,
+    "audit_logs": 30,
+    "tasks": 10,
+    "expenses": 10,
+}
+
+
+def _generate(engine):
+    return generate_synthetic_data.generate(
+        engine, TINY, seed=7, anchor=date(2025, 6, 30), batch_size=16, log=lambda _: None
+    )
+
+
+def test_generator_is_deterministic_and_consistent(db):
+    """Test that the generator bulk-loads linked rows reproducibly."""
+    inserted = _generate(db.get_bind())
+
+    assert inserted["pets"] == 40
+    assert inserted["applications"] == 30
+    assert inserted["pet_status_events"] >= 40
+    assert db.query(models.User).count() == 2 * (1 + 3)
+
+    # Every foreign key points into the same org
+    for app in db.query(models.Application):
+        assert app.pet_id is None or db.get(models.Pet, app.pet_id).org_id == app.org_id
+    for placement in db.query(models.FosterPlacement):
+        assert placement.pet.status == models.PetStatus.in_foster
+    assert db.query(models.OrgDailyMetric).count() > 0
+
+    other = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=other)
+    _generate(other)
+    columns = (models.Pet.name, models.Pet.status, models.Pet.created_at)
+    with other.connect() as conn:
+        replay = conn.execute(
+            models.Pet.__table__.select().with_only_columns(*columns).order_by(models.Pet.id)
+        ).all()
+    assert replay == db.query(*columns).order_by(models.Pet.id).all()
+
+
+def test_benchmark_reports_timings_and_regressions(client, auth_headers):
+    """Test that endpoints are timed and slowdowns are flagged against a baseline."""
+    paths = benchmark_endpoints.discover_endpoints()
+    assert "/stats/pets_by_status" in paths
+    assert "/foster-coordinator/matches/suggest" in paths
+
+    results = benchmark_endpoints.benchmark(
+        client, auth_headers, ["/stats/pets_by_status"], iterations=2, warmup=0
+    )
+    assert results[0]["status"] == 200
+    assert results[0]["db_queries"] >= 1
+    assert results[0]["min_ms"] <= results[0]["median_ms"] <= results[0]["max_ms"]
+
+    baseline = {"results": [dict(results[0], median_ms=results[0]["median_ms"] / 10)]}
+    regressions = benchmark_endpoints.compare(results, baseline, threshold=20)
+    assert [endpoint for endpoint, *_ in regressions] == ["/stats/pets_by_status"]
+
+
+def test_projected_reads_skip_unused_columns(db, test_org):
+    """Test that the projected read path peaks lower than hydrating ORM entities."""
+    for i in range(200):
+        db.add(models.Pet(
+            org_id=test_org.id,
+            name=f"Pet {i}",
+            species="dog",
+            status=models.PetStatus.available,
+            description_internal="x" * 4000,
+        ))
+    db.commit()
+
+    result = benchmark_read_models.compare(db, test_org.id, "pets", iterations=1)
+
+    assert result["rows"] == 200
+    assert result["projected_peak_kib"] < result["orm_peak_kib"]
+    assert result["memory_saved_percent"] > 0
+
+
+def test_foster_matching_benchmark_times_each_size():
+    """Test that the matcher benchmark returns top-3 matches per generated pet."""
+    result = benchmark_foster_matching.benchmark("50x20", iterations=1)
+
+    assert (result["pets"], result["fosters"]) == (50, 20)
+    assert 0 < result["matches"] <= 150
+    assert result["min_ms"] <= result["median_ms"]
@@ -0,0 +1,53 @@
+from app import care_needs, models
+
+
+def test_scan_finds_every_keyword_in_one_pass():
+    """Test that overlapping and multi-word keywords are found case-insensitively."""
+    matcher = care_needs.KeywordMatcher(["he", "she", "his", "hers"])
+    assert matcher.find("ushers") == ["she", "he", "hers"]
+
+    needs = care_needs.scan("Fearful at first. On MEDICATION; training needed, medication daily")
+    assert needs == care_needs.CareNeeds(True, True, ["fearful", "medication", "training needed"])
+    assert care_needs.scan(None) == care_needs.CareNeeds(False, False, [])
+    assert care_needs.scan("Friendly lap cat") == care_needs.CareNeeds(False, False, [])
+
+
+def test_pet_writes_store_care_needs(client, auth_headers, test_org):
+    """Test that creating and updating a pet recomputes the stored flags."""
+    response = client.post(
+        "/pets/",
+        json={"name": "Rex", "species": "Dog", "description_internal": "Chronic allergies"},
+        headers=auth_headers,
+    )
+    assert response.status_code in (200, 201)
+    pet = response.json()
+    assert (pet["needs_medical"], pet["needs_behavioral"]) == (True, False)
+    assert pet["care_keywords"] == "chronic"
+
+    response = client.put(
+        f"/pets/{pet['id']}",
+        json={"description_internal": "Anxious around cats"},
+        headers=auth_headers,
+    )
+    pet = response.json()
+    assert (pet["needs_medical"], pet["needs_behavioral"]) == (False, True)
+    assert pet["care_keywords"] == "anxious"
+
+
+def test_backfill_updates_only_stale_rows(db, test_org):
+    """Test that the backfill recomputes flags for rows written without them."""
+    db.add_all([
+        models.Pet(org_id=test_org.id, name="A", species="Dog", description_internal="Aggressive"),
+        models.Pet(org_id=test_org.id, name="B", species="Cat", description_internal="Calm"),
+        models.Pet(org_id=test_org.id, name="C", species="Cat", description_internal="Special diet"),
+    ])
+    db.commit()
+
+    assert care_needs.backfill(db, org_id=test_org.id, batch_size=2) == 2
+    assert care_needs.backfill(db, org_id=test_org.id) == 0
+
+    flags = dict(
+        db.query(models.Pet.name, models.Pet.care_keywords).filter(models.Pet.org_id == test_org.id)
+    )
+    assert flags == {"A": "aggressive", "B": None, "C": "special"}
+    assert db.query(models.Pet).filter(models.Pet.needs_behavioral == True).count() == 1
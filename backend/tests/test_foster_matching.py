@@ -0,0 +1,218 @@
+import itertools
+import random
+from types import SimpleNamespace
+
+from app import care_needs, foster_matching, models
+
+
+def _loop_scores(pet, profiles):
+    """The original per-pair scoring loop, kept as the reference."""
+    scored = []
+    desc = (pet.description_internal or "").lower()
+    needs_medical = any(k in desc for k in ["special", "medication", "chronic", "treatment"])
+    needs_behavioral = any(k in desc for k in ["aggressive", "anxious", "fearful", "training needed"])
+    for j, profile in enumerate(profiles):
+        score, reasons = 0.0, []
+        if profile.current_capacity < profile.max_capacity:
+            score += 20
+            reasons.append("Has available capacity")
+        if profile.preferred_species:
+            preferred = [s.strip().lower() for s in profile.preferred_species.split(",")]
+            if pet.species.lower() in preferred:
+                score += 30
+                reasons.append(f"Prefers {pet.species}")
+        if needs_medical:
+            score += 25 if profile.can_handle_medical else -20
+            reasons.append(
+                "Can handle medical needs" if profile.can_handle_medical else "Pet needs medical care"
+            )
+        if needs_behavioral:
+            score += 25 if profile.can_handle_behavioral else -20
+            reasons.append(
+                "Can handle behavioral issues"
+                if profile.can_handle_behavioral
+                else "Pet needs behavioral support"
+            )
+        if profile.experience_level == models.FosterExperienceLevel.advanced:
+            score += 15
+            reasons.append("Experienced foster")
+        elif profile.experience_level == models.FosterExperienceLevel.intermediate:
+            score += 10
+            reasons.append("Intermediate experience")
+        if profile.total_fosters > 0:
+            rate = profile.successful_adoptions / profile.total_fosters
+            if rate > 0.8:
+                score += 20
+                reasons.append(f"High success rate ({rate:.0%})")
+            elif rate > 0.5:
+                score += 10
+                reasons.append(f"Good success rate ({rate:.0%})")
+        if profile.rating and profile.rating >= 4.5:
+            score += 15
+            reasons.append(f"Highly rated ({profile.rating:.1f}★)")
+        elif profile.rating and profile.rating >= 4.0:
+            score += 10
+            reasons.append(f"Well rated ({profile.rating:.1f}★)")
+        ratio = profile.current_capacity / profile.max_capacity
+        if ratio == 0:
+            score += 15
+            reasons.append("No current fosters")
+        elif ratio < 0.5:
+            score += 10
+            reasons.append("Low current load")
+        if profile.background_check_status == "approved":
+            score += 10
+            reasons.append("Background check approved")
+        if profile.references_checked:
+            score += 5
+            reasons.append("References verified")
+        scored.append((j, score, reasons))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return [item for item in scored[:3] if item[1] > 0]
+
+
+def _random_population(rng, pets, profiles):
+    descriptions = [None, "", "Needs MEDICATION twice daily", "a bit anxious", "friendly",
+                    "chronic condition, fearful of men", "Training needed"]
+    species = ["Dog", "dog", "Cat", "Rabbit", "bird"]
+    pet_rows = []
+    for _ in range(pets):
+        description = rng.choice(descriptions)
+        needs = care_needs.scan(description)
+        pet_rows.append(SimpleNamespace(
+            species=rng.choice(species),
+            description_internal=description,
+            needs_medical=needs.needs_medical,
+            needs_behavioral=needs.needs_behavioral,
+        ))
+    profile_rows = []
+    for _ in range(profiles):
+        maximum = rng.randint(1, 4)
+        total = rng.randint(0, 10)
+        profile_rows.append(SimpleNamespace(
+            current_capacity=rng.randint(0, maximum - 1),
+            max_capacity=maximum,
+            preferred_species=rng.choice([None, "", "dog", "Dog, cat", "cat,rabbit", "bird, "]),
+            can_handle_medical=rng.random() < 0.5,
+            can_handle_behavioral=rng.random() < 0.5,
+            experience_level=rng.choice(list(models.FosterExperienceLevel)),
+            total_fosters=total,
+            successful_adoptions=rng.randint(0, total),
+            rating=rng.choice([None, 3.5, 4.0, 4.2, 4.5, 5.0]),
+            background_check_status=rng.choice([None, "pending", "approved"]),
+            references_checked=rng.random() < 0.5,
+        ))
+    return pet_rows, profile_rows
+
+
+def test_vectorized_scores_match_reference_loop(monkeypatch):
+    """Test that matrix scoring reproduces the loop's scores, reasons and tie order."""
+    monkeypatch.setattr(foster_matching, "BLOCK_PETS", 7)
+    pets, profiles = _random_population(random.Random(3), 40, 25)
+
+    pet_features = foster_matching.pet_features(pets)
+    profile_features = foster_matching.profile_features(profiles)
+    matches = {}
+    for i, j, score in foster_matching.best_matches(pet_features, profile_features, k=3):
+        reasons = foster_matching.reasons(pet_features, profile_features, i, j)
+        matches.setdefault(i, []).append((j, score, reasons))
+
+    for i, pet in enumerate(pets):
+        assert matches.get(i, []) == _loop_scores(pet, profiles)
+
+
+def test_suggest_endpoint_ranks_fosters(client, auth_headers, db, test_org, test_user, test_admin_user):
+    """Test that the endpoint returns the best foster first with its reasons."""
+    pet = models.Pet(
+        org_id=test_org.id, name="Rex", species="Dog",
+        status=models.PetStatus.needs_foster, description_internal="On medication",
+    )
+    care_needs.apply(pet)
+    db.add(pet)
+    db.add_all([
+        models.FosterProfile(
+            user_id=test_user.id, org_id=test_org.id, max_capacity=2,
+            preferred_species="dog", can_handle_medical=True, is_available=True,
+        ),
+        models.FosterProfile(
+            user_id=test_admin_user.id, org_id=test_org.id, max_capacity=2,
+            is_available=True,
+        ),
+    ])
+    db.commit()
+
+    response = client.get("/foster-coordinator/matches/suggest", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [m["foster_user_id"] for m in data] == [test_user.id, test_admin_user.id]
+    assert data[0]["match_score"] == 20 + 30 + 25 + 15
+    assert data[0]["match_reasons"] == [
+        "Has available capacity", "Prefers Dog", "Can handle medical needs", "No current fosters",
+    ]
+    assert data[1]["match_reasons"][-2:] == ["Pet needs medical care", "No current fosters"]
+
+
+def _best_total(scores, capacity):
+    """Exhaustive best total over every pet -> (no foster | foster) choice."""
+    best = 0
+    for choice in itertools.product(range(-1, scores.shape[1]), repeat=scores.shape[0]):
+        used, total = [0] * scores.shape[1], 0
+        for i, j in enumerate(choice):
+            if j < 0:
+                continue
+            used[j] += 1
+            if used[j] > capacity[j] or scores[i, j] <= 0:
+                break
+            total += scores[i, j]
+        else:
+            best = max(best, total)
+    return best
+
+
+def test_assign_plan_is_optimal_within_capacity():
+    """Test that the assignment respects capacity and matches an exhaustive search."""
+    rng = random.Random(5)
+    for _ in range(25):
+        pets, profiles = _random_population(rng, rng.randint(1, 5), rng.randint(1, 4))
+        pet_features = foster_matching.pet_features(pets)
+        profile_features = foster_matching.profile_features(profiles)
+        scores = foster_matching.score_matrix(pet_features, profile_features)
+
+        plan = foster_matching.assign(pet_features, profile_features)
+
+        assert len({i for i, _, _ in plan}) == len(plan)
+        for j, spare in enumerate(profile_features.spare_capacity):
+            assert sum(1 for _, chosen, _ in plan if chosen == j) <= spare
+        assert all(score == scores[i, j] > 0 for i, j, score in plan)
+        assert sum(score for _, _, score in plan) == _best_total(scores, profile_features.spare_capacity)
+
+
+def test_assign_mode_spreads_pets_across_capacity(client, auth_headers, db, test_org, test_user, test_admin_user):
+    """Test that a top foster with one free slot is not assigned every pet."""
+    for name in ("Rex", "Fido"):
+        db.add(models.Pet(
+            org_id=test_org.id, name=name, species="Dog", status=models.PetStatus.needs_foster,
+        ))
+    db.add_all([
+        models.FosterProfile(
+            user_id=test_user.id, org_id=test_org.id, max_capacity=1,
+            preferred_species="dog", rating=5.0, is_available=True,
+        ),
+        models.FosterProfile(
+            user_id=test_admin_user.id, org_id=test_org.id, max_capacity=3, is_available=True,
+        ),
+    ])
+    db.commit()
+
+    suggested = client.get("/foster-coordinator/matches/suggest", headers=auth_headers).json()
+    assert sum(m["foster_user_id"] == test_user.id for m in suggested) == 2
+
+    response = client.get(
+        "/foster-coordinator/matches/suggest", params={"mode": "assign"}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assigned = response.json()
+    assert len(assigned) == 2
+    assert sorted(m["foster_user_id"] for m in assigned) == sorted([test_user.id, test_admin_user.id])
@@ -0,0 +1,314 @@
+"""EXPLAIN-based regression tests for the hot org-scoped queries.
+
+Each query mirrors a filter used by the routers and names the index that
+should answer it. A test fails if SQLite plans a full table scan or picks a
+weaker index, which is what happens when an index from migration 008
+(``__table_args__`` in models.py) goes missing.
+"""
+from datetime import datetime
+
+import pytest
+
+from app import models, pet_search
+
+ORG_ID = 1
+SINCE = datetime(2025, 1, 1)
+
+
+def _pets_by_status(db):
+    return db.query(models.Pet).filter(
+        models.Pet.org_id == ORG_ID, models.Pet.status == models.PetStatus.available
+    )
+
+
+def _pets_for_foster(db):
+    return db.query(models.Pet).filter(
+        models.Pet.org_id == ORG_ID, models.Pet.foster_user_id == 2
+    )
+
+
+def _recent_pets(db):
+    return (
+        db.query(models.Pet)
+        .filter(models.Pet.org_id == ORG_ID)
+        .order_by(models.Pet.created_at.desc())
+    )
+
+
+def _pets_in_age_range(db):
+    return db.query(models.Pet).filter(
+        models.Pet.org_id == ORG_ID,
+        *pet_search.age_range(1, 3, SINCE.date()),
+    )
+
+
+def _pending_applications(db):
+    return (
+        db.query(models.Application)
+        .filter(
+            models.Application.org_id == ORG_ID,
+            models.Application.status == models.ApplicationStatus.submitted,
+        )
+        .order_by(models.Application.created_at.desc())
+    )
+
+
+def _approved_applications_in_window(db):
+    return db.query(models.Application).filter(
+        models.Application.org_id == ORG_ID,
+        models.Application.status == models.ApplicationStatus.approved,
+        models.Application.created_at >= SINCE,
+    )
+
+
+def _applications_for_applicant(db):
+    return db.query(models.Application).filter(
+        models.Application.org_id == ORG_ID,
+        models.Application.applicant_user_id == 2,
+    )
+
+
+def _completed_payments_in_window(db):
+    return db.query(models.Payment).filter(
+        models.Payment.org_id == ORG_ID,
+        models.Payment.status == models.PaymentStatus.completed,
+        models.Payment.created_at >= SINCE,
+    )
+
+
+def _available_fosters(db):
+    return db.query(models.FosterProfile).filter(
+        models.FosterProfile.org_id == ORG_ID,
+        models.FosterProfile.is_available == True,  # noqa: E712
+    )
+
+
+def _active_placements(db):
+    return db.query(models.FosterPlacement).filter(
+        models.FosterPlacement.org_id == ORG_ID,
+        models.FosterPlacement.outcome == models.PlacementOutcome.active,
+    )
+
+
+def _placements_for_pet(db):
+    return db.query(models.FosterPlacement).filter(
+        models.FosterPlacement.pet_id == 3
+    )
+
+
+def _active_placements_for_foster(db):
+    return db.query(models.FosterPlacement).filter(
+        models.FosterPlacement.foster_profile_id == 4,
+        models.FosterPlacement.outcome == models.PlacementOutcome.active,
+    )
+
+
+def _placement_page(db):
+    return db.query(models.FosterPlacement).filter(
+        models.FosterPlacement.org_id == ORG_ID,
+    ).order_by(
+        models.FosterPlacement.created_at.desc(), models.FosterPlacement.id.desc()
+    ).limit(50)
+
+
+def _open_tasks(db):
+    return db.query(models.Task).filter(
+        models.Task.org_id == ORG_ID, models.Task.status == models.TaskStatus.open
+    )
+
+
+def _tasks_for_assignee(db):
+    return db.query(models.Task).filter(
+        models.Task.org_id == ORG_ID, models.Task.assigned_to_user_id == 2
+    )
+
+
+def _expenses_in_window(db):
+    return db.query(models.Expense).filter(
+        models.Expense.org_id == ORG_ID, models.Expense.date_incurred >= SINCE
+    )
+
+
+def _upcoming_appointments(db):
+    return db.query(models.Appointment).filter(
+        models.Appointment.org_id == ORG_ID, models.Appointment.date_time >= SINCE
+    )
+
+
+def _upcoming_events(db):
+    return db.query(models.Event).filter(
+        models.Event.org_id == ORG_ID, models.Event.start_datetime >= SINCE
+    )
+
+
+def _event_signups(db):
+    return db.query(models.EventSignup).filter(models.EventSignup.event_id == 5)
+
+
+def _medical_history(db):
+    return (
+        db.query(models.MedicalRecord)
+        .filter(models.MedicalRecord.pet_id == 3)
+        .order_by(models.MedicalRecord.date.desc())
+    )
+
+
+def _thread_messages(db):
+    return (
+        db.query(models.Message)
+        .filter(models.Message.thread_id == 6)
+        .order_by(models.Message.sent_at)
+    )
+
+
+def _recent_threads(db):
+    return db.query(models.MessageThread).filter(
+        models.MessageThread.org_id == ORG_ID,
+        models.MessageThread.created_at >= SINCE,
+    )
+
+
+def _recent_documents(db):
+    return db.query(models.Document).filter(
+        models.Document.org_id == ORG_ID, models.Document.created_at >= SINCE
+    )
+
+
+def _people(db):
+    return db.query(models.Person).filter(models.Person.org_id == ORG_ID)
+
+
+def _person_notes(db):
+    return db.query(models.PersonNote).filter(models.PersonNote.person_id == 7)
+
+
+def _org_users(db):
+    return db.query(models.User).filter(models.User.org_id == ORG_ID)
+
+
+def _user_roles(db):
+    return db.query(models.UserRole).filter(models.UserRole.user_id == 2)
+
+
+def _recent_audit_logs(db):
+    return db.query(models.AuditLog).filter(
+        models.AuditLog.org_id == ORG_ID, models.AuditLog.created_at >= SINCE
+    )
+
+
+def _entity_audit_history(db):
+    return db.query(models.AuditLog).filter(
+        models.AuditLog.org_id == ORG_ID,
+        models.AuditLog.entity_type == "pet",
+        models.AuditLog.entity_id == 3,
+    )
+
+
+def _changed_pets(db):
+    return db.query(models.Pet).filter(
+        models.Pet.org_id == ORG_ID, models.Pet.updated_at > SINCE
+    )
+
+
+def _pets_needing_medical_care(db):
+    return db.query(models.Pet).filter(
+        models.Pet.org_id == ORG_ID, models.Pet.needs_medical == True
+    )
+
+
+def _changed_applications(db):
+    return db.query(models.Application).filter(
+        models.Application.org_id == ORG_ID, models.Application.updated_at > SINCE
+    )
+
+
+def _changed_people(db):
+    return db.query(models.Person).filter(
+        models.Person.org_id == ORG_ID, models.Person.updated_at > SINCE
+    )
+
+
+def _daily_metrics(db):
+    return db.query(models.OrgDailyMetric).filter(
+        models.OrgDailyMetric.org_id == ORG_ID,
+        models.OrgDailyMetric.day >= SINCE.date(),
+    )
+
+
+def _active_users(db):
+    return db.query(models.UserActivityDaily.user_id.distinct()).filter(
+        models.UserActivityDaily.org_id == ORG_ID,
+        models.UserActivityDaily.day >= SINCE.date(),
+    )
+
+
+def _adoption_events(db):
+    return db.query(models.PetStatusEvent).filter(
+        models.PetStatusEvent.org_id == ORG_ID,
+        models.PetStatusEvent.to_status == models.PetStatus.adopted,
+        models.PetStatusEvent.changed_at >= SINCE,
+    )
+
+
+HOT_QUERIES = [
+    (_pets_by_status, "ix_pets_org_id_status"),
+    (_pets_for_foster, "ix_pets_org_id_foster_user_id"),
+    (_recent_pets, "ix_pets_org_id_created_at"),
+    (_pets_in_age_range, "ix_pets_org_id_date_of_birth"),
+    (_pending_applications, "ix_applications_org_id_status_created_at"),
+    (_approved_applications_in_window, "ix_applications_org_id_status_created_at"),
+    (_applications_for_applicant, "ix_applications_org_id_applicant_user_id"),
+    (_completed_payments_in_window, "ix_payments_org_id_status_created_at"),
+    (_available_fosters, "ix_foster_profiles_org_id_is_available"),
+    (_active_placements, "ix_foster_placements_org_id_outcome"),
+    (_placements_for_pet, "ix_foster_placements_pet_id"),
+    (_active_placements_for_foster, "ix_foster_placements_foster_profile_id_outcome"),
+    (_placement_page, "ix_foster_placements_org_id_created_at_id"),
+    (_open_tasks, "ix_tasks_org_id_status"),
+    (_tasks_for_assignee, "ix_tasks_org_id_assigned_to_user_id"),
+    (_expenses_in_window, "ix_expenses_org_id_date_incurred"),
+    (_upcoming_appointments, "ix_appointments_org_id_date_time"),
+    (_upcoming_events, "ix_events_org_id_start_datetime"),
+    (_event_signups, "ix_event_signups_event_id"),
+    (_medical_history, "ix_medical_records_pet_id_date"),
+    (_thread_messages, "ix_messages_thread_id_sent_at"),
+    (_recent_threads, "ix_message_threads_org_id_created_at"),
+    (_recent_documents, "ix_documents_org_id_created_at"),
+    (_people, "ix_people_org_id_updated_at"),
+    (_person_notes, "ix_person_notes_person_id"),
+    (_org_users, "ix_users_org_id"),
+    (_user_roles, "ix_user_roles_user_id"),
+    (_recent_audit_logs, "ix_audit_logs_org_id_created_at"),
+    (_entity_audit_history, "ix_audit_logs_org_id_entity_type_entity_id"),
+    (_changed_pets, "ix_pets_org_id_updated_at"),
+    (_pets_needing_medical_care, "ix_pets_org_id_needs_medical_needs_behavioral"),
+    (_changed_applications, "ix_applications_org_id_updated_at"),
+    (_changed_people, "ix_people_org_id_updated_at"),
+    # The (org_id, day, ...) unique constraints double as the indexes
+    (_daily_metrics, "sqlite_autoindex_org_daily_metrics_1"),
+    (_active_users, "sqlite_autoindex_user_activity_daily_1"),
+    (_adoption_events, "ix_pet_status_events_org_to_status_changed"),
+]
+
+
+def _plan(db, query):
+    """Return the detail column of SQLite's EXPLAIN QUERY PLAN for a query."""
+    compiled = query.statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    return [row[-1] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "build_query, index",
+    [pytest.param(build, index, id=build.__name__[1:]) for build, index in HOT_QUERIES],
+)
+def test_hot_query_uses_index(db, build_query, index):
+    """Test that a hot query is answered by a search on its composite index."""
+    plan = _plan(db, build_query(db))
+
+    assert not [detail for detail in plan if detail.startswith("SCAN")], plan
+    assert any(
+        detail.startswith("SEARCH") and f"INDEX {index} " in detail for detail in plan
+    ), plan
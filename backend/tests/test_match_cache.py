@@ -0,0 +1,144 @@
+import random
+from types import SimpleNamespace
+
+import numpy as np
+
+from app import match_cache, models
+
+
+def _pet(rng, pet_id):
+    return SimpleNamespace(
+        id=pet_id, name=f"Pet {pet_id}", species=rng.choice(["Dog", "Cat", "Bird"]),
+        status=models.PetStatus.needs_foster,
+        needs_medical=rng.random() < 0.3, needs_behavioral=rng.random() < 0.3,
+    )
+
+
+def _profile(rng, profile_id):
+    maximum = rng.randint(1, 3)
+    total = rng.randint(0, 6)
+    return SimpleNamespace(
+        id=profile_id, user_id=profile_id, full_name="", email="",
+        current_capacity=rng.randint(0, maximum - 1), max_capacity=maximum,
+        experience_level=rng.choice(list(models.FosterExperienceLevel)),
+        preferred_species=rng.choice([None, "dog", "cat, bird"]),
+        can_handle_medical=rng.random() < 0.5, can_handle_behavioral=rng.random() < 0.5,
+        total_fosters=total, successful_adoptions=rng.randint(0, total),
+        rating=rng.choice([None, 4.1, 4.8]), background_check_status="approved",
+        references_checked=rng.random() < 0.5,
+    )
+
+
+def test_patched_matrix_matches_a_fresh_build():
+    """Test that row, column and membership patches leave the same state as a rebuild."""
+    rng = random.Random(9)
+    pets = {i: _pet(rng, i) for i in range(1, 30)}
+    profiles = {j: _profile(rng, j) for j in range(1, 12)}
+    entry = match_cache.OrgMatches(sorted(pets.values(), key=lambda p: p.id),
+                                   sorted(profiles.values(), key=lambda p: p.id))
+
+    for step in range(60):
+        changed_pets, changed_profiles = {}, {}
+        for _ in range(rng.randint(0, 3)):
+            pet_id = rng.randint(1, 40)
+            pets[pet_id] = None if rng.random() < 0.3 else _pet(rng, pet_id)
+            changed_pets[pet_id] = pets[pet_id]
+        if step % 3 == 0:
+            profile_id = rng.randint(1, 15)
+            profiles[profile_id] = None if rng.random() < 0.3 else _profile(rng, profile_id)
+            changed_profiles[profile_id] = profiles[profile_id]
+        entry.patch(changed_pets, changed_profiles)
+
+        fresh = match_cache.OrgMatches(
+            [pet for _, pet in sorted(pets.items()) if pet is not None],
+            [profile for _, profile in sorted(profiles.items()) if profile is not None],
+        )
+        assert entry.pet_ids == fresh.pet_ids
+        assert entry.profile_ids == fresh.profile_ids
+        assert np.array_equal(entry.scores, fresh.scores)
+        assert entry.suggestions() == fresh.suggestions()
+
+
+def test_suggest_serves_from_cache_and_patches_on_change(
+    client, auth_headers, db, test_org, test_user, test_admin_user
+):
+    """Test that repeated lookups hit the cache and a profile change patches one column."""
+    db.add(models.Pet(org_id=test_org.id, name="Rex", species="Dog", status=models.PetStatus.needs_foster))
+    profile = models.FosterProfile(
+        user_id=test_user.id, org_id=test_org.id, max_capacity=2, is_available=True
+    )
+    db.add_all([
+        profile,
+        models.FosterProfile(
+            user_id=test_admin_user.id, org_id=test_org.id, max_capacity=2,
+            preferred_species="dog", is_available=True,
+        ),
+    ])
+    db.commit()
+
+    first = client.get("/foster-coordinator/matches/suggest", headers=auth_headers).json()
+    second = client.get("/foster-coordinator/matches/suggest", headers=auth_headers).json()
+    assert first == second
+    assert first[0]["foster_user_id"] == test_admin_user.id
+
+    profile.preferred_species = "dog"
+    profile.rating = 4.9
+    db.commit()
+
+    patched = client.get("/foster-coordinator/matches/suggest", headers=auth_headers).json()
+    assert patched[0]["foster_user_id"] == test_user.id
+    assert "Highly rated (4.9★)" in patched[0]["match_reasons"]
+
+    info = client.get("/foster-coordinator/matches/cache", headers=auth_headers).json()
+    assert (info["rebuilds"], info["hits"], info["patches"]) == (1, 1, 1)
+    assert info["columns_recomputed"] == 1
+    assert info["org"]["cached"] and info["org"]["fosters"] == 2
+    assert info["org"]["age_seconds"] >= 0
+
+
+def test_changes_are_queued_only_for_cached_orgs(db, test_org):
+    """Test that uncached orgs queue nothing and a cached org's entry is patched."""
+    pet = models.Pet(org_id=test_org.id, name="Rex", species="Dog", status=models.PetStatus.needs_foster)
+    db.add(pet)
+    db.commit()
+    cache = match_cache.MatchCache()
+
+    cache.record({test_org.id: {"pets": {pet.id}}, test_org.id + 1: {"pets": {1}}, None: {"users": {1}}})
+    assert cache._pending == {}
+
+    with cache.use(db, test_org.id) as entry:
+        assert entry.pet_ids == [pet.id]
+    pet.status = models.PetStatus.in_foster
+    db.commit()
+    cache.record({test_org.id: {"pets": {pet.id}}})
+    with cache.use(db, test_org.id) as entry:
+        assert entry.pet_ids == [] and entry.scores.shape[0] == 0
+
+    assert (cache.rebuilds, cache.patches) == (1, 1)
+
+
+def test_entries_are_bounded_by_bytes_and_expire_on_write(db, test_org):
+    """Test LRU eviction past max_bytes, and that recording changes drops expired entries."""
+    other = models.Organization(name="Other Rescue")
+    db.add(other)
+    db.flush()
+    db.add_all([
+        models.Pet(org_id=org.id, name=f"Pet {n}", species="Dog", status=models.PetStatus.needs_foster)
+        for org in (test_org, other)
+        for n in range(3)
+    ])
+    db.commit()
+    now = [1000.0]
+    cache = match_cache.MatchCache(ttl=60, clock=lambda: now[0])
+
+    with cache.use(db, test_org.id) as entry:
+        cache.max_bytes = entry.nbytes
+    with cache.use(db, other.id):
+        pass
+
+    info = cache.info(test_org.id)
+    assert (info["entries"], info["evictions"], info["org"]["cached"]) == (1, 1, False)
+
+    now[0] += 61
+    cache.record({})
+    assert cache.info()["entries"] == 0
@@ -1,3 +1,8 @@
+import subprocess
+import sys
+from datetime import date
+from pathlib import Path
+
 import pytest
 from app import models
 
@@ -164,3 +169,98 @@ def test_unauthorized_access(client, test_pet):
     """Test accessing pets without authentication."""
     response = client.get("/pets/")
     assert response.status_code == 401
+
+
+def _add_pets(db, org):
+    pets = [
+        models.Pet(org_id=org.id, name="Biscuit", species="Dog", breed="Beagle", sex="Male",
+                   color="Tricolor", status=models.PetStatus.available, date_of_birth=date(date.today().year - 7, 1, 1)),
+        models.Pet(org_id=org.id, name="Mochi", species="Cat", breed="Domestic Shorthair", sex="Female",
+                   description_public="Shy tabby who loves laps", status=models.PetStatus.intake,
+                   date_of_birth=date(date.today().year - 2, 1, 1)),
+        models.Pet(org_id=org.id, name="Bean", species="Dog", breed="Labrador Mix", sex="Female",
+                   status=models.PetStatus.intake),
+    ]
+    db.add_all(pets)
+    db.commit()
+    return pets
+
+
+def test_search_pets_by_word_prefix(client, auth_headers, db, test_org):
+    """Test that every typed word must prefix a word of name, breed, color or description."""
+    _add_pets(db, test_org)
+
+    def names(term):
+        response = client.get("/pets/", params={"search": term}, headers=auth_headers)
+        assert response.status_code == 200
+        return sorted(pet["name"] for pet in response.json())
+
+    assert names("b") == ["Bean", "Biscuit"]
+    assert names("bea") == ["Bean", "Biscuit"]
+    assert names("lab mix") == ["Bean"]
+    assert names("TABBY") == ["Mochi"]
+    assert names("tricol") == ["Biscuit"]
+    assert names("cat lap") == ["Mochi"]
+    assert names("'%") == ["Bean", "Biscuit", "Mochi"]
+
+
+def test_search_index_follows_updates_and_deletes(client, auth_headers, db, test_org):
+    """Test that renamed and deleted pets leave the search index in step."""
+    biscuit, mochi, _ = _add_pets(db, test_org)
+    biscuit.name = "Waffles"
+    db.delete(mochi)
+    db.commit()
+
+    def ids(term):
+        return [pet["id"] for pet in client.get("/pets/", params={"search": term}, headers=auth_headers).json()]
+
+    assert ids("waff") == [biscuit.id]
+    assert ids("biscuit") == []
+    assert ids("mochi") == []
+
+
+def test_filter_pets_by_age(client, auth_headers, db, test_org):
+    """Test that min_age/max_age filter on date of birth and skip pets without one."""
+    _add_pets(db, test_org)
+
+    def names(**params):
+        return [pet["name"] for pet in client.get("/pets/", params=params, headers=auth_headers).json()]
+
+    assert names(min_age=3) == ["Biscuit"]
+    assert names(max_age=2) == ["Mochi"]
+    assert sorted(names(min_age=2, max_age=7)) == ["Biscuit", "Mochi"]
+    assert names(min_age=8) == []
+
+
+def test_search_endpoint_returns_facets(client, auth_headers, db, test_org):
+    """Test that /pets/search pages the matches and counts facets over all of them."""
+    _add_pets(db, test_org)
+
+    response = client.get("/pets/search", params={"species": "dog", "limit": 1}, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 1
+    assert data["total"] == 2
+    assert data["facets"]["species"] == {"Dog": 2}
+    assert data["facets"]["status"] == {"available": 1, "intake": 1}
+    assert data["facets"]["sex"] == {"Male": 1, "Female": 1}
+    assert data["facets"]["altered_status"] == {"unknown": 2}
+
+
+def test_create_all_builds_the_search_index_from_models_alone():
+    """Test that create_all makes pets_fts even when pet_search was never imported."""
+    script = (
+        "import sys\n"
+        "from sqlalchemy import create_engine, inspect\n"
+        "from app import models\n"
+        "assert 'app.pet_search' not in sys.modules\n"
+        "engine = create_engine('sqlite://')\n"
+        "models.Base.metadata.create_all(engine)\n"
+        "print(sorted(inspect(engine).get_table_names()))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=Path(__file__).resolve().parents[1],
+        capture_output=True, text=True, check=True,
+    )
+    assert "'pets_fts'" in result.stdout
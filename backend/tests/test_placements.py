@@ -0,0 +1,192 @@
+from datetime import datetime
+
+from app import match_cache, models, stats_cache
+
+
+def _litter(db, org, count):
+    pets = [
+        models.Pet(org_id=org.id, name=f"Kitten {n}", species="Cat", status=models.PetStatus.needs_foster)
+        for n in range(count)
+    ]
+    db.add_all(pets)
+    db.commit()
+    return pets
+
+
+def _profile(db, org, user, max_capacity, current_capacity=0):
+    profile = models.FosterProfile(
+        user_id=user.id, org_id=org.id, max_capacity=max_capacity,
+        current_capacity=current_capacity, is_available=True,
+    )
+    db.add(profile)
+    db.commit()
+    return profile
+
+
+def test_batch_places_every_pet_in_one_transaction(client, auth_headers, db, test_org, test_user, test_admin_user):
+    """Test that a batch creates the placements, moves the pets and fills the fosters."""
+    pets = _litter(db, test_org, 3)
+    first = _profile(db, test_org, test_user, max_capacity=2)
+    second = _profile(db, test_org, test_admin_user, max_capacity=4, current_capacity=1)
+
+    response = client.post(
+        "/foster-coordinator/placements/batch",
+        json={"placements": [
+            {"pet_id": pets[0].id, "foster_profile_id": first.id},
+            {"pet_id": pets[1].id, "foster_profile_id": first.id},
+            {"pet_id": pets[2].id, "foster_profile_id": second.id, "placement_notes": "Bottle fed"},
+        ]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["pet_id"] for p in data] == [pet.id for pet in pets]
+    assert data[2]["placement_notes"] == "Bottle fed"
+    db.expire_all()
+    assert [pet.status for pet in pets] == [models.PetStatus.in_foster] * 3
+    assert [pet.foster_user_id for pet in pets] == [test_user.id, test_user.id, test_admin_user.id]
+    assert (first.current_capacity, first.total_fosters) == (2, 2)
+    assert (second.current_capacity, second.total_fosters) == (2, 1)
+    events = db.query(models.PetStatusEvent).filter(
+        models.PetStatusEvent.to_status == models.PetStatus.in_foster
+    ).count()
+    assert events == 3
+
+
+def test_batch_over_capacity_writes_nothing(client, auth_headers, db, test_org, test_user):
+    """Test that one overbooked foster rejects the whole batch."""
+    pets = _litter(db, test_org, 3)
+    profile = _profile(db, test_org, test_user, max_capacity=3, current_capacity=1)
+
+    response = client.post(
+        "/foster-coordinator/placements/batch",
+        json={"placements": [{"pet_id": pet.id, "foster_profile_id": profile.id} for pet in pets]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+    assert "room for 2 more pets, 3 requested" in response.json()["detail"]
+    db.expire_all()
+    assert db.query(models.FosterPlacement).count() == 0
+    assert profile.current_capacity == 1
+    assert {pet.status for pet in pets} == {models.PetStatus.needs_foster}
+
+
+def test_batch_rejects_duplicate_pets(client, auth_headers, db, test_org, test_user):
+    """Test that a pet cannot take two slots in one batch."""
+    pet = _litter(db, test_org, 1)[0]
+    profile = _profile(db, test_org, test_user, max_capacity=3)
+
+    response = client.post(
+        "/foster-coordinator/placements/batch",
+        json={"placements": [{"pet_id": pet.id, "foster_profile_id": profile.id}] * 2},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+
+
+def test_batch_patches_the_match_cache(client, auth_headers, db, test_org, test_user):
+    """Test that the bulk pet update is patched into the match cache, not a rebuild."""
+    pets = _litter(db, test_org, 3)
+    profile = _profile(db, test_org, test_user, max_capacity=4)
+    client.get("/foster-coordinator/matches/suggest", headers=auth_headers)
+
+    client.post(
+        "/foster-coordinator/placements/batch",
+        json={"placements": [{"pet_id": pet.id, "foster_profile_id": profile.id} for pet in pets[:2]]},
+        headers=auth_headers,
+    )
+    suggested = client.get("/foster-coordinator/matches/suggest", headers=auth_headers).json()
+
+    assert [m["pet_id"] for m in suggested] == [pets[2].id]
+    info = match_cache.cache.info()
+    assert (info["rebuilds"], info["patches"]) == (1, 1)
+
+
+def test_coordinator_stats_are_cached_until_a_placement(client, auth_headers, db, test_org, test_user, test_admin_user):
+    """Test the dashboard counts and that a placement invalidates the cached payload."""
+    pets = _litter(db, test_org, 2)
+    profile = _profile(db, test_org, test_user, max_capacity=3, current_capacity=1)
+    unavailable = _profile(db, test_org, test_admin_user, max_capacity=2)
+    unavailable.is_available = False
+    db.commit()
+
+    stats = client.get("/foster-coordinator/dashboard/stats", headers=auth_headers).json()
+    assert stats["total_active_fosters"] == 2
+    assert stats["total_available_fosters"] == 1
+    assert stats["available_foster_capacity"] == 2
+    assert (stats["pets_needing_foster"], stats["pets_in_foster"]) == (2, 0)
+    assert stats["recent_placements"] == []
+
+    hits = stats_cache.cache.hits
+    client.get("/foster-coordinator/dashboard/stats", headers=auth_headers)
+    assert stats_cache.cache.hits == hits + 1
+
+    client.post(
+        "/foster-coordinator/placements",
+        json={"pet_id": pets[0].id, "foster_profile_id": profile.id, "org_id": test_org.id},
+        headers=auth_headers,
+    )
+    stats = client.get("/foster-coordinator/dashboard/stats", headers=auth_headers).json()
+
+    assert stats_cache.cache.hits == hits + 1
+    assert stats["available_foster_capacity"] == 1
+    assert (stats["pets_needing_foster"], stats["pets_in_foster"]) == (1, 1)
+    assert [(p["pet_id"], p["pet_name"], p["pet_species"]) for p in stats["recent_placements"]] == [
+        (pets[0].id, "Kitten 0", "Cat")
+    ]
+
+
+def test_placement_list_pages_by_cursor(client, auth_headers, db, test_org, test_user):
+    """Test that cursor pages cover every placement once, newest first, including same-second ties."""
+    pets = _litter(db, test_org, 5)
+    profile = _profile(db, test_org, test_user, max_capacity=5)
+    created = [datetime(2026, 1, 1), datetime(2026, 1, 2), datetime(2026, 1, 2), datetime(2026, 1, 2), datetime(2026, 1, 3)]
+    placements = [
+        models.FosterPlacement(org_id=test_org.id, pet_id=pet.id, foster_profile_id=profile.id, created_at=when)
+        for pet, when in zip(pets, created)
+    ]
+    db.add_all(placements)
+    db.commit()
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/foster-coordinator/placements", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(p["id"] for p in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    expected = sorted(placements, key=lambda p: (p.created_at, p.id), reverse=True)
+    assert seen == [p.id for p in expected]
+
+
+def test_slim_placement_list(client, auth_headers, db, test_org, test_user):
+    """Test that the slim view carries pet and foster names and still filters by pet name."""
+    pets = _litter(db, test_org, 2)
+    profile = _profile(db, test_org, test_user, max_capacity=2)
+    db.add_all([
+        models.FosterPlacement(org_id=test_org.id, pet_id=pet.id, foster_profile_id=profile.id)
+        for pet in pets
+    ])
+    db.commit()
+
+    response = client.get(
+        "/foster-coordinator/placements", params={"view": "slim", "search": "tten 1"}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    [row] = response.json()
+    assert (row["pet_name"], row["pet_species"], row["foster_name"]) == ("Kitten 1", "Cat", test_user.full_name)
+    assert "placement_notes" not in row
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_invalid_placement_cursor(client, auth_headers):
+    """Test that an undecodable cursor is a 400, not a 500."""
+    response = client.get("/foster-coordinator/placements", params={"cursor": "nope"}, headers=auth_headers)
+    assert response.status_code == 400
@@ -0,0 +1,95 @@
+import logging
+
+from app import models, query_stats
+
+
+def test_normalize_statement_collapses_in_lists():
+    """Test that expanded IN-lists normalize to the same statement."""
+    a = query_stats.normalize_statement("SELECT * FROM pets WHERE id IN (?, ?, ?)")
+    b = query_stats.normalize_statement("SELECT *\n  FROM pets WHERE id IN (?)")
+    assert a == b == "SELECT * FROM pets WHERE id IN (?)"
+
+
+def test_query_headers(client, auth_headers, test_pet):
+    """Test that responses report the statements they executed."""
+    response = client.get("/pets/", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert int(response.headers[query_stats.QUERY_COUNT_HEADER]) >= 1
+    assert float(response.headers[query_stats.QUERY_TIME_HEADER]) >= 0.0
+
+
+def test_expenses_by_category_has_no_n_plus_one(
+    client, auth_headers, db, test_org, test_admin_user, caplog, monkeypatch
+):
+    """Test that category names are joined rather than fetched per group."""
+    monkeypatch.setattr(query_stats, "N_PLUS_ONE_THRESHOLD", 2)
+
+    for i in range(4):
+        category = models.ExpenseCategory(org_id=test_org.id, name=f"Cat {i}")
+        db.add(category)
+        db.flush()
+        db.add(
+            models.Expense(
+                org_id=test_org.id,
+                category_id=category.id,
+                amount=10.0,
+                recorded_by_user_id=test_admin_user.id,
+            )
+        )
+    db.commit()
+
+    with caplog.at_level(logging.WARNING, logger="app.query_stats"):
+        response = client.get("/stats/expenses_by_category", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 4
+    assert not [r for r in caplog.records if "Possible N+1" in r.message]
+
+
+def test_middleware_flags_repeated_statements(db, caplog):
+    """Test that a statement repeated past the threshold is logged."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from sqlalchemy import text
+
+    app = FastAPI()
+    app.add_middleware(query_stats.QueryStatsMiddleware, threshold=2)
+
+    @app.get("/loop")
+    def loop():
+        for _ in range(3):
+            db.execute(text("SELECT 1")).scalar()
+        return {}
+
+    with caplog.at_level(logging.WARNING, logger="app.query_stats"):
+        response = TestClient(app).get("/loop")
+
+    assert response.headers[query_stats.QUERY_COUNT_HEADER] == "3"
+    warnings = [r.getMessage() for r in caplog.records if "Possible N+1" in r.getMessage()]
+    assert warnings == ["Possible N+1: statement ran 3 times during GET /loop: SELECT 1"]
+
+
+def test_failed_statement_does_not_skew_the_next_timing(db, monkeypatch):
+    """Test that a statement that raises leaves no start time behind for the next one."""
+    import itertools
+    from types import SimpleNamespace
+
+    import pytest
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+
+    ticks = itertools.count()
+    monkeypatch.setattr(query_stats, "time", SimpleNamespace(perf_counter=lambda: next(ticks)))
+    stats = query_stats.QueryStats()
+    token = query_stats._current.set(stats)
+    try:
+        with pytest.raises(OperationalError):
+            db.execute(text("SELECT * FROM no_such_table"))
+        db.rollback()
+        db.execute(text("SELECT 1")).scalar()
+    finally:
+        query_stats._current.reset(token)
+
+    assert (stats.count, stats.elapsed) == (1, 1)
+    assert not db.connection().info.get("query_stats_start")
@@ -0,0 +1,411 @@
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from app import export_jobs, models, pet_status, query_stats
+from app.routers import reports
+
+
+def _read_csv(response):
+    return list(csv.reader(io.StringIO(response.text)))
+
+
+def test_csv_chunks_are_bounded_and_lazy():
+    """Test that rows are pulled and written in fixed-size chunks."""
+    pulled = []
+
+    def rows():
+        for i in range(7):
+            pulled.append(i)
+            yield [i, f"pet {i}"]
+
+    chunks = reports._csv_chunks(["id", "name"], rows(), chunk_rows=3)
+    first = next(chunks)
+
+    assert first == "id,name\r\n0,pet 0\r\n1,pet 1\r\n"
+    assert pulled == [0, 1]
+    assert len(list(chunks)) == 2
+    assert pulled == list(range(7))
+
+
+def test_pets_export_streams_every_row(client, auth_headers, db, test_org):
+    """Test that an export larger than one chunk is complete and ordered."""
+    total = reports.EXPORT_CHUNK_ROWS * 2 + 5
+    db.add_all(
+        models.Pet(org_id=test_org.id, name=f"Pet {i}", species="Dog")
+        for i in range(total)
+    )
+    db.commit()
+
+    response = client.get("/reports/pets/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = _read_csv(response)
+    assert rows[0][:2] == ["ID", "Name"]
+    assert [row[1] for row in rows[1:]] == [f"Pet {i}" for i in range(total)]
+
+
+def test_expenses_export_joins_categories(
+    client, auth_headers, db, test_org, test_admin_user, caplog, monkeypatch
+):
+    """Test that category names come from a join, not a query per expense."""
+    monkeypatch.setattr(query_stats, "N_PLUS_ONE_THRESHOLD", 2)
+
+    for i in range(5):
+        category = models.ExpenseCategory(org_id=test_org.id, name=f"Cat {i}")
+        db.add(category)
+        db.flush()
+        db.add(
+            models.Expense(
+                org_id=test_org.id,
+                category_id=category.id,
+                amount=12.5,
+                recorded_by_user_id=test_admin_user.id,
+            )
+        )
+    db.commit()
+
+    with caplog.at_level(logging.WARNING, logger="app.query_stats"):
+        response = client.get("/reports/financial/expenses/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    rows = _read_csv(response)
+    assert [row[1] for row in rows[1:]] == [f"Cat {i}" for i in range(5)]
+    assert rows[1][2] == "$12.50"
+    assert not [r for r in caplog.records if "Possible N+1" in r.message]
+
+
+def test_adoptions_export_reads_status_log(client, auth_headers, db, test_org):
+    """Test that adoptions are listed from the pet status log."""
+    pet = models.Pet(
+        org_id=test_org.id,
+        name="Biscuit",
+        species="Dog",
+        status=models.PetStatus.adopted,
+        intake_date=date.today(),
+    )
+    db.add(pet)
+    pet_status.record_change(db, pet, models.PetStatus.available)
+    db.commit()
+
+    response = client.get("/reports/adoptions/export", headers=auth_headers)
+
+    assert response.status_code == 200
+    rows = _read_csv(response)
+    assert len(rows) == 2
+    assert rows[1][1] == "Biscuit"
+    assert rows[1][6] == "0"
+
+
+class _InlineExecutor:
+    """Runs submitted export jobs immediately, in the calling thread."""
+
+    def __init__(self):
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        fn(*args)
+
+
+def _export_jobs_inline(monkeypatch, tmp_path):
+    executor = _InlineExecutor()
+    monkeypatch.setattr(export_jobs, "_executor", executor)
+    monkeypatch.setattr(export_jobs, "EXPORT_ROOT", str(tmp_path))
+    return executor
+
+
+def test_export_job_writes_artifact_with_range_support(
+    client, auth_headers, db, test_org, monkeypatch, tmp_path
+):
+    """Test that a job writes the CSV to disk and serves byte ranges."""
+    _export_jobs_inline(monkeypatch, tmp_path)
+    db.add_all(
+        models.Person(org_id=test_org.id, first_name=f"P{i}", last_name="Donor", tag_donor=True)
+        for i in range(3)
+    )
+    db.commit()
+
+    response = client.post(
+        "/reports/exports",
+        json={"report": "people", "tag_filter": "donor"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert (job["status"], job["total_rows"], job["rows_written"]) == ("completed", 3, 3)
+
+    status = client.get(f"/reports/exports/{job['id']}", headers=auth_headers).json()
+    assert status["download_url"] == f"/reports/exports/{job['id']}/download"
+
+    full = client.get(status["download_url"], headers=auth_headers)
+    assert full.status_code == 200
+    assert len(full.content) == status["size_bytes"]
+    assert [row[1] for row in _read_csv(full)[1:]] == ["P0", "P1", "P2"]
+
+    partial = client.get(
+        status["download_url"], headers={**auth_headers, "Range": "bytes=10-19"}
+    )
+    assert partial.status_code == 206
+    assert partial.content == full.content[10:20]
+
+
+def test_identical_export_requests_share_a_job(
+    client, auth_headers, test_org, monkeypatch, tmp_path
+):
+    """Test that repeat requests reuse the artifact and other filters do not."""
+    executor = _export_jobs_inline(monkeypatch, tmp_path)
+
+    body = {"report": "donations", "days": 365, "tag_filter": "ignored"}
+    first = client.post("/reports/exports", json=body, headers=auth_headers).json()
+    second = client.post(
+        "/reports/exports", json={"report": "donations", "days": 365}, headers=auth_headers
+    ).json()
+    other = client.post(
+        "/reports/exports", json={"report": "donations", "days": 30}, headers=auth_headers
+    ).json()
+
+    assert first["id"] == second["id"] != other["id"]
+    assert executor.submitted == 2
+
+
+class _DeadExecutor:
+    """Accepts jobs and never runs them, like a pool lost to a restart."""
+
+    def submit(self, fn, *args):
+        pass
+
+
+def test_export_job_without_live_worker_is_replaced(
+    client, auth_headers, db, test_org, monkeypatch, tmp_path
+):
+    """Test that a job orphaned by a restart is failed and a new one started."""
+    monkeypatch.setattr(export_jobs, "_executor", _DeadExecutor())
+    monkeypatch.setattr(export_jobs, "_live", set())
+    monkeypatch.setattr(export_jobs, "EXPORT_ROOT", str(tmp_path))
+    body = {"report": "people"}
+    orphan = client.post("/reports/exports", json=body, headers=auth_headers).json()
+
+    # Still queued in this process: shared, not replaced
+    again = client.post("/reports/exports", json=body, headers=auth_headers).json()
+    assert again["id"] == orphan["id"]
+
+    db.query(models.ExportJob).filter(models.ExportJob.id == orphan["id"]).update(
+        {"status": models.ExportJobStatus.running}
+    )
+    db.commit()
+    monkeypatch.setattr(export_jobs, "_live", set())
+    executor = _export_jobs_inline(monkeypatch, tmp_path)
+
+    fresh = client.post("/reports/exports", json=body, headers=auth_headers).json()
+
+    assert fresh["id"] != orphan["id"]
+    assert fresh["status"] == "completed"
+    assert executor.submitted == 1
+    stale = client.get(f"/reports/exports/{orphan['id']}", headers=auth_headers).json()
+    assert (stale["status"], stale["error"]) == ("failed", export_jobs.STALE_JOB_ERROR)
+
+
+def test_identical_export_racing_a_commit_shares_the_job(
+    db, test_org, test_user, monkeypatch, tmp_path
+):
+    """Test that a request whose lookup missed a just-created job gets that job, not a second one."""
+    monkeypatch.setattr(export_jobs, "_live", set())
+    monkeypatch.setattr(export_jobs, "EXPORT_ROOT", str(tmp_path))
+    first, created = export_jobs.get_or_create(db, test_org.id, test_user.id, "people", {})
+    assert created
+
+    lookup, calls = export_jobs._unfinished, []
+
+    def racing_lookup(*args):
+        # The first lookup runs before the other request's job is visible
+        calls.append(args)
+        return None if len(calls) == 1 else lookup(*args)
+
+    monkeypatch.setattr(export_jobs, "_unfinished", racing_lookup)
+    second, created = export_jobs.get_or_create(db, test_org.id, test_user.id, "people", {})
+
+    assert (second.id, created) == (first.id, False)
+    assert len(calls) == 2
+    assert db.query(models.ExportJob).count() == 1
+
+
+def test_finished_exports_expire_after_retention(
+    client, auth_headers, db, test_org, monkeypatch, tmp_path
+):
+    """Test that the sweep deletes old artifacts, downloads answer 410 and a new job replaces it."""
+    executor = _export_jobs_inline(monkeypatch, tmp_path)
+    body = {"report": "people"}
+    job = client.post("/reports/exports", json=body, headers=auth_headers).json()
+    stored = db.get(models.ExportJob, job["id"])
+    path = export_jobs.artifact_path(stored)
+
+    assert export_jobs.expire_finished(db) == 0
+    later = stored.completed_at + timedelta(seconds=export_jobs.EXPORT_RETENTION_SECONDS + 1)
+    assert export_jobs.expire_finished(db, now=later) == 1
+
+    assert not os.path.exists(path)
+    response = client.get(f"/reports/exports/{job['id']}/download", headers=auth_headers)
+    assert response.status_code == 410
+    assert client.get(f"/reports/exports/{job['id']}", headers=auth_headers).json()["status"] == "expired"
+    assert client.post("/reports/exports", json=body, headers=auth_headers).json()["id"] != job["id"]
+    assert executor.submitted == 2
+
+
+def test_export_job_rejects_unknown_report(client, auth_headers, monkeypatch, tmp_path):
+    """Test that unknown reports are rejected and unfinished jobs are not downloadable."""
+    _export_jobs_inline(monkeypatch, tmp_path)
+
+    response = client.post("/reports/exports", json={"report": "nope"}, headers=auth_headers)
+    assert response.status_code == 400
+
+    response = client.get("/reports/exports/999/download", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_export_negotiates_ndjson_and_gzip(client, auth_headers, db, test_org):
+    """Test that Accept picks NDJSON and Accept-Encoding gzips the stream."""
+    db.add_all(
+        models.Pet(org_id=test_org.id, name=f"Pet {i}", species="Dog", breed="Mixed")
+        for i in range(reports.EXPORT_CHUNK_ROWS + 10)
+    )
+    db.commit()
+
+    headers = {
+        **auth_headers,
+        "Accept": "application/x-ndjson, text/csv;q=0.5",
+        "Accept-Encoding": "gzip",
+    }
+    with client.stream("GET", "/reports/pets/export", headers=headers) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-encoding"] == "gzip"
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert len(lines) == reports.EXPORT_CHUNK_ROWS + 10
+    assert json.loads(lines[0])["name"] == "Pet 0"
+    assert json.loads(lines[0])["date_of_birth"] == ""
+    assert len(raw) * 5 < sum(len(line) for line in lines)
+
+
+def test_format_parameter_overrides_accept(client, auth_headers, test_pet):
+    """Test that format= wins over Accept and identity encoding is honoured."""
+    response = client.get(
+        "/reports/pets/export?format=csv",
+        headers={
+            **auth_headers,
+            "Accept": "application/x-ndjson",
+            "Accept-Encoding": "identity",
+        },
+    )
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "content-encoding" not in response.headers
+    assert _read_csv(response)[1][1] == test_pet.name
+
+    response = client.get("/reports/pets/export?format=xml", headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_snapshot_zips_every_report(
+    client, auth_headers, db, test_org, test_pet, monkeypatch
+):
+    """Test that the snapshot archive holds each report and isolates failures."""
+    monkeypatch.setattr(reports, "_snapshot_executor", ThreadPoolExecutor(max_workers=2))
+
+    def broken(db, org_id):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(reports.EXPORTS, "foster_performance", broken)
+
+    response = client.get("/reports/snapshot", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    expected = {f"{name}.csv" for name in reports.EXPORTS} - {"foster_performance.csv"}
+    assert set(archive.namelist()) == expected | {"errors.txt"}
+    assert archive.read("errors.txt").decode() == "foster_performance: boom\n"
+
+    pets = list(csv.reader(io.StringIO(archive.read("pets.csv").decode())))
+    assert pets[1][1] == test_pet.name
+
+
+def test_delta_export_returns_rows_changed_since_cursor(
+    client, auth_headers, db, test_org
+):
+    """Test that since= returns only changed rows and hands back the next cursor."""
+    synced = datetime(2025, 1, 1)
+    pets = [
+        models.Pet(org_id=test_org.id, name=f"Pet {i}", species="Dog", updated_at=synced)
+        for i in range(3)
+    ]
+    db.add_all(pets)
+    db.commit()
+
+    full = client.get("/reports/pets/export", headers=auth_headers)
+    cursor = full.headers[reports.EXPORT_CURSOR_HEADER]
+    assert reports.decode_cursor(cursor) == synced
+    assert len(_read_csv(full)) == 4
+
+    unchanged = client.get(f"/reports/pets/export?since={cursor}", headers=auth_headers)
+    assert _read_csv(unchanged)[1:] == []
+    assert unchanged.headers[reports.EXPORT_CURSOR_HEADER] == cursor
+
+    client.put(f"/pets/{pets[1].id}", json={"name": "Renamed"}, headers=auth_headers)
+
+    delta = client.get(f"/reports/pets/export?since={cursor}", headers=auth_headers)
+    assert [row[1] for row in _read_csv(delta)[1:]] == ["Renamed"]
+    assert reports.decode_cursor(delta.headers[reports.EXPORT_CURSOR_HEADER]) > synced
+
+
+def test_delta_export_catches_a_late_commit(client, auth_headers, db, test_org):
+    """Test that a row stamped before an exported row but committed after it is not skipped."""
+    now = datetime.utcnow()
+    db.add(models.Pet(
+        org_id=test_org.id, name="Early commit", species="Dog", updated_at=now - timedelta(seconds=5)
+    ))
+    db.commit()
+    cursor = client.get("/reports/pets/export", headers=auth_headers).headers[reports.EXPORT_CURSOR_HEADER]
+
+    # Stamped earlier, committed only after the export above
+    db.add(models.Pet(
+        org_id=test_org.id, name="Late commit", species="Dog", updated_at=now - timedelta(seconds=10)
+    ))
+    db.commit()
+    delta = client.get(f"/reports/pets/export?since={cursor}", headers=auth_headers)
+
+    assert sorted(row[1] for row in _read_csv(delta)[1:]) == ["Early commit", "Late commit"]
+
+
+def test_delta_export_ignores_days_window(
+    client, auth_headers, db, test_org, test_admin_user
+):
+    """Test that an old application changed recently is included in the delta."""
+    db.add(
+        models.Application(
+            org_id=test_org.id,
+            type=models.ApplicationType.adoption,
+            created_at=datetime(2020, 1, 1),
+            updated_at=datetime(2025, 6, 1),
+        )
+    )
+    db.commit()
+    cursor = reports.encode_cursor(datetime(2025, 1, 1))
+
+    assert len(_read_csv(client.get("/reports/applications/export", headers=auth_headers))) == 1
+
+    delta = client.get(f"/reports/applications/export?since={cursor}", headers=auth_headers)
+    rows = _read_csv(delta)
+    assert len(rows) == 2
+    assert rows[1][6] == "2025-06-01"
+
+    response = client.get("/reports/applications/export?since=not-a-cursor", headers=auth_headers)
+    assert response.status_code == 400
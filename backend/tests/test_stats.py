@@ -0,0 +1,396 @@
+from datetime import date, datetime, timedelta
+
+from app import models, pet_status, rollups
+
+
+def _add_pet(db, org_id, name, status):
+    pet = models.Pet(org_id=org_id, name=name, species="Dog", status=status)
+    db.add(pet)
+    return pet
+
+
+def test_comprehensive_metrics(client, auth_headers, db, test_org, test_admin_user):
+    """Test that conditional aggregates match per-metric counts."""
+    _add_pet(db, test_org.id, "A", models.PetStatus.available)
+    _add_pet(db, test_org.id, "B", models.PetStatus.available)
+    _add_pet(db, test_org.id, "C", models.PetStatus.in_foster)
+    adopted = _add_pet(db, test_org.id, "D", models.PetStatus.adopted)
+    pet_status.record_change(db, adopted, models.PetStatus.available)
+
+    db.add(
+        models.FosterProfile(
+            user_id=test_admin_user.id,
+            org_id=test_org.id,
+            max_capacity=3,
+            is_available=True,
+        )
+    )
+    db.add_all(
+        [
+            models.Application(
+                org_id=test_org.id,
+                type=models.ApplicationType.adoption,
+                status=models.ApplicationStatus.submitted,
+            ),
+            models.Application(
+                org_id=test_org.id,
+                type=models.ApplicationType.adoption,
+                status=models.ApplicationStatus.approved,
+            ),
+            models.Task(
+                org_id=test_org.id,
+                title="Vet visit",
+                status=models.TaskStatus.open,
+                priority=models.TaskPriority.urgent,
+                created_by_user_id=test_admin_user.id,
+            ),
+            models.Task(
+                org_id=test_org.id,
+                title="Done",
+                status=models.TaskStatus.completed,
+                created_by_user_id=test_admin_user.id,
+            ),
+            models.Payment(
+                org_id=test_org.id,
+                user_id=test_admin_user.id,
+                purpose=models.PaymentPurpose.donation,
+                amount=100.0,
+                status=models.PaymentStatus.completed,
+                created_at=datetime.utcnow(),
+            ),
+            models.Payment(
+                org_id=test_org.id,
+                user_id=test_admin_user.id,
+                purpose=models.PaymentPurpose.donation,
+                amount=50.0,
+                status=models.PaymentStatus.completed,
+                created_at=datetime(2001, 1, 1),
+            ),
+            models.Person(
+                org_id=test_org.id,
+                first_name="Vol",
+                last_name="Unteer",
+                tag_volunteer=True,
+                tag_donor=True,
+            ),
+        ]
+    )
+    db.commit()
+
+    response = client.get("/stats/comprehensive_metrics", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pet_metrics"] == {
+        "total_pets": 4,
+        "pets_available": 2,
+        "pets_in_foster": 1,
+        "pets_adopted_this_month": 1,
+    }
+    assert data["foster_metrics"]["total_capacity"] == 3
+    assert data["foster_metrics"]["available_capacity"] == 3
+    assert data["application_metrics"] == {
+        "pending_applications": 1,
+        "approved_applications_this_month": 1,
+    }
+    assert data["task_metrics"] == {"open_tasks": 1, "urgent_tasks": 1}
+    assert data["financial_metrics"]["total_donations"] == 150.0
+    assert data["financial_metrics"]["donations_this_month"] == 100.0
+    assert data["financial_metrics"]["net_balance"] == 150.0
+    assert data["people_metrics"] == {"total_volunteers": 1, "total_donors": 1}
+
+
+def test_trend_endpoints_read_rollup(client, auth_headers, db, test_org):
+    """Test that write paths feed the daily rollup used by the trend endpoints."""
+    today = datetime.utcnow().date().isoformat()
+
+    response = client.post(
+        "/pets/",
+        json={"name": "Rex", "species": "Dog", "intake_date": today},
+        headers=auth_headers,
+    )
+    pet_id = response.json()["id"]
+    client.put(f"/pets/{pet_id}", json={"status": "adopted"}, headers=auth_headers)
+
+    response = client.post(
+        "/applications/",
+        json={"org_id": test_org.id, "type": "foster"},
+        headers=auth_headers,
+    )
+    app_id = response.json()["id"]
+    client.patch(
+        f"/applications/{app_id}", json={"status": "approved"}, headers=auth_headers
+    )
+
+    category = client.post(
+        "/expenses/categories",
+        json={"org_id": test_org.id, "name": "Vet"},
+        headers=auth_headers,
+    ).json()
+    client.post(
+        "/expenses/",
+        json={
+            "org_id": test_org.id,
+            "category_id": category["id"],
+            "amount": 42.5,
+            "date_incurred": datetime.utcnow().isoformat(),
+        },
+        headers=auth_headers,
+    )
+
+    intake = client.get("/stats/intake_trends", headers=auth_headers).json()
+    assert intake == [{"date": today, "count": 1}]
+
+    adoptions = client.get("/stats/adoption_trends", headers=auth_headers).json()
+    assert adoptions == [{"date": today, "count": 1}]
+
+    applications = client.get("/stats/application_trends", headers=auth_headers).json()
+    assert applications["by_type"] == {"foster": 1}
+    assert applications["by_status"] == {"approved": 1}
+    assert applications["daily_submissions"] == [{"date": today, "count": 1}]
+
+    financial = client.get("/stats/financial_operations", headers=auth_headers).json()
+    assert financial["daily_expenses"] == [{"date": today, "count": 1, "total": 42.5}]
+
+
+def test_public_adoption_request_feeds_rollup(client, auth_headers, db, test_org, test_pet):
+    """Test that applications from the public site are counted like portal ones."""
+    today = datetime.utcnow().date().isoformat()
+
+    response = client.post(
+        "/public/adopt",
+        params={
+            "org_id": test_org.id,
+            "pet_id": test_pet.id,
+            "email": "adopter@example.com",
+            "full_name": "Ada Opter",
+        },
+    )
+    assert response.status_code == 200
+
+    applications = client.get("/stats/application_trends", headers=auth_headers).json()
+    assert applications["by_type"] == {"adoption": 1}
+    assert applications["by_status"] == {"submitted": 1}
+    assert applications["daily_submissions"] == [{"date": today, "count": 1}]
+
+    client.patch(
+        f"/applications/{response.json()['id']}",
+        json={"status": "approved"},
+        headers=auth_headers,
+    )
+    applications = client.get("/stats/application_trends", headers=auth_headers).json()
+    assert applications["by_status"] == {"approved": 1}
+
+
+def test_rollup_rebuild_matches_history(db, test_org, test_admin_user):
+    """Test that a rebuild backfills the rollup from raw rows."""
+    db.add_all(
+        [
+            models.Pet(
+                org_id=test_org.id,
+                name="Old",
+                species="Cat",
+                intake_date=date(2024, 5, 1),
+            ),
+            models.Payment(
+                org_id=test_org.id,
+                user_id=test_admin_user.id,
+                purpose=models.PaymentPurpose.donation,
+                amount=20.0,
+                provider="stripe",
+                status=models.PaymentStatus.completed,
+                created_at=datetime(2024, 5, 2, 10, 0),
+            ),
+            models.Payment(
+                org_id=test_org.id,
+                user_id=test_admin_user.id,
+                purpose=models.PaymentPurpose.donation,
+                amount=99.0,
+                status=models.PaymentStatus.pending,
+                created_at=datetime(2024, 5, 2, 11, 0),
+            ),
+        ]
+    )
+    db.commit()
+
+    rollups.rebuild(db)
+
+    since = date(2024, 1, 1)
+    assert rollups.daily_series(db, test_org.id, since, rollups.PET_INTAKE) == [
+        (date(2024, 5, 1), 1, 0.0)
+    ]
+    assert rollups.breakdown(db, test_org.id, since, rollups.PAYMENT_PROVIDER) == {
+        "stripe": (1, 20.0)
+    }
+
+
+def test_recent_rebuild_reconciles_hand_edited_rows(
+    client, auth_headers, db, test_org, test_admin_user
+):
+    """Test that a windowed rebuild fixes recent days only and keeps the no-provider key."""
+    now = datetime.utcnow()
+    category = models.ExpenseCategory(org_id=test_org.id, name="Vet")
+    db.add(category)
+    db.flush()
+    old, recent = (
+        models.Expense(
+            org_id=test_org.id, category_id=category.id, amount=amount, date_incurred=day,
+            recorded_by_user_id=test_admin_user.id,
+        )
+        for amount, day in ((10.0, datetime(2024, 5, 1)), (20.0, now))
+    )
+    payment = models.Payment(
+        org_id=test_org.id, user_id=test_admin_user.id, purpose=models.PaymentPurpose.donation,
+        amount=15.0, status=models.PaymentStatus.completed, created_at=now,
+    )
+    db.add_all([old, recent, payment])
+    db.flush()
+    for expense in (old, recent):
+        rollups.record_expense_created(db, expense)
+    rollups.record_payment_created(db, payment)
+    db.commit()
+
+    # Edited outside the write paths; legacy payments may have no provider
+    old.amount = 11.0
+    recent.amount = 25.0
+    db.query(models.Payment).update({"provider": None})
+    db.commit()
+    rollups.rebuild(db, since=now.date() - timedelta(days=7))
+
+    assert rollups.daily_series(db, test_org.id, date(2024, 1, 1), rollups.EXPENSE) == [
+        (date(2024, 5, 1), 1, 10.0),
+        (now.date(), 1, 25.0),
+    ]
+    financial = client.get("/stats/financial_operations", headers=auth_headers).json()
+    assert financial["by_provider"] == {"None": {"count": 1, "total_amount": 15.0}}
+
+
+def test_status_changes_are_logged(client, auth_headers, db, test_org, test_user):
+    """Test that status transitions are logged and aggregated in SQL."""
+    response = client.post(
+        "/pets/",
+        json={"name": "Rex", "species": "Dog", "intake_date": "2025-01-01"},
+        headers=auth_headers,
+    )
+    pet_id = response.json()["id"]
+    client.post(
+        f"/pets/{pet_id}/assign-foster",
+        params={"foster_user_id": test_user.id},
+        headers=auth_headers,
+    )
+    client.put(f"/pets/{pet_id}", json={"status": "adopted"}, headers=auth_headers)
+
+    events = (
+        db.query(models.PetStatusEvent)
+        .filter(models.PetStatusEvent.pet_id == pet_id)
+        .order_by(models.PetStatusEvent.id)
+        .all()
+    )
+    assert [(e.from_status, e.to_status) for e in events] == [
+        (None, models.PetStatus.intake),
+        (models.PetStatus.intake, models.PetStatus.in_foster),
+        (models.PetStatus.in_foster, models.PetStatus.adopted),
+    ]
+
+    expected_days = (datetime.utcnow() - datetime(2025, 1, 1)).days
+    efficiency = client.get("/stats/time_to_adoption", headers=auth_headers).json()
+    assert int(efficiency["avg_days_to_adoption"]) == expected_days
+    assert efficiency["periods"][0]["adoptions"] == 1
+
+    by_status = {
+        row["status"]: row
+        for row in client.get("/stats/time_in_status", headers=auth_headers).json()
+    }
+    assert set(by_status) == {"intake", "in_foster", "adopted"}
+    assert by_status["adopted"]["pets_currently_in_status"] == 1
+    assert by_status["intake"]["pets_currently_in_status"] == 0
+
+
+def test_dashboard_runs_sections_independently(
+    client, auth_headers, db, test_org, monkeypatch
+):
+    """Test that the composite dashboard isolates section failures."""
+    from app.routers import stats
+
+    _add_pet(db, test_org.id, "A", models.PetStatus.available)
+    db.commit()
+
+    def broken(db, user):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(stats.DASHBOARD_SECTIONS, "donations_summary", broken)
+
+    response = client.get(
+        "/stats/dashboard",
+        params={"sections": "pets_by_status,species_breakdown,donations_summary"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["sections"]["pets_by_status"] == [{"status": "available", "count": 1}]
+    assert data["sections"]["species_breakdown"] == [{"species": "Dog", "count": 1}]
+    assert data["errors"] == {"donations_summary": stats.DASHBOARD_SECTION_ERROR}
+    assert "boom" not in response.text
+
+
+def test_default_dashboard_sections_all_succeed(
+    client, auth_headers, db, test_org, test_user
+):
+    """Test that every default section runs, including events, messages and documents."""
+    from datetime import datetime, timedelta
+
+    event = models.Event(
+        org_id=test_org.id,
+        name="Adoption day",
+        start_datetime=datetime.utcnow() + timedelta(days=1),
+        capacity=4,
+    )
+    thread = models.MessageThread(org_id=test_org.id, subject="Hi", created_by_user_id=test_user.id)
+    db.add_all([event, thread])
+    db.flush()
+    db.add_all([
+        models.EventSignup(event_id=event.id, user_id=test_user.id),
+        models.Message(thread_id=thread.id, sender_user_id=test_user.id, body_text="Hello"),
+        models.Document(org_id=test_org.id, uploader_user_id=test_user.id, file_path="a.pdf"),
+    ])
+    db.commit()
+
+    data = client.get("/stats/dashboard", headers=auth_headers).json()
+
+    assert data["errors"] == {}
+    sections = data["sections"]
+    events = sections["event_participation"]
+    assert (events["upcoming_events"], events["total_signups"]) == (1, 1)
+    assert sections["communication_metrics"]["total_messages"] == 1
+    assert sections["document_metrics"]["total_documents"] == 1
+
+
+def test_dashboard_rejects_unknown_sections(client, auth_headers):
+    """Test that unknown section names are rejected."""
+    response = client.get(
+        "/stats/dashboard", params={"sections": "nope"}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_user_activity_reads_daily_rollup(client, auth_headers, db, test_org, test_user):
+    """Test that audited actions are rolled up per user and day."""
+    from app import audit
+
+    audit.log_action(db, test_org.id, test_user.id, "pet", 1, "update")
+    audit.log_action(db, test_org.id, test_user.id, "pet", 1, "update")
+    audit.log_action(db, test_org.id, None, "payment", 2, "webhook")
+
+    rows = db.query(models.UserActivityDaily).all()
+    assert [(r.user_id, r.action_count) for r in rows] == [(test_user.id, 2)]
+
+    data = client.get("/stats/user_activity", headers=auth_headers).json()
+    assert data["active_users"] == 1
+    assert data["new_users"] == 1
+    assert data["total_users"] == 2
+
+    db.query(models.UserActivityDaily).delete()
+    db.commit()
+    assert rollups.rebuild_user_activity(db) == 1
+    assert db.query(models.UserActivityDaily).one().action_count == 2
@@ -0,0 +1,82 @@
+from app import models, stats_cache
+
+
+def test_stats_are_cached_until_a_source_table_changes(client, auth_headers, db, test_org):
+    """Test that a write to a dependent table invalidates the cached response."""
+    first = client.get("/stats/pets_by_status", headers=auth_headers).json()
+    second = client.get("/stats/pets_by_status", headers=auth_headers).json()
+    assert first == second == []
+
+    info = client.get("/stats/cache", headers=auth_headers).json()
+    assert (info["hits"], info["misses"]) == (1, 1)
+
+    client.post("/pets/", json={"name": "Rex", "species": "Dog"}, headers=auth_headers)
+
+    response = client.get("/stats/pets_by_status", headers=auth_headers).json()
+    assert response == [{"status": "intake", "count": 1}]
+
+
+def test_unrelated_writes_keep_cache_entries(
+    client, auth_headers, db, test_org, test_admin_user
+):
+    """Test that writes to other tables or other orgs leave entries reachable."""
+    client.get("/stats/pets_by_status", headers=auth_headers)
+
+    other_org = models.Organization(name="Other Rescue")
+    db.add(other_org)
+    db.flush()
+    db.add(models.Pet(org_id=other_org.id, name="Elsewhere", species="Cat"))
+    db.add(
+        models.Task(
+            org_id=test_org.id,
+            title="Walk dogs",
+            created_by_user_id=test_admin_user.id,
+        )
+    )
+    db.commit()
+
+    client.get("/stats/pets_by_status", headers=auth_headers)
+    assert stats_cache.cache.hits == 1
+
+
+def test_rolled_back_writes_do_not_invalidate(db, test_org):
+    """Test that only committed flushes bump table versions."""
+    before = stats_cache.cache.key(test_org.id, "pets_by_status", {}, ["pets"])
+
+    db.add(models.Pet(org_id=test_org.id, name="Draft", species="Dog"))
+    db.flush()
+    db.rollback()
+
+    assert stats_cache.cache.key(test_org.id, "pets_by_status", {}, ["pets"]) == before
+
+
+def test_memory_backend_ttl_and_lru():
+    """Test that entries expire and the least recently used entry is evicted."""
+    now = [0.0]
+    backend = stats_cache.MemoryBackend(max_bytes=10, clock=lambda: now[0])
+
+    backend.set("a", "aaaa", ttl=60)
+    backend.set("b", "bbbb", ttl=60)
+    assert backend.get("a") == "aaaa"
+
+    backend.set("c", "cccc", ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == "aaaa"
+    assert backend.info()["evictions"] == 1
+
+    now[0] = 61.0
+    assert backend.get("c") is None
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    """Test that separate processes on one host see the same entries and versions."""
+    path = str(tmp_path / "stats_cache.db")
+    writer = stats_cache.StatsCache(stats_cache.SQLiteBackend(path))
+    reader = stats_cache.StatsCache(stats_cache.SQLiteBackend(path))
+
+    assert writer.get_or_compute(1, "summary", {"days": 7}, ["pets"], lambda: {"n": 1}) == {"n": 1}
+    assert reader.get_or_compute(1, "summary", {"days": 7}, ["pets"], lambda: {"n": 2}) == {"n": 1}
+    assert reader.hits == 1
+
+    writer.invalidate(1, ["pets"])
+    assert reader.get_or_compute(1, "summary", {"days": 7}, ["pets"], lambda: {"n": 2}) == {"n": 2}
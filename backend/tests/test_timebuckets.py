@@ -0,0 +1,55 @@
+from datetime import date, datetime
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app import models, timebuckets
+
+
+class _FakeSession:
+    def __init__(self, dialect):
+        self._dialect = dialect
+
+    def get_bind(self):
+        return self
+
+    @property
+    def dialect(self):
+        return self._dialect
+
+
+def test_month_range_wraps_year():
+    start, end = timebuckets.month_range(datetime(2025, 12, 17, 9, 30))
+    assert start == datetime(2025, 12, 1)
+    assert end == datetime(2026, 1, 1)
+
+
+def test_last_n_days_is_half_open():
+    now = datetime(2025, 3, 10, 12, 0)
+    start, end = timebuckets.last_n_days(7, now)
+    assert (start, end) == (datetime(2025, 3, 3, 12, 0), now)
+    assert timebuckets.since_day(7, now) == date(2025, 3, 3)
+
+
+def test_in_range_is_sargable():
+    start, end = timebuckets.month_range(datetime(2025, 4, 9))
+    clause = timebuckets.in_range(models.Payment.created_at, start, end)
+    sql = str(clause.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("payments.created_at >= ")
+    assert " AND payments.created_at < " in sql
+    assert "date_trunc" not in sql and "strftime" not in sql
+
+
+def test_bucket_is_dialect_aware():
+    column = models.Application.created_at
+
+    pg = timebuckets.bucket(_FakeSession(postgresql.dialect()), column, "month")
+    assert "date_trunc" in str(pg.compile(dialect=postgresql.dialect()))
+
+    lite = timebuckets.bucket(_FakeSession(sqlite.dialect()), column, "month")
+    assert "strftime" in str(lite.compile(dialect=sqlite.dialect()))
+
+
+def test_bucket_label_normalises_both_dialects():
+    assert timebuckets.bucket_label(datetime(2025, 4, 1), "month") == "2025-04"
+    assert timebuckets.bucket_label("2025-04", "month") == "2025-04"
+    assert timebuckets.bucket_date("2025-04-09") == date(2025, 4, 9)
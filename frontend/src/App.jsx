@@ -2082,23 +2082,25 @@ function AnalyticsPage({ colors, styles }) {
   async function loadAnalytics() {
     setLoading(true);
     try {
-      const [metricsRes, intakeRes, adoptionRes, speciesRes, fosterRes, appRes, statusRes] = await Promise.all([
-        api.get("/stats/comprehensive_metrics"),
-        api.get(`/stats/intake_trends?days=${timeRange}`),
-        api.get(`/stats/adoption_trends?days=${timeRange}`),
-        api.get("/stats/species_breakdown"),
-        api.get("/stats/foster_performance"),
-        api.get(`/stats/application_trends?days=${timeRange}`),
-        api.get("/stats/pets_by_status")
-      ]);
-
-      setMetrics(metricsRes.data);
-      setIntakeTrends(intakeRes.data || []);
-      setAdoptionTrends(adoptionRes.data || []);
-      setSpeciesBreakdown(speciesRes.data.map(d => ({ ...d, label: d.species })) || []);
-      setFosterPerformance(fosterRes.data);
-      setApplicationTrends(appRes.data);
-      setPetsByStatus(statusRes.data.map(d => ({ ...d, label: d.status })) || []);
+      const sectionNames = [
+        "comprehensive_metrics",
+        "intake_trends",
+        "adoption_trends",
+        "species_breakdown",
+        "foster_performance",
+        "application_trends",
+        "pets_by_status"
+      ];
+      const res = await api.get(`/stats/dashboard?sections=${sectionNames.join(",")}&days=${timeRange}`);
+      const sections = res.data.sections || {};
+
+      setMetrics(sections.comprehensive_metrics || null);
+      setIntakeTrends(sections.intake_trends || []);
+      setAdoptionTrends(sections.adoption_trends || []);
+      setSpeciesBreakdown((sections.species_breakdown || []).map(d => ({ ...d, label: d.species })));
+      setFosterPerformance(sections.foster_performance || null);
+      setApplicationTrends(sections.application_trends || null);
+      setPetsByStatus((sections.pets_by_status || []).map(d => ({ ...d, label: d.status })));
     } catch (err) {
       console.error("Failed to load analytics:", err);
     } finally {
@@ -2387,23 +2389,25 @@ function OperationsDashboard({ colors, styles }) {
   async function loadOperationsData() {
     setLoading(true);
     try {
-      const [medicalRes, eventRes, commRes, docRes, financialRes, efficiencyRes, userRes] = await Promise.all([
-        api.get(`/stats/medical_operations?days=${timeRange}`),
-        api.get(`/stats/event_participation?days=${timeRange}`),
-        api.get(`/stats/communication_metrics?days=${timeRange}`),
-        api.get(`/stats/document_metrics?days=${timeRange}`),
-        api.get(`/stats/financial_operations?days=${timeRange}`),
-        api.get('/stats/operational_efficiency'),
-        api.get(`/stats/user_activity?days=${timeRange}`)
-      ]);
-
-      setMedicalOps(medicalRes.data);
-      setEventParticipation(eventRes.data);
-      setCommMetrics(commRes.data);
-      setDocMetrics(docRes.data);
-      setFinancialOps(financialRes.data);
-      setEfficiency(efficiencyRes.data);
-      setUserActivity(userRes.data);
+      const sectionNames = [
+        'medical_operations',
+        'event_participation',
+        'communication_metrics',
+        'document_metrics',
+        'financial_operations',
+        'operational_efficiency',
+        'user_activity'
+      ];
+      const res = await api.get(`/stats/dashboard?sections=${sectionNames.join(',')}&days=${timeRange}`);
+      const sections = res.data.sections || {};
+
+      setMedicalOps(sections.medical_operations || null);
+      setEventParticipation(sections.event_participation || null);
+      setCommMetrics(sections.communication_metrics || null);
+      setDocMetrics(sections.document_metrics || null);
+      setFinancialOps(sections.financial_operations || null);
+      setEfficiency(sections.operational_efficiency || null);
+      setUserActivity(sections.user_activity || null);
     } catch (err) {
       console.error("Failed to load operations data:", err);
     } finally {
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import heapq
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy import and_, func
 from typing import List, Optional
 from datetime import datetime
@@ -98,13 +100,113 @@ def update_my_foster_profile(
 
 
 # MATCHING ALGORITHM
+MATCH_THRESHOLD = 20  # Minimum score for a suggestion
+SPECIES_POINTS = 30
+MEDICAL_POINTS = 25
+BEHAVIORAL_POINTS = 25
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _foster_base(foster):
+    """
+    Score that does not depend on the animal, with its reasons split into
+    those listed before and after the animal-specific ones.
+    """
+    score = 0
+    leading = []
+    reasons = []
+
+    # Availability & Capacity (20 points)
+    if foster.current_capacity < foster.max_capacity:
+        score += 20
+        leading.append("Has available capacity")
+
+    # Experience level (15 points)
+    if foster.experience_level == "advanced":
+        score += 15
+        reasons.append("Advanced experience level")
+    elif foster.experience_level == "intermediate":
+        score += 10
+        reasons.append("Intermediate experience level")
+
+    # Track record (20 points)
+    if foster.total_fosters > 0:
+        success_rate = foster.successful_adoptions / foster.total_fosters
+        if success_rate > 0.8:
+            score += 20
+            reasons.append("Excellent success rate")
+        elif success_rate > 0.5:
+            score += 10
+            reasons.append("Good success rate")
+
+    # Rating (15 points)
+    if foster.rating and foster.rating >= 4.5:
+        score += 15
+        reasons.append("High rating (4.5+)")
+    elif foster.rating and foster.rating >= 4.0:
+        score += 10
+        reasons.append("Good rating (4.0+)")
+
+    # Workload balancing (15 points)
+    if foster.current_capacity == 0:
+        score += 15
+        reasons.append("No current fosters")
+    elif foster.current_capacity < foster.max_capacity / 2:
+        score += 10
+        reasons.append("Low current workload")
+
+    return score, leading, reasons
+
+
+def _pair_bonus(animal, species, foster):
+    """Points for this animal and foster together, plus their reasons."""
+    score = 0
+    reasons = []
+
+    # Species preference (30 points)
+    if foster.preferred_species and species in foster.preferred_species.lower():
+        score += SPECIES_POINTS
+        reasons.append("Species preference match")
+
+    # Medical needs (25 points)
+    if animal.medical_notes and foster.can_handle_medical:
+        score += MEDICAL_POINTS
+        reasons.append("Can handle medical needs")
+
+    # Behavioral needs (25 points)
+    if animal.behavioral_notes and foster.can_handle_behavioral:
+        score += BEHAVIORAL_POINTS
+        reasons.append("Can handle behavioral needs")
+
+    return score, reasons
+
+
+def _parse_cursor(cursor: str):
+    try:
+        score, animal_id, foster_id = (int(part) for part in cursor.split("."))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return (-score, animal_id, foster_id)
+
+
 @router.get("/matches", response_model=List[schemas.FosterMatch])
 def get_suggested_matches(
+    response: Response,
     animal_id: Optional[int] = None,
+    per_animal: int = Query(3, ge=1, le=50, description="Best fosters kept per animal"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_active_user)
 ):
-    """Get suggested foster matches using the matching algorithm"""
+    """
+    Get suggested foster matches using the matching algorithm.
+
+    Each animal keeps its ``per_animal`` best fosters scoring at least the
+    threshold. Matches are ordered by score (then animal and foster id) and
+    paged with ``limit``; the ``X-Next-Cursor`` response header, when
+    present, fetches the next page.
+    """
     # Get animals that need foster care
     animals_query = db.query(models.Animal).filter(
         models.Animal.org_id == current_user.org_id,
@@ -114,90 +216,71 @@ def get_suggested_matches(
     if animal_id:
         animals_query = animals_query.filter(models.Animal.id == animal_id)
 
-    animals = animals_query.all()
+    animals = animals_query.order_by(models.Animal.id).all()
 
     # Get available foster profiles
-    fosters = db.query(models.FosterProfile).join(models.User).filter(
+    fosters = db.query(models.FosterProfile).join(models.User).options(
+        contains_eager(models.FosterProfile.user)
+    ).filter(
         models.FosterProfile.org_id == current_user.org_id,
         models.FosterProfile.is_available == True,
         models.FosterProfile.current_capacity < models.FosterProfile.max_capacity
-    ).all()
+    ).order_by(models.FosterProfile.id).all()
 
-    matches = []
+    # Animal-independent part once per foster, best first so the scan can stop early
+    bases = [_foster_base(foster)[0] for foster in fosters]
+    order = sorted(range(len(fosters)), key=lambda j: (-bases[j], j))
 
+    candidates = []
     for animal in animals:
-        for foster in fosters:
-            score = 0
-            reasons = []
-
-            # Availability & Capacity (20 points)
-            if foster.current_capacity < foster.max_capacity:
-                score += 20
-                reasons.append("Has available capacity")
-
-            # Species preference (30 points)
-            if foster.preferred_species and animal.species.lower() in foster.preferred_species.lower():
-                score += 30
-                reasons.append("Species preference match")
-
-            # Medical needs (25 points)
-            if animal.medical_notes and foster.can_handle_medical:
-                score += 25
-                reasons.append("Can handle medical needs")
-
-            # Behavioral needs (25 points)
-            if animal.behavioral_notes and foster.can_handle_behavioral:
-                score += 25
-                reasons.append("Can handle behavioral needs")
-
-            # Experience level (15 points)
-            if foster.experience_level == "advanced":
-                score += 15
-                reasons.append("Advanced experience level")
-            elif foster.experience_level == "intermediate":
-                score += 10
-                reasons.append("Intermediate experience level")
-
-            # Track record (20 points)
-            if foster.total_fosters > 0:
-                success_rate = foster.successful_adoptions / foster.total_fosters
-                if success_rate > 0.8:
-                    score += 20
-                    reasons.append("Excellent success rate")
-                elif success_rate > 0.5:
-                    score += 10
-                    reasons.append("Good success rate")
-
-            # Rating (15 points)
-            if foster.rating and foster.rating >= 4.5:
-                score += 15
-                reasons.append("High rating (4.5+)")
-            elif foster.rating and foster.rating >= 4.0:
-                score += 10
-                reasons.append("Good rating (4.0+)")
-
-            # Workload balancing (15 points)
-            if foster.current_capacity == 0:
-                score += 15
-                reasons.append("No current fosters")
-            elif foster.current_capacity < foster.max_capacity / 2:
-                score += 10
-                reasons.append("Low current workload")
-
-            if score >= 20:  # Minimum threshold
-                match = schemas.FosterMatch(
-                    animal_id=animal.id,
-                    animal_name=animal.name,
-                    foster_profile_id=foster.id,
-                    foster_name=foster.user.full_name,
-                    foster_email=foster.user.email,
-                    score=score,
-                    reasons=reasons
-                )
-                matches.append(match)
-
-    # Sort by score descending
-    matches.sort(key=lambda x: x.score, reverse=True)
+        species = animal.species.lower()
+        best_bonus = SPECIES_POINTS
+        if animal.medical_notes:
+            best_bonus += MEDICAL_POINTS
+        if animal.behavioral_notes:
+            best_bonus += BEHAVIORAL_POINTS
+
+        # Min-heap of (score, -foster index): the root is the weakest kept match
+        kept = []
+        for j in order:
+            ceiling = bases[j] + best_bonus
+            if ceiling < MATCH_THRESHOLD or (len(kept) == per_animal and ceiling < kept[0][0]):
+                break
+            score = bases[j] + _pair_bonus(animal, species, fosters[j])[0]
+            if score < MATCH_THRESHOLD:
+                continue
+            if len(kept) < per_animal:
+                heapq.heappush(kept, (score, -j))
+            elif (score, -j) > kept[0]:
+                heapq.heapreplace(kept, (score, -j))
+        for score, negative_index in kept:
+            j = -negative_index
+            candidates.append((-score, animal.id, fosters[j].id, animal, j))
+
+    # Highest score first; ties in animal, then foster, order
+    candidates.sort(key=lambda c: c[:3])
+    if cursor:
+        after = _parse_cursor(cursor)
+        candidates = [c for c in candidates if c[:3] > after]
+    page = candidates[:limit]
+    if len(candidates) > limit:
+        last = page[-1]
+        response.headers[NEXT_CURSOR_HEADER] = f"{-last[0]}.{last[1]}.{last[2]}"
+
+    matches = []
+    for negative_score, _, _, animal, j in page:
+        foster = fosters[j]
+        _, leading, trailing = _foster_base(foster)
+        pair_reasons = _pair_bonus(animal, animal.species.lower(), foster)[1]
+        matches.append(schemas.FosterMatch(
+            animal_id=animal.id,
+            animal_name=animal.name,
+            foster_profile_id=foster.id,
+            foster_name=foster.user.full_name,
+            foster_email=foster.user.email,
+            score=-negative_score,
+            reasons=leading + pair_reasons + trailing
+        ))
 
     return matches
 